@@ -5,9 +5,11 @@ import subprocess
 import tempfile
 import shutil
 import threading
+import concurrent.futures
 import csv
 import traceback
 import requests
+import numpy as np
 from packaging import version
 from functools import partial
 from datetime import datetime
@@ -16,7 +18,13 @@ from PyQt5.QtCore import QObject, pyqtSignal
 import xml.etree.ElementTree as ET
 import xml.dom.minidom as minidom
 import struct
-from collections import namedtuple
+import mmap
+import zlib
+import sqlite3
+import hashlib
+import time
+import math
+from collections import namedtuple, OrderedDict
 
 CuePoint = namedtuple('CuePoint', ['id', 'position', 'chunk_id', 'chunk_start', 'block_start', 'sample_offset'])
 Label = namedtuple('Label', ['id', 'text'])
@@ -27,9 +35,11 @@ if sys.platform == "win32":
     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
     startupinfo.wShowWindow = subprocess.SW_HIDE
     CREATE_NO_WINDOW = 0x08000000
+    BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
 else:
     startupinfo = None
     CREATE_NO_WINDOW = 0
+    BELOW_NORMAL_PRIORITY_CLASS = 0
 current_version = "v0.5.9-beta"
 
 TRANSLATIONS = {
@@ -49,6 +59,8 @@ TRANSLATIONS = {
         "find_replace": "Find && Replace...",
         "compile_mod": "Compile Mod",
         "deploy_and_run": "Deploy Mod && Run Game",
+        "refresh_mod_files": "Rescan Mod Files",
+        "mod_files_refreshed": "Mod files rescanned",
         "show_debug": "Show Debug Console",
         "settings": "Settings...",
         "about": "About",
@@ -66,6 +78,8 @@ TRANSLATIONS = {
         "id_asc": "ID ↑",
         "id_desc": "ID ↓",
         "recent_first": "Recent First",
+        "duration_desc": "Duration ↓",
+        "size_desc": "Size ↓",
         
         # === ОСНОВНЫЕ СЛОВА ===
         "name": "Name",
@@ -278,6 +292,18 @@ TRANSLATIONS = {
         "theme": "Theme:",
         "subtitle_language": "Subtitle Language:",
         "game_path": "Game Path:",
+        "audio_cache_size": "Decoded audio cache:",
+        "audio_cache_size_desc": "Disk space for decoded WAVs kept for instant replay (0 disables the cache)",
+        "prefetch_count": "Prefetch neighbouring entries:",
+        "prefetch_count_desc": "Decode this many entries above and below the selection in the background (0 disables)",
+        "export_workers": "Parallel WAV exports:",
+        "conversion_workers": "Parallel WEM conversions:",
+        "batch_conversion": "Convert files together in one WwiseCLI run (strict mode)",
+        "batch_conversion_desc": "Each quality search round converts every pending file in a single WwiseCLI launch instead of one launch per file",
+        "parallel_probes": "Quality probes per file:",
+        "parallel_probes_desc": "Conversion values tried at once for a single file. Auto uses the workers left over when there are fewer files than workers",
+        "conversion_cache_size": "WEM conversion cache:",
+        "conversion_cache_size_desc": "Disk space for converted WEMs reused when the same WAV is converted again (0 disables the cache)",
         "wem_process_language": "WEM Process Language:",
         "light": "Light",
         "dark": "Dark",
@@ -392,6 +418,8 @@ TRANSLATIONS = {
         "find_replace": "Найти и заменить...",
         "compile_mod": "Скомпилировать мод",
         "deploy_and_run": "Установить мод и запустить игру",
+        "refresh_mod_files": "Пересканировать файлы мода",
+        "mod_files_refreshed": "Файлы мода пересканированы",
         "show_debug": "Показать консоль отладки",
         "settings": "Настройки...",
         "about": "О программе",
@@ -409,6 +437,8 @@ TRANSLATIONS = {
         "id_asc": "ID ↑",
         "id_desc": "ID ↓",
         "recent_first": "Сначала новые",
+        "duration_desc": "Длительность ↓",
+        "size_desc": "Размер ↓",
         
         # === ОСНОВНЫЕ СЛОВА ===
         "name": "Имя",
@@ -621,6 +651,18 @@ TRANSLATIONS = {
         "theme": "Тема:",
         "subtitle_language": "Язык субтитров:",
         "game_path": "Путь к игре:",
+        "audio_cache_size": "Кэш декодированного аудио:",
+        "audio_cache_size_desc": "Место на диске для декодированных WAV для мгновенного повтора (0 отключает кэш)",
+        "prefetch_count": "Предзагрузка соседних записей:",
+        "prefetch_count_desc": "Сколько записей выше и ниже выбранной декодировать в фоне (0 отключает)",
+        "export_workers": "Параллельный экспорт WAV:",
+        "conversion_workers": "Параллельная конвертация WEM:",
+        "batch_conversion": "Конвертировать файлы вместе за один запуск WwiseCLI (строгий режим)",
+        "batch_conversion_desc": "Каждый раунд подбора качества конвертирует все ожидающие файлы одним запуском WwiseCLI вместо запуска на каждый файл",
+        "parallel_probes": "Проб качества на файл:",
+        "parallel_probes_desc": "Сколько значений Conversion пробовать одновременно для одного файла. Авто использует свободные потоки, когда файлов меньше, чем потоков",
+        "conversion_cache_size": "Кэш конвертации WEM:",
+        "conversion_cache_size_desc": "Место на диске для сконвертированных WEM, повторно используемых при конвертации того же WAV (0 отключает кэш)",
         "wem_process_language": "Язык обработки WEM:",
         "light": "Светлая",
         "dark": "Тёмная",
@@ -730,6 +772,8 @@ TRANSLATIONS = {
         "find_replace": "Znajdź i zamień...",
         "compile_mod": "Kompiluj mod",
         "deploy_and_run": "Wdróż mod i uruchom grę",
+        "refresh_mod_files": "Przeskanuj pliki moda",
+        "mod_files_refreshed": "Pliki moda przeskanowane",
         "show_debug": "Pokaż konsolę debugowania",
         "settings": "Ustawienia...",
         "about": "O programie",
@@ -747,6 +791,8 @@ TRANSLATIONS = {
         "id_asc": "ID ↑",
         "id_desc": "ID ↓",
         "recent_first": "Najnowsze pierwsze",
+        "duration_desc": "Długość ↓",
+        "size_desc": "Rozmiar ↓",
         
         # === PODSTAWOWE SŁOWA ===
         "name": "Nazwa",
@@ -960,6 +1006,18 @@ TRANSLATIONS = {
         "theme": "Motyw:",
         "subtitle_language": "Język napisów:",
         "game_path": "Ścieżka gry:",
+        "audio_cache_size": "Pamięć podręczna audio:",
+        "audio_cache_size_desc": "Miejsce na dysku na zdekodowane pliki WAV do natychmiastowego odtwarzania (0 wyłącza)",
+        "prefetch_count": "Wstępne dekodowanie sąsiednich wpisów:",
+        "prefetch_count_desc": "Ile wpisów powyżej i poniżej zaznaczenia dekodować w tle (0 wyłącza)",
+        "export_workers": "Równoległy eksport WAV:",
+        "conversion_workers": "Równoległa konwersja WEM:",
+        "batch_conversion": "Konwertuj pliki razem w jednym uruchomieniu WwiseCLI (tryb ścisły)",
+        "batch_conversion_desc": "Każda runda doboru jakości konwertuje wszystkie oczekujące pliki jednym uruchomieniem WwiseCLI zamiast osobno dla każdego pliku",
+        "parallel_probes": "Próby jakości na plik:",
+        "parallel_probes_desc": "Ile wartości Conversion próbować jednocześnie dla jednego pliku. Auto używa wolnych wątków, gdy plików jest mniej niż wątków",
+        "conversion_cache_size": "Pamięć podręczna konwersji WEM:",
+        "conversion_cache_size_desc": "Miejsce na dysku na skonwertowane pliki WEM używane ponownie przy konwersji tego samego WAV (0 wyłącza)",
         "wem_process_language": "Język przetwarzania WEM:",
         "light": "Jasny",
         "dark": "Ciemny",
@@ -1136,12 +1194,42 @@ class ModernButton(QtWidgets.QPushButton):
         self.setCursor(QtCore.Qt.PointingHandCursor)
         self.setMinimumHeight(36)
 class WEMAnalyzer:
-    def __init__(self, filename):
+    FORMAT_PCM = 0x0001
+    FORMAT_IMA_ADPCM = 0x0002
+    FORMAT_EXTENSIBLE = 0xFFFE
+    FORMAT_VORBIS = 0xFFFF
+
+    FORMAT_NAMES = {
+        FORMAT_PCM: "PCM",
+        FORMAT_IMA_ADPCM: "Wwise IMA ADPCM",
+        FORMAT_EXTENSIBLE: "PCM",
+        FORMAT_VORBIS: "Wwise Vorbis",
+        0x0165: "XMA",
+        0x0166: "XMA2",
+        0x3039: "Wwise Opus",
+        0x3040: "Wwise Opus",
+        0x8311: "Wwise PTADPCM",
+    }
+
+    def __init__(self, filename, verbose=True):
         self.filename = filename
+        self.verbose = verbose
         self.sample_rate = 0
         self.channels = 0
+        self.audio_format = 0
+        self.block_align = 0
+        self.bits_per_sample = 0
+        self.fmt_extra = b""
+        self.vorb_data = b""
+        self.data_size = 0
+        self.file_size = 0
+        self.total_samples = 0
         self.cue_points = []
         self.labels = {}
+
+    def log(self, message, level="INFO"):
+        if self.verbose or level == "ERROR":
+            DEBUG.log(message, level)
         
     def read_chunk_header(self, file):
   
@@ -1159,13 +1247,17 @@ class WEMAnalyzer:
             return
             
         audio_format = struct.unpack('<H', fmt_data[0:2])[0]
+        self.audio_format = audio_format
         self.channels = struct.unpack('<H', fmt_data[2:4])[0]
         self.sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
+        if len(fmt_data) >= 16:
+            self.block_align, self.bits_per_sample = struct.unpack('<HH', fmt_data[12:16])
+        self.fmt_extra = fmt_data[0x18:]
         
 
-        DEBUG.log(f"Audio format: 0x{audio_format:04X}")
-        DEBUG.log(f"Channels: {self.channels}")
-        DEBUG.log(f"Sample rate: {self.sample_rate} Hz")
+        self.log(f"Audio format: 0x{audio_format:04X}")
+        self.log(f"Channels: {self.channels}")
+        self.log(f"Sample rate: {self.sample_rate} Hz")
     def parse_cue_chunk(self, file, size):
         
         cue_data = file.read(size)
@@ -1219,10 +1311,10 @@ class WEMAnalyzer:
                         
                         if label_text:
                             self.labels[cue_id] = label_text
-                            DEBUG.log(f"Found label ID {cue_id}: '{label_text}'")
+                            self.log(f"Found label ID {cue_id}: '{label_text}'")
                             
                     except Exception as e:
-                        DEBUG.log(f"Error decoding label for cue {cue_id}: {e}", "ERROR")
+                        self.log(f"Error decoding label for cue {cue_id}: {e}", "ERROR")
                 
               
                 offset += 8 + sub_chunk_size
@@ -1234,17 +1326,18 @@ class WEMAnalyzer:
             with open(self.filename, 'rb') as f:
                 riff_id = f.read(4)
                 if riff_id != b'RIFF':
-                    DEBUG.log(f"Not a RIFF file: {self.filename}", "ERROR")
+                    self.log(f"Not a RIFF file: {self.filename}", "ERROR")
                     return False
                 
                 file_size = struct.unpack('<I', f.read(4))[0]
                 wave_id = f.read(4)
                 
                 if wave_id != b'WAVE':
-                    DEBUG.log(f"Not a WAVE file: {self.filename}", "ERROR")
+                    self.log(f"Not a WAVE file: {self.filename}", "ERROR")
                     return False
                 
-                DEBUG.log(f"Analyzing WEM file: {os.path.basename(self.filename)} (size: {file_size + 8} bytes)")
+                self.file_size = os.fstat(f.fileno()).st_size
+                self.log(f"Analyzing WEM file: {os.path.basename(self.filename)} (size: {file_size + 8} bytes)")
                 
                 while f.tell() < file_size + 8:
                     chunk_id, chunk_size = self.read_chunk_header(f)
@@ -1259,30 +1352,83 @@ class WEMAnalyzer:
                         self.parse_cue_chunk(f, chunk_size)
                     elif chunk_id == 'LIST':
                         self.parse_list_chunk(f, chunk_size)
+                    elif chunk_id == 'vorb':
+                        self.vorb_data = f.read(chunk_size)
+                    elif chunk_id == 'data':
+                        self.data_size = chunk_size
+                        f.seek(current_pos + chunk_size)
                     else:
                         f.seek(current_pos + chunk_size)
                     
                     if chunk_size % 2 == 1:
                         f.read(1)
                 
+                self.total_samples = self.count_samples()
            
-                DEBUG.log(f"Final analysis result:")
-                DEBUG.log(f"  Sample rate: {self.sample_rate} Hz")
-                DEBUG.log(f"  Channels: {self.channels}")
-                DEBUG.log(f"  Cue points: {len(self.cue_points)}")
-                DEBUG.log(f"  Labels: {len(self.labels)}")
+                self.log(f"Final analysis result:")
+                self.log(f"  Sample rate: {self.sample_rate} Hz")
+                self.log(f"  Channels: {self.channels}")
+                self.log(f"  Total samples: {self.total_samples}")
+                self.log(f"  Cue points: {len(self.cue_points)}")
+                self.log(f"  Labels: {len(self.labels)}")
                 
           
                 for cue in self.cue_points:
                     if self.sample_rate > 0:
                         calc_time = cue.position / self.sample_rate
-                        DEBUG.log(f"  Cue {cue.id}: {cue.position} samples = {calc_time:.3f} seconds")
+                        self.log(f"  Cue {cue.id}: {cue.position} samples = {calc_time:.3f} seconds")
                 
                 return True
                 
         except Exception as e:
-            DEBUG.log(f"Error analyzing WEM file {self.filename}: {e}", "ERROR")
+            self.log(f"Error analyzing WEM file {self.filename}: {e}", "ERROR")
             return False
+    def count_samples(self):
+        """Sample count from the fmt extension (Vorbis) or the data size (PCM, IMA ADPCM); 0 if unknown"""
+        if self.channels <= 0:
+            return 0
+
+        if self.audio_format == self.FORMAT_VORBIS:
+            # Older Wwise keeps the setup in a separate 'vorb' chunk, newer versions append it to fmt
+            vorb = self.vorb_data or self.fmt_extra
+            if len(vorb) >= 4:
+                return max(struct.unpack('<i', vorb[0:4])[0], 0)
+            return 0
+
+        if self.audio_format in (self.FORMAT_PCM, self.FORMAT_EXTENSIBLE):
+            frame_size = self.channels * (self.bits_per_sample // 8)
+            return self.data_size // frame_size if frame_size > 0 else 0
+
+        if self.audio_format == self.FORMAT_IMA_ADPCM:
+            # Each channel block is a 4-byte header followed by 4-bit samples
+            if self.block_align <= 0:
+                return 0
+            block_per_channel = self.block_align // self.channels
+            samples_per_block = (block_per_channel - 4) * 2
+            full_blocks, remainder = divmod(self.data_size, self.block_align)
+            samples = full_blocks * samples_per_block
+            if remainder:
+                samples += max((remainder // self.channels - 4) * 2, 0)
+            return samples
+
+        return 0
+
+    def get_audio_info(self):
+        """Audio info in the get_wem_audio_info format, or None if the header does not give a sample count"""
+        if self.sample_rate <= 0 or self.total_samples <= 0:
+            return None
+
+        duration_ms = int((self.total_samples / self.sample_rate) * 1000)
+        bitrate = int((self.file_size * 8) / (duration_ms / 1000)) if duration_ms > 0 else 0
+        return {
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'samples': self.total_samples,
+            'duration_ms': duration_ms,
+            'bitrate': bitrate,
+            'format': self.FORMAT_NAMES.get(self.audio_format, f"0x{self.audio_format:04X}")
+        }
+
     def get_markers_info(self):
      
         markers = []
@@ -1312,6 +1458,198 @@ class WEMAnalyzer:
             DEBUG.log(f"Marker {cue.id}: pos={cue.position} samples, time={time_seconds:.3f}s, label='{label}'")
         
         return markers
+class WemMetadataIndex:
+    """Header metadata of original and mod WEM files, persisted in SQLite and refreshed by size and mtime"""
+
+    SCHEMA_VERSION = 1
+    FIELDS = ("path", "source", "folder", "id", "size", "mtime_ns",
+              "sample_rate", "channels", "samples", "duration_ms", "codec", "cue_count")
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+        self.rows = {}
+        self.by_id = {}
+        self.by_folder = {}
+        self.scanned = set()
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS wem")
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS wem (
+                    path TEXT PRIMARY KEY,
+                    source TEXT,
+                    folder TEXT,
+                    id TEXT,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    sample_rate INTEGER,
+                    channels INTEGER,
+                    samples INTEGER,
+                    duration_ms INTEGER,
+                    codec TEXT,
+                    cue_count INTEGER
+                )
+            """)
+            self.conn.commit()
+            for values in self.conn.execute(f"SELECT {', '.join(self.FIELDS)} FROM wem"):
+                row = dict(zip(self.FIELDS, values))
+                self.rows[row['path']] = row
+            self._rebuild_lookups()
+            DEBUG.log(f"WEM index opened: {db_path} ({len(self.rows)} files)")
+        except Exception as e:
+            DEBUG.log(f"WEM index not persisted ({db_path}): {e}", "WARNING")
+            self.conn = None
+
+    @staticmethod
+    def _normalize(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def _rebuild_lookups(self):
+        by_id = {}
+        by_folder = {}
+        for row in self.rows.values():
+            by_id.setdefault((row['source'], row['id']), {})[row['folder']] = row
+            by_folder.setdefault((row['source'], row['folder']), {})[row['id']] = row
+        self.by_id = by_id
+        self.by_folder = by_folder
+
+    @staticmethod
+    def scan_folder(root, root_folder=None):
+        """Yield (path, folder, id, size, mtime_ns) for every .wem under root using os.scandir"""
+        pending = [root]
+        while pending:
+            folder = pending.pop()
+            if folder == root and root_folder:
+                folder_name = root_folder
+            else:
+                folder_name = os.path.basename(folder)
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif entry.name.lower().endswith(".wem"):
+                            stat = entry.stat()
+                            yield entry.path, folder_name, entry.name[:-4], stat.st_size, stat.st_mtime_ns
+            except OSError:
+                continue
+
+    @staticmethod
+    def read_metadata(path):
+        analyzer = WEMAnalyzer(path, verbose=False)
+        if not analyzer.analyze():
+            return {'sample_rate': 0, 'channels': 0, 'samples': 0, 'duration_ms': 0, 'codec': "", 'cue_count': 0}
+        info = analyzer.get_audio_info()
+        return {
+            'sample_rate': analyzer.sample_rate,
+            'channels': analyzer.channels,
+            'samples': analyzer.total_samples,
+            'duration_ms': info['duration_ms'] if info else 0,
+            'codec': analyzer.FORMAT_NAMES.get(analyzer.audio_format, f"0x{analyzer.audio_format:04X}"),
+            'cue_count': len(analyzer.cue_points)
+        }
+
+    def update(self, source, root, root_folder=None, should_stop=None, progress=None):
+        """Rescan a folder tree, re-reading headers of new or changed files only; returns the number of files read"""
+        with self.lock:
+            existing = {path: row for path, row in self.rows.items() if row['source'] == source}
+
+        changed = []
+        seen = set()
+        for path, folder, id_, size, mtime_ns in self.scan_folder(root, root_folder):
+            key = self._normalize(path)
+            seen.add(key)
+            row = existing.get(key)
+            if row is None or row['size'] != size or row['mtime_ns'] != mtime_ns or row['folder'] != folder:
+                changed.append((key, folder, id_, size, mtime_ns))
+
+        new_rows = []
+        stopped = False
+        for i, (key, folder, id_, size, mtime_ns) in enumerate(changed):
+            if should_stop and should_stop():
+                stopped = True
+                break
+            row = {'path': key, 'source': source, 'folder': folder, 'id': id_, 'size': size, 'mtime_ns': mtime_ns}
+            row.update(self.read_metadata(key))
+            new_rows.append(row)
+            if progress and i % 200 == 0:
+                progress(i, len(changed))
+
+        removed = [] if stopped else [key for key in existing if key not in seen]
+
+        with self.lock:
+            for key in removed:
+                self.rows.pop(key, None)
+            for row in new_rows:
+                self.rows[row['path']] = row
+            self._rebuild_lookups()
+            if not stopped:
+                self.scanned.add(source)
+            if self.conn is not None and (new_rows or removed):
+                try:
+                    self.conn.executemany("DELETE FROM wem WHERE path = ?", [(key,) for key in removed])
+                    self.conn.executemany(
+                        f"INSERT OR REPLACE INTO wem ({', '.join(self.FIELDS)}) VALUES ({', '.join('?' * len(self.FIELDS))})",
+                        [tuple(row[field] for field in self.FIELDS) for row in new_rows]
+                    )
+                    self.conn.commit()
+                except Exception as e:
+                    DEBUG.log(f"WEM index write failed: {e}", "WARNING")
+
+        DEBUG.log(f"WEM index ({source}): {len(seen)} files, {len(new_rows)} read, {len(removed)} removed")
+        return len(new_rows)
+
+    def get(self, source, folder, id_):
+        return self.by_id.get((source, str(id_)), {}).get(folder)
+
+    def folders_for(self, source, id_):
+        """{folder: row} for every indexed copy of an id"""
+        return self.by_id.get((source, str(id_)), {})
+
+    def language_rows(self, source, folder):
+        """{id: row} for one folder, e.g. the originals of a language tab"""
+        return self.by_folder.get((source, folder), {})
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+            self.conn = None
+
+class WemIndexerThread(QtCore.QThread):
+    """Refreshes WemMetadataIndex for a list of (source, root, root_folder) folders in the background"""
+
+    statusUpdate = QtCore.pyqtSignal(str)
+    indexUpdated = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent, wem_index, folders):
+        super().__init__(parent)
+        self.wem_index = wem_index
+        self.folders = folders
+        self._should_stop = False
+
+    def stop(self):
+        self._should_stop = True
+
+    def run(self):
+        total = 0
+        try:
+            for source, root, root_folder in self.folders:
+                if self._should_stop:
+                    break
+                total += self.wem_index.update(
+                    source, root, root_folder,
+                    should_stop=lambda: self._should_stop,
+                    progress=lambda done, count: self.statusUpdate.emit(f"Indexing WEM files: {done}/{count}")
+                )
+        except Exception as e:
+            DEBUG.log(f"WEM indexer error: {e}", "ERROR")
+        self.indexUpdated.emit(total)
+
 class SearchBar(QtWidgets.QWidget):
     searchChanged = QtCore.pyqtSignal(str)
     
@@ -1371,36 +1709,141 @@ class ProgressDialog(QtWidgets.QDialog):
     def append_details(self, text):
         self.details.append(text)
 
+    def add_cancel_button(self, callback):
+        """Show a Cancel button; Escape and closing the dialog call callback too"""
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(callback)
+        self.rejected.connect(callback)
+        self.layout().addWidget(self.cancel_btn, alignment=QtCore.Qt.AlignRight)
+
+class WavExportThread(QtCore.QThread):
+    """Converts (name, wem_path, wav_path) jobs to WAV on a worker pool, skipping outputs that are up to date"""
+
+    fileFinished = QtCore.pyqtSignal(int, str, str, str)
+    exportFinished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, parent, jobs, decoder, audio_cache=None, max_workers=0):
+        super().__init__(parent)
+        self.jobs = jobs
+        self.decoder = decoder
+        self.audio_cache = audio_cache
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self._should_stop = False
+
+    def stop(self):
+        self._should_stop = True
+
+    @staticmethod
+    def is_up_to_date(wem_path, wav_path):
+        try:
+            return os.path.getmtime(wav_path) >= os.path.getmtime(wem_path) and os.path.getsize(wav_path) > 0
+        except OSError:
+            return False
+
+    def export_one(self, name, wem_path, wav_path):
+        """Return (status, message) with status 'ok', 'skipped' or 'failed'"""
+        if self._should_stop:
+            return "cancelled", ""
+        if not os.path.exists(wem_path):
+            return "failed", "File not found"
+        if self.is_up_to_date(wem_path, wav_path):
+            return "skipped", "Up to date"
+
+        partial_path = os.path.splitext(wav_path)[0] + ".partial.wav"
+        try:
+            cached = self.audio_cache.get(wem_path) if self.audio_cache else None
+            if cached:
+                shutil.copyfile(cached, partial_path)
+                ok, error = True, ""
+            else:
+                ok, error = self.decoder(wem_path, partial_path)
+            if ok:
+                os.replace(partial_path, wav_path)
+                return "ok", ""
+            return "failed", error
+        finally:
+            if os.path.exists(partial_path):
+                try:
+                    os.remove(partial_path)
+                except OSError:
+                    pass
+
+    def run(self):
+        results = {"ok": 0, "skipped": 0, "failed": 0, "cancelled": 0, "errors": []}
+        max_workers = max(1, min(len(self.jobs), self.max_workers))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {executor.submit(self.export_one, *job): job for job in self.jobs}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                name = futures[future][0]
+                try:
+                    status, message = future.result()
+                except concurrent.futures.CancelledError:
+                    status, message = "cancelled", ""
+                except Exception as e:
+                    status, message = "failed", str(e)
+                results[status] += 1
+                if status == "failed":
+                    results["errors"].append(f"{name}: {message}")
+                self.fileFinished.emit(done, name, status, message)
+                if self._should_stop:
+                    for pending in futures:
+                        pending.cancel()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self.exportFinished.emit(results)
+
 class SubtitleLoaderThread(QtCore.QThread):
 
+    MAX_WORKERS = 8
+
     dataLoaded = QtCore.pyqtSignal(dict) 
     statusUpdate = QtCore.pyqtSignal(str) 
     progressUpdate = QtCore.pyqtSignal(int) 
     
-    def __init__(self, parent, all_subtitle_files, locres_manager, subtitles, original_subtitles, 
-                 selected_lang, selected_category, orphaned_only, modified_only, with_audio_only, 
-                 search_text, audio_keys_cache, modified_subtitles):
+    def __init__(self, parent, all_subtitle_files, subtitle_store, selected_lang, selected_category):
         super().__init__(parent)
         self.all_subtitle_files = all_subtitle_files
-        self.locres_manager = locres_manager
-        self.subtitles = subtitles
-        self.original_subtitles = original_subtitles
+        self.subtitle_store = subtitle_store
         self.selected_lang = selected_lang
         self.selected_category = selected_category
-        self.orphaned_only = orphaned_only
-        self.modified_only = modified_only
-        self.with_audio_only = with_audio_only
-        self.search_text = search_text.lower().strip()
-        self.audio_keys_cache = audio_keys_cache
-        self.modified_subtitles = modified_subtitles
         self._should_stop = False
         
     def stop(self):
         self._should_stop = True
+    def load_files_parallel(self, relevant_files):
+        """Read all relevant files on a bounded thread pool; returns {index: subtitles} or None if stopped"""
+        total_files = len(relevant_files)
+        max_workers = max(1, min(total_files, os.cpu_count() or 4, self.MAX_WORKERS))
+        results = {}
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self.subtitle_store.load_file, file_key): i
+                for i, (file_key, _) in enumerate(relevant_files)
+            }
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                if self._should_stop:
+                    return None
+
+                i = futures[future]
+                file_info = relevant_files[i][1]
+                try:
+                    results[i] = future.result()[0]
+                except Exception as e:
+                    DEBUG.log(f"Error loading subtitles from {file_info['path']}: {e}", "ERROR")
+
+                self.progressUpdate.emit(int((done / total_files) * 90))
+                self.statusUpdate.emit(f"Processed {file_info['filename']} ({done}/{total_files})")
+        finally:
+            executor.shutdown(wait=not self._should_stop, cancel_futures=True)
+
+        return results
     def run(self):
+        """Load unfiltered rows for the selected language/category; filtering happens in filter_rows"""
         try:
-            subtitles_to_show = {}
-            files_processed = 0
+            base_rows = {}
 
             relevant_files = []
             for key, file_info in self.all_subtitle_files.items():
@@ -1414,132 +1857,687 @@ class SubtitleLoaderThread(QtCore.QThread):
                 if lang_match and category_match:
                     relevant_files.append((key, file_info))
             
-            total_files = len(relevant_files)
-            
-            if total_files == 0:
+            if not relevant_files:
                 self.dataLoaded.emit({})
                 return
 
+            loaded_files = self.load_files_parallel(relevant_files)
+            if loaded_files is None:
+                return
+
             for i, (key, file_info) in enumerate(relevant_files):
                 if self._should_stop:
                     return
-                    
-                progress = int((i / total_files) * 70) 
-                self.progressUpdate.emit(progress)
-                self.statusUpdate.emit(f"Processing {file_info['filename']}...")
-                
-                try:
-                    file_subtitles = self.locres_manager.export_locres(file_info['path'])
-                    files_processed += 1
-                    
-                    for sub_key, sub_value in file_subtitles.items():
-                        if self._should_stop:
-                            return
 
-                        has_audio = sub_key in self.audio_keys_cache if self.audio_keys_cache else False
-                        
-                        if self.orphaned_only and has_audio:
-                            continue
-                        
-                        if self.with_audio_only and not has_audio:
-                            continue
-
-                        current_text = self.subtitles.get(sub_key, sub_value)
-                        is_modified = sub_key in self.modified_subtitles
-                        
-                        if self.modified_only and not is_modified:
-                            continue
-
-                        if self.search_text:
-                            if (self.search_text not in sub_key.lower() and 
-                                self.search_text not in sub_value.lower() and
-                                self.search_text not in current_text.lower()):
-                                continue
-                        
-                        subtitles_to_show[sub_key] = {
-                            'original': sub_value,
-                            'current': current_text,
-                            'file_info': file_info,
-                            'has_audio': has_audio,
-                            'is_modified': is_modified
-                        }
-                        
-                except Exception as e:
-                    DEBUG.log(f"Error loading subtitles from {file_info['path']}: {e}", "ERROR")
-            
-            self.progressUpdate.emit(80)
-            self.statusUpdate.emit("Processing additional subtitles...")
+                file_subtitles = loaded_files.get(i)
+                if file_subtitles is None:
+                    continue
 
-      
-            for sub_key, sub_value in self.subtitles.items():
-                if self._should_stop:
-                    return
-                    
-                if sub_key not in subtitles_to_show:
-                    has_audio = sub_key in self.audio_keys_cache if self.audio_keys_cache else False
-                    
-                    if self.orphaned_only and has_audio:
-                        continue
-                    
-                    if self.with_audio_only and not has_audio:
-                        continue
-                    
-                    is_modified = sub_key in self.modified_subtitles
-                    
-                    if self.modified_only and not is_modified:
-                        continue
-                    
-                    if self.search_text:
-                        original_text = self.original_subtitles.get(sub_key, "")
-                        if (self.search_text not in sub_key.lower() and 
-                            self.search_text not in sub_value.lower() and
-                            self.search_text not in original_text.lower()):
-                            continue
-                    
-                    if self.selected_category != "All Categories" or self.selected_lang != "All Languages":
-  
-                        continue
-                    
-                    subtitles_to_show[sub_key] = {
-                        'original': self.original_subtitles.get(sub_key, ""),
-                        'current': sub_value,
-                        'file_info': None,
-                        'has_audio': has_audio,
-                        'is_modified': is_modified
+                for sub_key, sub_value in file_subtitles.items():
+                    base_rows[sub_key] = {
+                        'original': sub_value,
+                        'file_info': file_info,
+                        'key_lower': sub_key.lower(),
+                        'original_lower': sub_value.lower()
                     }
             
             self.progressUpdate.emit(100)
-            self.statusUpdate.emit(f"Loaded {len(subtitles_to_show)} subtitles from {files_processed} files")
+            self.statusUpdate.emit(f"Loaded {len(base_rows)} subtitles from {len(loaded_files)} files")
             
             if not self._should_stop:
-                self.dataLoaded.emit(subtitles_to_show)
+                self.dataLoaded.emit(base_rows)
                 
         except Exception as e:
             DEBUG.log(f"Error in subtitle loader thread: {e}", "ERROR")
-            self.dataLoaded.emit({})        
+            self.dataLoaded.emit({})
+
+    @staticmethod
+    def filter_rows(base_rows, subtitles, original_subtitles, modified_subtitles, audio_keys_cache,
+                    orphaned_only, modified_only, with_audio_only, search_text, include_unassigned):
+        """Apply editor filters to already loaded rows"""
+        search_text = search_text.lower().strip()
+        subtitles_to_show = {}
+
+        for sub_key, row in base_rows.items():
+            has_audio = sub_key in audio_keys_cache if audio_keys_cache else False
+            
+            if orphaned_only and has_audio:
+                continue
+            
+            if with_audio_only and not has_audio:
+                continue
+
+            is_modified = sub_key in modified_subtitles
+            
+            if modified_only and not is_modified:
+                continue
+
+            current_text = subtitles.get(sub_key, row['original'])
+
+            if search_text:
+                if (search_text not in row['key_lower'] and 
+                    search_text not in row['original_lower'] and
+                    search_text not in current_text.lower()):
+                    continue
+            
+            subtitles_to_show[sub_key] = {
+                'original': row['original'],
+                'current': current_text,
+                'file_info': row['file_info'],
+                'has_audio': has_audio,
+                'is_modified': is_modified
+            }
+
+        if not include_unassigned:
+            return subtitles_to_show
+
+        for sub_key, sub_value in subtitles.items():
+            if sub_key in subtitles_to_show or sub_key in base_rows:
+                continue
+
+            has_audio = sub_key in audio_keys_cache if audio_keys_cache else False
+            
+            if orphaned_only and has_audio:
+                continue
+            
+            if with_audio_only and not has_audio:
+                continue
+            
+            is_modified = sub_key in modified_subtitles
+            
+            if modified_only and not is_modified:
+                continue
+            
+            original_text = original_subtitles.get(sub_key, "")
+            if search_text:
+                if (search_text not in sub_key.lower() and 
+                    search_text not in sub_value.lower() and
+                    search_text not in original_text.lower()):
+                    continue
+            
+            subtitles_to_show[sub_key] = {
+                'original': original_text,
+                'current': sub_value,
+                'file_info': None,
+                'has_audio': has_audio,
+                'is_modified': is_modified
+            }
+
+        return subtitles_to_show
+class LocresFile:
+    """In-process reader/writer for Unreal Engine .locres localization resources"""
+
+    MAGIC = bytes.fromhex("0E147475674A03FC4A15909DC3377F1B")
+
+    VERSION_LEGACY = 0
+    VERSION_COMPACT = 1
+    VERSION_OPTIMIZED_CRC32 = 2
+    VERSION_OPTIMIZED_CITYHASH64 = 3
+
+    def __init__(self):
+        self.version = self.VERSION_OPTIMIZED_CITYHASH64
+        self.namespaces = []
+        self.strings = []
+
+    @classmethod
+    def load(cls, path):
+        """Parse a locres file straight from a memory map"""
+        locres = cls()
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Empty locres file: {path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                locres.parse(data)
+        return locres
+
+    @staticmethod
+    def _read_fstring(data, offset):
+        length = struct.unpack_from('<i', data, offset)[0]
+        offset += 4
+        if length == 0:
+            return "", offset
+        if length < 0:
+            size = -length * 2
+            text = bytes(data[offset:offset + size]).decode('utf-16-le', errors='replace')
+        else:
+            size = length
+            text = bytes(data[offset:offset + size]).decode('latin-1')
+        if len(text) != (size // 2 if length < 0 else size):
+            raise ValueError(f"Truncated string at offset {offset}")
+        return text[:-1] if text.endswith('\x00') else text, offset + size
+
+    def parse(self, data):
+        self.namespaces = []
+        self.strings = []
+        offset = 0
+        string_array_offset = None
+
+        if bytes(data[:16]) == self.MAGIC:
+            self.version = data[16]
+            if self.version > self.VERSION_OPTIMIZED_CITYHASH64:
+                raise ValueError(f"Unsupported locres version: {self.version}")
+            string_array_offset = struct.unpack_from('<q', data, 17)[0]
+            offset = 25
+        else:
+            self.version = self.VERSION_LEGACY
+
+        if string_array_offset is not None and string_array_offset != -1:
+            string_count = struct.unpack_from('<i', data, string_array_offset)[0]
+            pos = string_array_offset + 4
+            for _ in range(string_count):
+                text, pos = self._read_fstring(data, pos)
+                refcount = 1
+                if self.version >= self.VERSION_OPTIMIZED_CRC32:
+                    refcount = struct.unpack_from('<i', data, pos)[0]
+                    pos += 4
+                self.strings.append([text, refcount])
+
+        if self.version >= self.VERSION_OPTIMIZED_CITYHASH64:
+            offset += 4
+
+        namespace_count = struct.unpack_from('<I', data, offset)[0]
+        offset += 4
+        has_hashes = self.version >= self.VERSION_OPTIMIZED_CRC32
+
+        for _ in range(namespace_count):
+            namespace_hash = 0
+            if has_hashes:
+                namespace_hash = struct.unpack_from('<I', data, offset)[0]
+                offset += 4
+            namespace, offset = self._read_fstring(data, offset)
+            key_count = struct.unpack_from('<I', data, offset)[0]
+            offset += 4
+
+            keys = []
+            for _ in range(key_count):
+                key_hash = 0
+                if has_hashes:
+                    key_hash = struct.unpack_from('<I', data, offset)[0]
+                    offset += 4
+                key, offset = self._read_fstring(data, offset)
+                source_hash = struct.unpack_from('<I', data, offset)[0]
+                offset += 4
+                if self.version == self.VERSION_LEGACY:
+                    text, offset = self._read_fstring(data, offset)
+                    string_index = len(self.strings)
+                    self.strings.append([text, 1])
+                else:
+                    string_index = struct.unpack_from('<i', data, offset)[0]
+                    offset += 4
+                keys.append([key, key_hash, source_hash, string_index])
+
+            self.namespaces.append([namespace, namespace_hash, keys])
+
+    _K0 = 0xc3a5c85c97cb3127
+    _K1 = 0xb492b66fbe98f273
+    _K2 = 0x9ae16a3b2f90404f
+    _MASK64 = 0xFFFFFFFFFFFFFFFF
+
+    @staticmethod
+    def _rotate(value, shift):
+        if shift == 0:
+            return value
+        return ((value >> shift) | (value << (64 - shift))) & LocresFile._MASK64
+
+    @staticmethod
+    def _hash_len16(u, v, mul=0x9ddfea08eb382d69):
+        m = LocresFile._MASK64
+        a = ((u ^ v) * mul) & m
+        a ^= a >> 47
+        b = ((v ^ a) * mul) & m
+        b ^= b >> 47
+        return (b * mul) & m
+
+    @staticmethod
+    def _cityhash64(s):
+        """CityHash64 (v1.1) as used by Unreal's TextKeyUtil"""
+        m = LocresFile._MASK64
+        k0, k1, k2 = LocresFile._K0, LocresFile._K1, LocresFile._K2
+        rot = LocresFile._rotate
+        h16 = LocresFile._hash_len16
+        length = len(s)
+
+        def f64(i):
+            return struct.unpack_from('<Q', s, i)[0]
+
+        def f32(i):
+            return struct.unpack_from('<I', s, i)[0]
+
+        def shift_mix(v):
+            return v ^ (v >> 47)
+
+        def bswap(v):
+            return int.from_bytes(v.to_bytes(8, 'little'), 'big')
+
+        def weak32(i, a, b):
+            w, x, y, z = f64(i), f64(i + 8), f64(i + 16), f64(i + 24)
+            a = (a + w) & m
+            b = rot((b + a + z) & m, 21)
+            c = a
+            a = (a + x + y) & m
+            b = (b + rot(a, 44)) & m
+            return (a + z) & m, (b + c) & m
+
+        if length <= 16:
+            if length >= 8:
+                mul = (k2 + length * 2) & m
+                a = (f64(0) + k2) & m
+                b = f64(length - 8)
+                c = (rot(b, 37) * mul + a) & m
+                d = ((rot(a, 25) + b) * mul) & m
+                return h16(c, d, mul)
+            if length >= 4:
+                mul = (k2 + length * 2) & m
+                a = f32(0)
+                return h16((length + (a << 3)) & m, f32(length - 4), mul)
+            if length > 0:
+                y = (s[0] + (s[length >> 1] << 8)) & 0xFFFFFFFF
+                z = (length + (s[length - 1] << 2)) & 0xFFFFFFFF
+                return (shift_mix(((y * k2) ^ (z * k0)) & m) * k2) & m
+            return k2
+        if length <= 32:
+            mul = (k2 + length * 2) & m
+            a = (f64(0) * k1) & m
+            b = f64(8)
+            c = (f64(length - 8) * mul) & m
+            d = (f64(length - 16) * k2) & m
+            return h16((rot((a + b) & m, 43) + rot(c, 30) + d) & m,
+                       (a + rot((b + k2) & m, 18) + c) & m, mul)
+        if length <= 64:
+            mul = (k2 + length * 2) & m
+            a = (f64(0) * k2) & m
+            b = f64(8)
+            c = f64(length - 24)
+            d = f64(length - 32)
+            e = (f64(16) * k2) & m
+            f = (f64(24) * 9) & m
+            g = f64(length - 8)
+            h = (f64(length - 16) * mul) & m
+            u = (rot((a + g) & m, 43) + (rot(b, 30) + c) * 9) & m
+            v = (((a + g) ^ d) + f + 1) & m
+            w = (bswap(((u + v) * mul) & m) + h) & m
+            x = (rot((e + f) & m, 42) + c) & m
+            y = ((bswap(((v + w) * mul) & m) + g) * mul) & m
+            z = (e + f + c) & m
+            a = (bswap(((x + z) * mul + y) & m) + b) & m
+            b = (shift_mix(((z + a) * mul + d + h) & m) * mul) & m
+            return (b + x) & m
+
+        x = f64(length - 40)
+        y = (f64(length - 16) + f64(length - 56)) & m
+        z = h16((f64(length - 48) + length) & m, f64(length - 24))
+        v = weak32(length - 64, length, z)
+        w = weak32(length - 32, (y + k1) & m, x)
+        x = (x * k1 + f64(0)) & m
+        remaining = (length - 1) & ~63
+        pos = 0
+        while True:
+            x = (rot((x + y + v[0] + f64(pos + 8)) & m, 37) * k1) & m
+            y = (rot((y + v[1] + f64(pos + 48)) & m, 42) * k1) & m
+            x ^= w[1]
+            y = (y + v[0] + f64(pos + 40)) & m
+            z = (rot((z + w[0]) & m, 33) * k1) & m
+            v = weak32(pos, (v[1] * k1) & m, (x + w[0]) & m)
+            w = weak32(pos + 32, (z + w[1]) & m, (y + f64(pos + 16)) & m)
+            z, x = x, z
+            pos += 64
+            remaining -= 64
+            if remaining == 0:
+                break
+        return h16((h16(v[0], w[0]) + shift_mix(y) * k1 + z) & m,
+                   (h16(v[1], w[1]) + x) & m)
+
+    @staticmethod
+    def _strcrc32(text):
+        units = text.encode('utf-16-le')
+        count = len(units) // 2
+        return zlib.crc32(struct.pack(f'<{count}I', *struct.unpack(f'<{count}H', units)))
+
+    def hash_key(self, text):
+        """Namespace/key hash matching the file's locres version"""
+        if not text:
+            return 0
+        if self.version >= self.VERSION_OPTIMIZED_CITYHASH64:
+            value = self._cityhash64(text.encode('utf-16-le'))
+            return ((value & 0xFFFFFFFF) + (value >> 32) * 23) & 0xFFFFFFFF
+        return self._strcrc32(text)
+
+    def hash_source(self, text):
+        return self._strcrc32(text)
+
+    @staticmethod
+    def _write_fstring(out, text):
+        if text.isascii():
+            data = text.encode('ascii') + b'\x00'
+            out += struct.pack('<i', len(data))
+        else:
+            data = text.encode('utf-16-le') + b'\x00\x00'
+            out += struct.pack('<i', -(len(data) // 2))
+        out += data
+
+    def _build_string_lookup(self):
+        self._string_lookup = {}
+        for index, (text, _) in enumerate(self.strings):
+            self._string_lookup.setdefault(text, index)
+
+    def set_text(self, entry, text):
+        """Point an entry at new text, reusing or patching the string table"""
+        old_index = entry[3]
+        if 0 <= old_index < len(self.strings) and self.strings[old_index][0] == text:
+            return False
+        if not hasattr(self, '_string_lookup'):
+            self._build_string_lookup()
+
+        if 0 <= old_index < len(self.strings):
+            old = self.strings[old_index]
+            old[1] -= 1
+            if old[1] <= 0:
+                if self._string_lookup.get(old[0]) == old_index:
+                    del self._string_lookup[old[0]]
+                old[0] = text
+                old[1] = 1
+                self._string_lookup.setdefault(text, old_index)
+                return True
+
+        new_index = self._string_lookup.get(text)
+        if new_index is not None and self.version != self.VERSION_LEGACY:
+            self.strings[new_index][1] += 1
+        else:
+            new_index = len(self.strings)
+            self.strings.append([text, 1])
+            self._string_lookup.setdefault(text, new_index)
+        entry[3] = new_index
+        return True
+
+    def add_entry(self, namespace, key, text):
+        for ns in self.namespaces:
+            if ns[0] == namespace:
+                keys = ns[2]
+                break
+        else:
+            keys = []
+            self.namespaces.append([namespace, self.hash_key(namespace), keys])
+        entry = [key, self.hash_key(key), self.hash_source(text), -1]
+        keys.append(entry)
+        self.set_text(entry, text)
+        return entry
+
+    def default_namespace(self):
+        """Namespace used for keys that are not in the file yet"""
+        names = [ns[0] for ns in self.namespaces]
+        if 'Subtitles' in names or not names:
+            return 'Subtitles'
+        return names[0]
+
+    def apply_subtitles(self, subtitles):
+        """Update entries by clean key and add missing ones; returns (changed, added)"""
+        entries_by_key = {}
+        for namespace, _, keys in self.namespaces:
+            for entry in keys:
+                entries_by_key.setdefault(self.clean_key(namespace, entry[0]), []).append(entry)
+
+        changed = 0
+        added = 0
+        new_namespace = None
+        for clean_key, text in subtitles.items():
+            entries = entries_by_key.get(clean_key)
+            if entries:
+                for entry in entries:
+                    if self.set_text(entry, text):
+                        changed += 1
+            elif clean_key:
+                if new_namespace is None:
+                    new_namespace = self.default_namespace()
+                entries_by_key[clean_key] = [self.add_entry(new_namespace, clean_key, text)]
+                added += 1
+        return changed, added
+
+    def to_bytes(self):
+        out = bytearray()
+        if self.version != self.VERSION_LEGACY:
+            out += self.MAGIC
+            out += struct.pack('<B', self.version)
+            offset_pos = len(out)
+            out += struct.pack('<q', -1)
+            if self.version >= self.VERSION_OPTIMIZED_CITYHASH64:
+                out += struct.pack('<I', self.entry_count())
+
+        has_hashes = self.version >= self.VERSION_OPTIMIZED_CRC32
+        out += struct.pack('<I', len(self.namespaces))
+        for namespace, namespace_hash, keys in self.namespaces:
+            if has_hashes:
+                out += struct.pack('<I', namespace_hash)
+            self._write_fstring(out, namespace)
+            out += struct.pack('<I', len(keys))
+            for key, key_hash, source_hash, string_index in keys:
+                if has_hashes:
+                    out += struct.pack('<I', key_hash)
+                self._write_fstring(out, key)
+                out += struct.pack('<I', source_hash)
+                if self.version == self.VERSION_LEGACY:
+                    self._write_fstring(out, self.strings[string_index][0])
+                else:
+                    out += struct.pack('<i', string_index)
+
+        if self.version != self.VERSION_LEGACY:
+            struct.pack_into('<q', out, offset_pos, len(out))
+            out += struct.pack('<i', len(self.strings))
+            for text, refcount in self.strings:
+                self._write_fstring(out, text)
+                if has_hashes:
+                    out += struct.pack('<i', refcount)
+        return bytes(out)
+
+    def save(self, path):
+        """Write the file atomically via a temporary sibling"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(temp_path, path)
+
+    def entry_count(self):
+        return sum(len(keys) for _, _, keys in self.namespaces)
+
+    def iter_entries(self):
+        """Yield (namespace, key, text) for every entry"""
+        for namespace, _, keys in self.namespaces:
+            for key, _, _, string_index in keys:
+                if 0 <= string_index < len(self.strings):
+                    yield namespace, key, self.strings[string_index][0]
+                else:
+                    yield namespace, key, ""
+
+    @staticmethod
+    def clean_key(namespace, key):
+        """Match the key format used by the rest of the editor"""
+        full_key = f"{namespace}/{key}".strip()
+        if full_key.startswith('Subtitles/'):
+            return full_key[10:]
+        return full_key.lstrip('/')
+
+    def to_subtitles(self):
+        subtitles = {}
+        for namespace, key, text in self.iter_entries():
+            clean_key = self.clean_key(namespace, key)
+            value = text.strip()
+            if clean_key and value:
+                subtitles[clean_key] = value
+        return subtitles
+
+class LocresCache:
+    """Persistent cache of parsed locres files keyed by path, size and mtime"""
+
+    SCHEMA_VERSION = 1
+    MAX_ENTRIES = 1000
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+        self.hits = 0
+        self.misses = 0
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS locres")
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS locres (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    hash TEXT,
+                    data BLOB,
+                    last_used REAL
+                )
+            """)
+            self.conn.commit()
+            self.evict_stale()
+            DEBUG.log(f"Locres cache opened: {db_path}")
+        except Exception as e:
+            DEBUG.log(f"Locres cache disabled ({db_path}): {e}", "WARNING")
+            self.conn = None
+
+    @staticmethod
+    def _normalize(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def file_hash(path):
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, path):
+        """Return cached subtitles for an unchanged file, or None"""
+        if self.conn is None:
+            return None
+        try:
+            stat = os.stat(path)
+            key = self._normalize(path)
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT size, mtime_ns, hash, data FROM locres WHERE path = ?", (key,)
+                ).fetchone()
+            if row is None or row[0] != stat.st_size:
+                self.misses += 1
+                return None
+
+            if row[1] != stat.st_mtime_ns and self.file_hash(path) != row[2]:
+                self.misses += 1
+                return None
+
+            with self.lock:
+                self.conn.execute(
+                    "UPDATE locres SET mtime_ns = ?, last_used = ? WHERE path = ?",
+                    (stat.st_mtime_ns, time.time(), key)
+                )
+                self.conn.commit()
+            self.hits += 1
+            return json.loads(zlib.decompress(row[3]).decode('utf-8'))
+        except Exception as e:
+            DEBUG.log(f"Locres cache read failed for {path}: {e}", "WARNING")
+            return None
+
+    def put(self, path, subtitles):
+        if self.conn is None:
+            return
+        try:
+            stat = os.stat(path)
+            data = zlib.compress(json.dumps(subtitles, ensure_ascii=False).encode('utf-8'))
+            file_hash = self.file_hash(path)
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO locres (path, size, mtime_ns, hash, data, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (self._normalize(path), stat.st_size, stat.st_mtime_ns, file_hash, data, time.time())
+                )
+                self.conn.commit()
+        except Exception as e:
+            DEBUG.log(f"Locres cache write failed for {path}: {e}", "WARNING")
+
+    def invalidate(self, path):
+        if self.conn is None:
+            return
+        with self.lock:
+            self.conn.execute("DELETE FROM locres WHERE path = ?", (self._normalize(path),))
+            self.conn.commit()
+
+    def evict_stale(self):
+        """Drop entries for files that no longer exist and keep the newest MAX_ENTRIES"""
+        with self.lock:
+            paths = [row[0] for row in self.conn.execute("SELECT path FROM locres")]
+            missing = [(p,) for p in paths if not os.path.exists(p)]
+            if missing:
+                self.conn.executemany("DELETE FROM locres WHERE path = ?", missing)
+            self.conn.execute(
+                "DELETE FROM locres WHERE path NOT IN (SELECT path FROM locres ORDER BY last_used DESC LIMIT ?)",
+                (self.MAX_ENTRIES,)
+            )
+            self.conn.commit()
+        if missing:
+            DEBUG.log(f"Evicted {len(missing)} stale locres cache entries")
+
+    def close(self):
+        if self.conn is not None:
+            DEBUG.log(f"Locres cache stats: {self.hits} hits, {self.misses} misses")
+            with self.lock:
+                self.conn.close()
+            self.conn = None
+
 class UnrealLocresManager:
-    """Manager for UnrealLocres.exe operations with debug logging"""
+    """Manager for locres read/write operations with debug logging"""
+    
+    # UnrealLocres.exe writes <basename>.csv next to itself and every language shares the basename
+    tool_lock = threading.Lock()
     
-    def __init__(self, unreal_locres_path):
+    def __init__(self, unreal_locres_path, cache_path=None):
         self.unreal_locres_path = unreal_locres_path
+        if getattr(sys, 'frozen', False):
+            base_path = os.path.dirname(sys.executable)
+        else:
+            base_path = os.path.dirname(os.path.abspath(__file__))
         if not os.path.isabs(self.unreal_locres_path):
-            if getattr(sys, 'frozen', False):
-                base_path = os.path.dirname(sys.executable)
-            else:
-                base_path = os.path.dirname(os.path.abspath(__file__))
             self.unreal_locres_path = os.path.join(base_path, self.unreal_locres_path)
+        if cache_path is None:
+            cache_path = os.path.join(base_path, "locres_cache.db")
+        self.cache = LocresCache(cache_path)
         DEBUG.log(f"UnrealLocresManager initialized with path: {self.unreal_locres_path}")
         
     def export_locres(self, locres_path):
-        """Export locres file to CSV and return subtitle data"""
+        """Read locres file natively and return subtitle data"""
         DEBUG.log(f"Starting export_locres for: {locres_path}")
+
+        if not os.path.exists(locres_path):
+            DEBUG.log(f"ERROR: Locres file not found: {locres_path}", "ERROR")
+            return {}
+
+        subtitles = self.cache.get(locres_path)
+        if subtitles is not None:
+            DEBUG.log(f"Loaded {len(subtitles)} subtitles from cache")
+            return subtitles
+
+        try:
+            locres = LocresFile.load(locres_path)
+            subtitles = locres.to_subtitles()
+            DEBUG.log(f"Parsed locres v{locres.version}: {locres.entry_count()} entries, {len(locres.strings)} strings, {len(subtitles)} subtitles")
+            self.cache.put(locres_path, subtitles)
+            return subtitles
+        except Exception as e:
+            DEBUG.log(f"Native locres parse failed for {locres_path}: {e}", "WARNING")
+
+        return self.export_locres_with_tool(locres_path)
+
+    def export_locres_with_tool(self, locres_path):
+        """Export locres file to CSV via UnrealLocres.exe and return subtitle data"""
+        with self.tool_lock:
+            return self._export_locres_with_tool(locres_path)
+
+    def _export_locres_with_tool(self, locres_path):
         subtitles = {}
         
         try:
-            if not os.path.exists(locres_path):
-                DEBUG.log(f"ERROR: Locres file not found: {locres_path}", "ERROR")
-                return subtitles
-                
             DEBUG.log(f"Locres file size: {os.path.getsize(locres_path)} bytes")
             
             if not os.path.exists(self.unreal_locres_path):
@@ -1655,7 +2653,41 @@ class UnrealLocresManager:
         """Import subtitle data to locres file"""
         DEBUG.log(f"Starting import_locres for: {locres_path}")
         DEBUG.log(f"Importing {len(subtitles)} subtitles")
-        
+
+        try:
+            locres = LocresFile.load(locres_path)
+        except Exception as e:
+            DEBUG.log(f"Native locres parse failed for {locres_path}: {e}", "WARNING")
+            return self.import_locres_with_tool(locres_path, subtitles)
+
+        try:
+            changed, added = locres.apply_subtitles(subtitles)
+            DEBUG.log(f"Changed entries: {changed}, new entries added: {added}")
+            if changed or added:
+                self.cache.invalidate(locres_path)
+                locres.save(locres_path)
+            DEBUG.log("import_locres completed successfully")
+            return True
+        except Exception as e:
+            DEBUG.log(f"ERROR in import_locres: {str(e)}", "ERROR")
+            DEBUG.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            return False
+
+    def create_locres(self, locres_path, subtitles):
+        """Write a new locres file holding the given subtitles"""
+        os.makedirs(os.path.dirname(locres_path), exist_ok=True)
+        locres = LocresFile()
+        for key, value in subtitles.items():
+            locres.add_entry("Subtitles", key, value)
+        locres.save(locres_path)
+        DEBUG.log(f"Created locres with {len(subtitles)} entries: {locres_path}")
+
+    def import_locres_with_tool(self, locres_path, subtitles):
+        """Import subtitle data to locres file via UnrealLocres.exe"""
+        with self.tool_lock:
+            return self._import_locres_with_tool(locres_path, subtitles)
+
+    def _import_locres_with_tool(self, locres_path, subtitles):
         try:
             csv_filename = os.path.basename(locres_path).replace('.locres', '.csv')
             csv_path = os.path.join(os.path.dirname(self.unreal_locres_path) or ".", csv_filename)
@@ -1846,6 +2878,471 @@ class UnrealLocresManager:
             DEBUG.log(f"Traceback: {traceback.format_exc()}", "ERROR")
             return False
 
+class SubtitleStore:
+    """Original and working subtitle text keyed by (category, language, key), loaded per language on demand"""
+
+    def __init__(self, locres_manager):
+        self.locres_manager = locres_manager
+        self.files = {}
+        self.original = {}
+        self.working = {}
+        self.views = {}
+        self.key_indexes = {}
+        self.lock = threading.RLock()
+
+    def set_files(self, all_subtitle_files):
+        """Register scanned subtitle files and drop cached file contents"""
+        with self.lock:
+            self.files = all_subtitle_files
+            self.original.clear()
+            self.working.clear()
+            self.key_indexes.clear()
+
+    def clear_views(self):
+        with self.lock:
+            self.views.clear()
+
+    @staticmethod
+    def working_path(path):
+        return path.replace('.locres', '_working.locres')
+
+    @staticmethod
+    def _intern(subtitles, shared=None):
+        result = {}
+        for key, value in subtitles.items():
+            if shared is not None:
+                same = shared.get(key)
+                if same == value:
+                    value = same
+            result[sys.intern(key)] = value
+        return result
+
+    def files_for(self, language=None, category=None):
+        with self.lock:
+            return [
+                (file_key, file_info) for file_key, file_info in self.files.items()
+                if (language is None or file_info['language'] == language)
+                and (category is None or file_info['category'] == category)
+            ]
+
+    def load_file(self, file_key):
+        """Return (original, working or None) for a file, reading it on first access"""
+        with self.lock:
+            if file_key in self.original:
+                return self.original[file_key], self.working.get(file_key)
+            file_info = self.files.get(file_key)
+        if file_info is None:
+            return {}, None
+
+        original = self._intern(self.locres_manager.export_locres(file_info['path']))
+        working = None
+        working_path = self.working_path(file_info['path'])
+        if os.path.exists(working_path):
+            working = self._intern(self.locres_manager.export_locres(working_path), original)
+
+        with self.lock:
+            self.original.setdefault(file_key, original)
+            if working is not None:
+                self.working.setdefault(file_key, working)
+            return self.original[file_key], self.working.get(file_key)
+
+    def invalidate_file(self, file_key):
+        """Forget a file's contents so the next access re-reads it"""
+        with self.lock:
+            self.original.pop(file_key, None)
+            self.working.pop(file_key, None)
+            file_info = self.files.get(file_key)
+            if file_info:
+                self.key_indexes.pop(file_info['language'], None)
+
+    def get(self, category, language, key):
+        """Return (original, working) text for a key, or (None, None)"""
+        for file_key, _ in self.files_for(language, category):
+            original, working = self.load_file(file_key)
+            current = working if working is not None else original
+            if key in original or key in current:
+                return original.get(key), current.get(key)
+        return None, None
+
+    def file_subtitles(self, file_key):
+        """Copy of a file's on-disk text: the working copy if present, else the original"""
+        original, working = self.load_file(file_key)
+        return dict(working if working is not None else original)
+
+    def language_view(self, language):
+        """Merged (subtitles, original_subtitles) dicts for a language, shared between calls"""
+        with self.lock:
+            if language in self.views:
+                return self.views[language]
+
+        subtitles = {}
+        original_subtitles = {}
+        for file_key, file_info in self.files_for(language):
+            original, working = self.load_file(file_key)
+            original_subtitles.update(original)
+            subtitles.update(working if working is not None else original)
+            DEBUG.log(f"Loaded {len(original)} subtitles from {file_info['filename']}")
+
+        with self.lock:
+            return self.views.setdefault(language, (subtitles, original_subtitles))
+
+    def key_index(self, language):
+        """Return {key: [file_key, ...]} for a language in file scan order"""
+        with self.lock:
+            if language in self.key_indexes:
+                return self.key_indexes[language]
+
+        index = {}
+        for file_key, _ in self.files_for(language):
+            original, working = self.load_file(file_key)
+            for source in (original, working or {}):
+                for key in source:
+                    file_keys = index.setdefault(key, [])
+                    if file_key not in file_keys:
+                        file_keys.append(file_key)
+
+        with self.lock:
+            return self.key_indexes.setdefault(language, index)
+
+class ModFileIndex:
+    """Ids of mod WEM files present under MOD_P, keyed by language folder ("SFX" for the root folder)"""
+
+    def __init__(self, windows_dir):
+        self.windows_dir = windows_dir
+        self.ids = {}
+        self.lock = threading.RLock()
+
+    def folder_for(self, lang):
+        if lang == "SFX":
+            return self.windows_dir
+        return os.path.join(self.windows_dir, lang)
+
+    def path_for(self, lang, id_):
+        return os.path.join(self.folder_for(lang), f"{id_}.wem")
+
+    @staticmethod
+    def _scan_ids(folder):
+        ids = set()
+        subfolders = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subfolders.append(entry.name)
+                    elif entry.name.lower().endswith(".wem"):
+                        ids.add(entry.name[:-4])
+        except OSError:
+            pass
+        return ids, subfolders
+
+    def rebuild(self):
+        """Rescan the mod folder in one scandir pass per language folder; returns True if anything changed"""
+        ids, subfolders = self._scan_ids(self.windows_dir)
+        index = {"SFX": ids}
+        for name in subfolders:
+            index[name] = self._scan_ids(os.path.join(self.windows_dir, name))[0]
+        with self.lock:
+            changed = index != self.ids
+            self.ids = index
+        DEBUG.log(f"Mod file index rebuilt: {sum(len(v) for v in index.values())} files in {len(index)} folders")
+        return changed
+
+    def folders(self):
+        """Existing folders covered by the index, for filesystem watching"""
+        with self.lock:
+            names = list(self.ids)
+        return [folder for folder in map(self.folder_for, names) if os.path.isdir(folder)]
+
+    def has(self, lang, id_):
+        with self.lock:
+            return str(id_) in self.ids.get(lang, ())
+
+    def ids_for(self, lang):
+        with self.lock:
+            return set(self.ids.get(lang, ()))
+
+    def _locate(self, path):
+        folder, filename = os.path.split(os.path.normpath(path))
+        if not filename.lower().endswith(".wem"):
+            return None, None
+        if os.path.normcase(folder) == os.path.normcase(os.path.normpath(self.windows_dir)):
+            return "SFX", filename[:-4]
+        if os.path.normcase(os.path.dirname(folder)) == os.path.normcase(os.path.normpath(self.windows_dir)):
+            return os.path.basename(folder), filename[:-4]
+        return None, None
+
+    def add_path(self, path):
+        """Record a mod file the app has just written"""
+        lang, id_ = self._locate(path)
+        if lang is not None:
+            with self.lock:
+                self.ids.setdefault(lang, set()).add(id_)
+
+    def discard_path(self, path):
+        """Forget a mod file the app has just removed"""
+        lang, id_ = self._locate(path)
+        if lang is not None:
+            with self.lock:
+                self.ids.get(lang, set()).discard(id_)
+
+class AudioInfoCache:
+    """Bounded LRU of parsed WEM audio info, valid while the file's mtime and size are unchanged"""
+
+    MAX_ENTRIES = 256
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path):
+        """Return a copy of the cached info for an unchanged file, or None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = self._normalize(path)
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                info = dict(cached[1])
+            else:
+                self.misses += 1
+                info = None
+        DEBUG.log(f"Audio info cache {'hit' if info else 'miss'}: {os.path.basename(path)} ({self.hits} hits, {self.misses} misses)")
+        return info
+
+    def put(self, path, info):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self.lock:
+            self.entries[self._normalize(path)] = ((stat.st_mtime_ns, stat.st_size), dict(info))
+            self.entries.move_to_end(self._normalize(path))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, path):
+        with self.lock:
+            self.entries.pop(self._normalize(path), None)
+
+class FileDigests:
+    """Process-wide SHA-1 of file contents, memoised by path, mtime and size so each file is read once"""
+
+    lock = threading.Lock()
+    digests = {}
+    pending = {}
+
+    @classmethod
+    def sha1(cls, path):
+        """SHA-1 hex digest of path's content; raises OSError if it cannot be read"""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        while True:
+            with cls.lock:
+                cached = cls.digests.get(path)
+                if cached and cached[0] == stamp:
+                    return cached[1]
+                event = cls.pending.get(path)
+                if event is None:
+                    event = cls.pending[path] = threading.Event()
+                    break
+            # Parallel probes of one WAV ask at the same time; wait for the thread already reading it
+            event.wait()
+        try:
+            digest = LocresCache.file_hash(path)
+            with cls.lock:
+                cls.digests[path] = (stamp, digest)
+            return digest
+        finally:
+            with cls.lock:
+                cls.pending.pop(path, None)
+            event.set()
+
+class DiskLRUCache:
+    """On-disk LRU of files named by key_for(...) plus suffix, bounded in bytes; subclasses add key_for and their own writers"""
+
+    LABEL = "Disk cache"
+
+    def __init__(self, cache_dir, max_bytes, suffix):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            files = []
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(suffix):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, entry.name, stat.st_size))
+                    elif entry.name.endswith(".tmp"):
+                        os.remove(entry.path)
+            for _, name, size in sorted(files):
+                self.entries[name] = size
+                self.total_bytes += size
+            self.evict()
+            DEBUG.log(f"{self.LABEL} opened: {cache_dir} ({len(self.entries)} files, {self.total_bytes:,} bytes)")
+        except OSError as e:
+            DEBUG.log(f"{self.LABEL} unavailable ({cache_dir}): {e}", "WARNING")
+
+    def key_for(self, *args):
+        raise NotImplementedError
+
+    def get(self, *args):
+        """Path of the cached file for key_for(*args), or None"""
+        if self.max_bytes <= 0:
+            return None
+        try:
+            name = self.key_for(*args)
+        except OSError:
+            return None
+        path = os.path.join(self.cache_dir, name)
+        with self.lock:
+            if name not in self.entries:
+                return None
+            if not os.path.exists(path):
+                self.total_bytes -= self.entries.pop(name)
+                return None
+            self.entries.move_to_end(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def commit(self, name, tmp_path):
+        """Move a finished temp file into place as name and account for it; returns the final path"""
+        path = os.path.join(self.cache_dir, name)
+        os.replace(tmp_path, path)
+        with self.lock:
+            self.total_bytes -= self.entries.pop(name, 0)
+            self.entries[name] = os.path.getsize(path)
+            self.total_bytes += self.entries[name]
+        self.evict(keep=name)
+        return path
+
+    def evict(self, keep=None):
+        """Remove least recently used files until the cache fits in max_bytes"""
+        with self.lock:
+            for name in list(self.entries):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                if name == keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Still open (e.g. in the player); try again on the next eviction
+                    continue
+                self.total_bytes -= self.entries.pop(name)
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+class DecodedAudioCache(DiskLRUCache):
+    """On-disk LRU of WAV files decoded from WEMs, keyed by source path, mtime and size, bounded in bytes"""
+
+    LABEL = "Decoded audio cache"
+
+    def __init__(self, cache_dir, max_bytes):
+        self.pending = {}
+        super().__init__(cache_dir, max_bytes, ".wav")
+
+    def key_for(self, wem_path):
+        stat = os.stat(wem_path)
+        source = f"{os.path.normcase(os.path.abspath(wem_path))}|{stat.st_mtime_ns}|{stat.st_size}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest() + self.suffix
+
+    def decode(self, wem_path, decoder):
+        """Return (ok, wav_path, error), decoding through decoder(wem_path, wav_path) only on a miss"""
+        cached = self.get(wem_path)
+        if cached:
+            return True, cached, ""
+        if self.max_bytes <= 0:
+            return False, "", "Decoded audio cache is disabled"
+
+        try:
+            name = self.key_for(wem_path)
+        except OSError as e:
+            return False, "", str(e)
+        with self.lock:
+            event = self.pending.get(name)
+            owner = event is None
+            if owner:
+                event = self.pending[name] = threading.Event()
+        if not owner:
+            # Another thread (playback or prefetch) is decoding the same file
+            event.wait()
+            cached = self.get(wem_path)
+            return (True, cached, "") if cached else (False, "", "Decoding failed")
+
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            ok, error = decoder(wem_path, tmp_path)
+            if not ok or not os.path.exists(tmp_path):
+                return False, "", error
+            return True, self.commit(name, tmp_path), ""
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            with self.lock:
+                self.pending.pop(name, None)
+            event.set()
+
+class AudioPrefetcher:
+    """Decodes WEMs into a DecodedAudioCache ahead of playback on a single background worker"""
+
+    def __init__(self, audio_cache, decoder):
+        self.audio_cache = audio_cache
+        self.decoder = decoder
+        self.generation = 0
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def schedule(self, wem_paths):
+        """Replace any pending prefetch with wem_paths, decoded in order"""
+        self.generation += 1
+        generation = self.generation
+        for path in wem_paths:
+            self.executor.submit(self._prefetch, generation, path)
+
+    def cancel(self):
+        self.generation += 1
+
+    def _prefetch(self, generation, path):
+        if generation != self.generation or self.audio_cache.max_bytes <= 0:
+            return
+        if self.audio_cache.get(path):
+            return
+        ok, _, error = self.audio_cache.decode(path, self.decoder)
+        if ok:
+            DEBUG.log(f"Prefetched audio: {os.path.basename(path)}")
+        else:
+            DEBUG.log(f"Prefetch failed for {path}: {error}", "WARNING")
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
 class AppSettings:
     def __init__(self):
         if getattr(sys, 'frozen', False):
@@ -1865,7 +3362,14 @@ class AppSettings:
             "show_tooltips": True,
             "debug_mode": False,
             "game_path": "",
-            "wem_process_language": "english"
+            "wem_process_language": "english",
+            "audio_cache_mb": 512,
+            "prefetch_count": 2,
+            "export_workers": 0,
+            "conversion_workers": 0,
+            "batch_conversion": True,
+            "conversion_cache_mb": 1024,
+            "parallel_probes": 0
         }
         self.load()
 
@@ -1917,10 +3421,369 @@ class AudioPlayer(QtCore.QObject):
     @property
     def is_playing(self):
         return self.player.state() == QtMultimedia.QMediaPlayer.PlayingState
+class PolyphaseResampler:
+    """Band-limited rational resampler (Kaiser-windowed sinc) working on float arrays of shape (frames, channels).
+
+    Feed blocks through process() and finish with flush() to stream; the filter history is carried between calls.
+    """
+
+    ZERO_CROSSINGS = 16
+    KAISER_BETA = 8.6
+    ROLLOFF = 0.945
+    MAX_PHASES = 1024
+    BLOCK_FRAMES = 65536
+
+    def __init__(self, original_rate, target_rate):
+        divisor = math.gcd(original_rate, target_rate)
+        self.up = target_rate // divisor
+        self.down = original_rate // divisor
+        self.phases = min(self.up, self.MAX_PHASES)
+
+        # Below the original rate the cutoff moves down to the new Nyquist, widening the kernel accordingly
+        scale = min(1.0, target_rate / original_rate) * self.ROLLOFF
+        self.half_width = int(math.ceil(self.ZERO_CROSSINGS / scale))
+        offsets = np.arange(-self.half_width + 1, self.half_width + 1, dtype=np.float64)
+        fractions = np.arange(self.phases, dtype=np.float64) / self.phases
+        distance = fractions[:, None] - offsets[None, :]
+        window = np.i0(self.KAISER_BETA * np.sqrt(np.clip(1.0 - (distance / self.half_width) ** 2, 0.0, 1.0)))
+        kernel = scale * np.sinc(scale * distance) * window / np.i0(self.KAISER_BETA)
+        self.kernel = kernel / kernel.sum(axis=1, keepdims=True)
+        self.taps = 2 * self.half_width
+        self.reset()
+
+    def reset(self):
+        # buffer column 0 is padded input index buffer_start; the first half_width padded samples are leading silence
+        self.buffer = None
+        self.buffer_start = 0
+        self.consumed = 0
+        self.produced = 0
+
+    def output_length(self, frames):
+        return frames * self.up // self.down
+
+    def _append(self, columns):
+        if self.buffer is None:
+            self.buffer = np.zeros((columns.shape[0], self.half_width), dtype=np.float64)
+        self.buffer = np.concatenate((self.buffer, columns), axis=1)
+
+    def _produce(self, limit):
+        """Compute outputs produced..limit-1 from the buffered input, then drop input no longer needed"""
+        count = max(0, limit - self.produced)
+        channels = self.buffer.shape[0]
+        output = np.empty((count, channels), dtype=np.float64)
+        if not count:
+            return output
+        # windows[c, i] is buffer[c, i:i + taps]; window base + 1 is centred on input sample base
+        windows = np.lib.stride_tricks.sliding_window_view(self.buffer, self.taps, axis=1)
+
+        for start in range(0, count, self.BLOCK_FRAMES):
+            positions = np.arange(
+                self.produced + start, self.produced + min(start + self.BLOCK_FRAMES, count), dtype=np.int64
+            ) * self.down
+            base = positions // self.up
+            coefficients = self.kernel[(positions % self.up) * self.phases // self.up]
+            for channel in range(channels):
+                output[start:start + len(base), channel] = np.einsum(
+                    "bt,bt->b", coefficients, windows[channel, base + 1 - self.buffer_start]
+                )
+
+        self.produced += count
+        keep_from = self.produced * self.down // self.up + 1
+        if keep_from > self.buffer_start:
+            self.buffer = self.buffer[:, keep_from - self.buffer_start:].copy()
+            self.buffer_start = keep_from
+        return output
+
+    def process(self, samples):
+        """Consume a (frames, channels) block and return every output frame it completes"""
+        self._append(samples.T)
+        self.consumed += samples.shape[0]
+        ready_end = self.buffer_start + self.buffer.shape[1] - self.taps
+        limit = max(0, -(-ready_end * self.up // self.down))
+        return self._produce(min(limit, self.output_length(self.consumed)))
+
+    def flush(self):
+        """Return the remaining output frames, treating the input as followed by silence"""
+        if self.buffer is None:
+            return np.empty((0, 0), dtype=np.float64)
+        self._append(np.zeros((self.buffer.shape[0], self.taps), dtype=np.float64))
+        return self._produce(self.output_length(self.consumed))
+
+    def resample(self, samples):
+        """Resample a whole (frames, channels) float array; every channel is filtered independently"""
+        self.reset()
+        output = np.concatenate((self.process(samples), self.flush()))
+        self.reset()
+        return output
+
+    @staticmethod
+    def pcm_to_float(frames, sampwidth, channels):
+        """Decode interleaved little-endian PCM (8/16/24/32-bit) to floats in [-1, 1)"""
+        if sampwidth == 1:
+            data = (np.frombuffer(frames, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+        elif sampwidth == 2:
+            data = np.frombuffer(frames, dtype="<i2").astype(np.float64) / 32768.0
+        elif sampwidth == 3:
+            raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+            values = np.where(values >= 0x800000, values - 0x1000000, values)
+            data = values.astype(np.float64) / 8388608.0
+        elif sampwidth == 4:
+            data = np.frombuffer(frames, dtype="<i4").astype(np.float64) / 2147483648.0
+        else:
+            raise ValueError(f"Unsupported sample width: {sampwidth * 8}-bit")
+        return data.reshape(-1, channels)
+
+    @staticmethod
+    def float_to_pcm(samples, sampwidth):
+        """Encode a float array back to interleaved little-endian PCM with rounding and clipping"""
+        flat = samples.reshape(-1)
+        if sampwidth == 1:
+            return np.clip(np.round(flat * 128.0) + 128.0, 0, 255).astype(np.uint8).tobytes()
+        if sampwidth == 2:
+            return np.clip(np.round(flat * 32768.0), -32768, 32767).astype("<i2").tobytes()
+        if sampwidth == 3:
+            values = np.clip(np.round(flat * 8388608.0), -8388608, 8388607).astype("<i4")
+            return values.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+        if sampwidth == 4:
+            return np.clip(np.round(flat * 2147483648.0), -2147483648, 2147483647).astype("<i4").tobytes()
+        raise ValueError(f"Unsupported sample width: {sampwidth * 8}-bit")
+
+class ConversionSizeModel:
+    """Learns WEM output size per Wwise Conversion value from past conversions, persisted in SQLite.
+
+    Sizes are fitted as size = a + b * (duration * channels) per (Conversion, sample rate), falling back to all
+    sample rates for a Conversion value. The last value that fitted each target id is remembered as well.
+    """
+
+    SCHEMA_VERSION = 1
+    MAX_OBSERVATIONS = 20000
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+        self.stats = {}
+        self.last_values = {}
+        self.features = {}
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS observations")
+                self.conn.execute("DROP TABLE IF EXISTS last_values")
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS observations (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    duration REAL,
+                    channels INTEGER,
+                    sample_rate INTEGER,
+                    conversion INTEGER,
+                    size INTEGER
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS last_values (
+                    target_id TEXT PRIMARY KEY,
+                    signature TEXT,
+                    conversion INTEGER,
+                    upper INTEGER
+                )
+            """)
+            self.conn.execute(
+                "DELETE FROM observations WHERE seq <= (SELECT MAX(seq) FROM observations) - ?",
+                (self.MAX_OBSERVATIONS,)
+            )
+            self.conn.commit()
+            for duration, channels, sample_rate, conversion, size in self.conn.execute(
+                "SELECT duration, channels, sample_rate, conversion, size FROM observations"
+            ):
+                self._add(duration * channels, sample_rate, conversion, size)
+            for target_id, signature, conversion, upper in self.conn.execute(
+                "SELECT target_id, signature, conversion, upper FROM last_values"
+            ):
+                self.last_values[target_id] = (signature, conversion, upper)
+            DEBUG.log(f"Conversion size model opened: {db_path} ({len(self.stats)} buckets)")
+        except Exception as e:
+            DEBUG.log(f"Conversion size model not persisted ({db_path}): {e}", "WARNING")
+            self.conn = None
+
+    def _add(self, x, sample_rate, conversion, size):
+        for key in ((conversion, sample_rate), (conversion, None)):
+            sums = self.stats.setdefault(key, [0, 0.0, 0.0, 0.0, 0.0])
+            sums[0] += 1
+            sums[1] += x
+            sums[2] += size
+            sums[3] += x * x
+            sums[4] += x * size
+
+    def wav_features(self, wav_file):
+        """(duration seconds, channels, sample rate) from the WAV header, cached by mtime"""
+        try:
+            mtime_ns = os.stat(wav_file).st_mtime_ns
+            cached = self.features.get(wav_file)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            import wave
+            with wave.open(wav_file, 'rb') as wav:
+                features = (wav.getnframes() / wav.getframerate(), wav.getnchannels(), wav.getframerate())
+            self.features[wav_file] = (mtime_ns, features)
+            return features
+        except Exception as e:
+            DEBUG.log(f"Could not read WAV header of {wav_file}: {e}", "WARNING")
+            return None
+
+    def signature(self, wav_file, features):
+        """Identity of one recording: header features plus a hash of the WAV content, or None if it cannot be read"""
+        duration, channels, sample_rate = features
+        try:
+            # Takes trimmed to the original line's length share every header field, only the samples differ
+            digest = FileDigests.sha1(wav_file)
+        except OSError as e:
+            DEBUG.log(f"Could not hash {wav_file}: {e}", "WARNING")
+            return None
+        return f"{int(duration * 1000)}:{channels}:{sample_rate}:{digest}"
+
+    def record(self, wav_file, conversion, size):
+        """Store one (WAV, Conversion value) -> output size observation"""
+        features = self.wav_features(wav_file)
+        if not features:
+            return
+        duration, channels, sample_rate = features
+        with self.lock:
+            self._add(duration * channels, sample_rate, conversion, size)
+            if self.conn is not None:
+                try:
+                    self.conn.execute(
+                        "INSERT INTO observations (duration, channels, sample_rate, conversion, size) VALUES (?, ?, ?, ?, ?)",
+                        (duration, channels, sample_rate, conversion, size)
+                    )
+                    self.conn.commit()
+                except Exception as e:
+                    DEBUG.log(f"Conversion size model write failed: {e}", "WARNING")
+
+    def _fit(self, features, conversion):
+        duration, channels, sample_rate = features
+        x = duration * channels
+        with self.lock:
+            sums = self.stats.get((conversion, sample_rate)) or self.stats.get((conversion, None))
+            if not sums:
+                return None
+            n, sum_x, sum_y, sum_xx, sum_xy = sums
+        variance = n * sum_xx - sum_x * sum_x
+        if n >= 2 and variance > 1e-9 * max(1.0, sum_xx):
+            slope = (n * sum_xy - sum_x * sum_y) / variance
+            intercept = (sum_y - slope * sum_x) / n
+            return max(0.0, intercept + slope * x)
+        return sum_y / sum_x * x if sum_x else None
+
+    def predict(self, features, conversion):
+        """Predicted output size in bytes, or None when nothing similar was converted yet"""
+        size = self._fit(features, conversion)
+        if size is not None:
+            return size
+        # Unseen Conversion values: sizes grow roughly geometrically, so interpolate log size between fitted neighbours
+        with self.lock:
+            known = sorted(value for value, sample_rate in self.stats if sample_rate is None)
+        lower = [value for value in known if value < conversion]
+        upper = [value for value in known if value > conversion]
+        if lower and upper:
+            a, b = lower[-1], upper[0]
+        elif len(lower) >= 2:
+            a, b = lower[-2], lower[-1]
+        elif len(upper) >= 2:
+            a, b = upper[0], upper[1]
+        else:
+            return None
+        size_a, size_b = self._fit(features, a), self._fit(features, b)
+        if not size_a or not size_b:
+            return None
+        return math.exp(math.log(size_a) + (math.log(size_b) - math.log(size_a)) * (conversion - a) / (b - a))
+
+    def remember(self, target_id, wav_file, conversion, upper):
+        """Remember the Conversion value that fitted target_id; upper is the lowest value found too large"""
+        features = self.wav_features(wav_file)
+        if not target_id or not features:
+            return
+        signature = self.signature(wav_file, features)
+        if not signature:
+            return
+        with self.lock:
+            last = self.last_values.get(target_id)
+            if upper is None and last and last[0] == signature and last[1] == conversion:
+                # A trusted run only probes the remembered value, so it never sees the bound above it again
+                upper = last[2]
+            self.last_values[target_id] = (signature, conversion, upper)
+            if self.conn is not None:
+                try:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO last_values (target_id, signature, conversion, upper) VALUES (?, ?, ?, ?)",
+                        (target_id, signature, conversion, upper)
+                    )
+                    self.conn.commit()
+                except Exception as e:
+                    DEBUG.log(f"Conversion size model write failed: {e}", "WARNING")
+
+    def suggest(self, wav_file, target_size, target_id, values):
+        """Return (first probe, trusted) for a search over values; trusted means the value was already bracketed"""
+        features = self.wav_features(wav_file)
+        if not features:
+            return None, False
+        last = self.last_values.get(target_id) if target_id else None
+        if last and last[1] not in values:
+            last = None
+        if last and last[0] == self.signature(wav_file, features):
+            # The same WAV against the same target: the earlier bracket still holds
+            conversion, upper = last[1], last[2]
+            return conversion, upper == conversion + 1 or conversion == max(values)
+        predictions = [(value, self.predict(features, value)) for value in values]
+        predictions = [(value, size) for value, size in predictions if size is not None]
+        if not predictions:
+            # A different recording for this target still tends to land near the value that fitted last time
+            return (last[1] if last else None), False
+        fitting = [value for value, size in predictions if size <= target_size]
+        return (max(fitting) if fitting else min(value for value, _ in predictions)), False
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+            self.conn = None
+
+class ConversionResultCache(DiskLRUCache):
+    """On-disk LRU of converted WEMs keyed by WAV content, Conversion value and Wwise setup, bounded in bytes"""
+
+    LABEL = "Conversion cache"
+
+    def __init__(self, cache_dir, max_bytes):
+        self.environment = ""
+        super().__init__(cache_dir, max_bytes, ".wem")
+
+    def set_environment(self, environment):
+        """Fingerprint of the Wwise install and project settings; results from another setup never match"""
+        self.environment = environment
+
+    def key_for(self, wav_file, conversion_value):
+        source = f"{FileDigests.sha1(wav_file)}|{conversion_value}|{self.environment}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest() + self.suffix
+
+    def put(self, wav_file, conversion_value, wem_file):
+        """Store a WwiseCLI output under the WAV's content hash"""
+        if self.max_bytes <= 0:
+            return
+        try:
+            name = self.key_for(wav_file, conversion_value)
+            tmp_path = os.path.join(self.cache_dir, f"{name}.{threading.get_ident()}.tmp")
+            shutil.copyfile(wem_file, tmp_path)
+            self.commit(name, tmp_path)
+        except OSError as e:
+            DEBUG.log(f"Could not cache conversion of {os.path.basename(wav_file)}: {e}", "WARNING")
+
 class WavToWemConverter(QtCore.QObject):
     progress_updated = QtCore.pyqtSignal(int)
     status_updated = QtCore.pyqtSignal(str, str) 
     conversion_finished = QtCore.pyqtSignal(list)
+    log_updated = QtCore.pyqtSignal(str)
     
     SUPPORTED_SAMPLE_RATES = [48000, 44100, 36000, 32000, 28000, 24000, 22050, 
                               20000, 18000, 16000, 14000, 12000, 11025, 10000, 8000, 6000]
@@ -1934,15 +3797,37 @@ class WavToWemConverter(QtCore.QObject):
         self.project_path = ""
         self.output_folder = ""
         self.conversion_cache = {}
+        self.cache_lock = threading.Lock()
+        self.output_lock = threading.Lock()
         self.adaptive_mode = False  
+        self.max_workers = 1
+        self.max_probes = 0
+        self.probe_width = 1
+        self.batch_mode = False
+        self.size_model = None
+        self.result_cache = None
+        self.workspace = threading.local()
+        self.stop_event = threading.Event()
+        self.active_futures = []
+        self.state_lock = threading.Lock()
+        self.running = False
+        self.reset_pending = False
          
     def reset_state(self):
-        """Reset converter state after stop or error"""
+        """Reset converter state after stop or error; deferred until convert_all_files returns if jobs are still running"""
+        with self.state_lock:
+            if self.running:
+                self.reset_pending = True
+                DEBUG.log("Converter reset deferred until running jobs exit")
+                return
+            self.reset_pending = False
         self.should_stop = False
+        self.stop_event.clear()
         self.status_updated.emit("Ready", "green")
         
         # IMPORTANT: Clear conversion cache
-        self.conversion_cache.clear()
+        with self.cache_lock:
+            self.conversion_cache.clear()
         DEBUG.log("Conversion cache cleared")
         
         # Clean up any temporary files
@@ -1972,11 +3857,28 @@ class WavToWemConverter(QtCore.QObject):
         """Enable or disable adaptive conversion mode"""
         self.adaptive_mode = enabled
         
+    def set_max_workers(self, count):
+        """Number of files converted at once; 0 uses one per CPU core"""
+        self.max_workers = count or os.cpu_count() or 1
+        
+    def set_max_probes(self, count):
+        """Conversion values tried at once for one file; 0 uses the workers left over per file"""
+        self.max_probes = count
+        
+    def set_batch_mode(self, enabled):
+        """Convert all pending files of a search round in one WwiseCLI run (strict mode only)"""
+        self.batch_mode = enabled
+        
+    def log_conversion(self, message):
+        """Queue a line for the conversion log; safe to call from worker threads"""
+        self.log_updated.emit(message)
+        
     def set_paths(self, wwise_path, project_path, output_folder):
         self.wwise_path = wwise_path
         self.project_path = project_path
         self.output_folder = output_folder
-        self.conversion_cache.clear()
+        with self.cache_lock:
+            self.conversion_cache.clear()
     def add_file_pair(self, wav_file, target_wem):
         if not os.path.exists(wav_file) or not os.path.exists(target_wem):
             return False
@@ -2067,72 +3969,48 @@ class WavToWemConverter(QtCore.QObject):
             DEBUG.log(f"Work unit file not found in data directory: {data_wwu_path}", "ERROR")
             
     def resample_wav_file(self, input_wav, output_wav, target_sample_rate):
-        """Resample WAV file to target sample rate using simple Python audio libraries"""
+        """Resample WAV file to target sample rate, streaming fixed-size blocks through a polyphase filter"""
         try:
             import wave
-            import struct
-            import array
             
             with wave.open(input_wav, 'rb') as wav_in:
                 params = wav_in.getparams()
-                frames = wav_in.readframes(params.nframes)
-                
                 original_rate = params.framerate
                 
                 if original_rate == target_sample_rate:
-              
                     shutil.copy2(input_wav, output_wav)
                     return True
-                
-
-                if params.sampwidth == 1:
-                    fmt = 'B' 
-                    samples = array.array(fmt, frames)
-                elif params.sampwidth == 2:
-                    fmt = 'h'  
-                    samples = array.array(fmt, frames)
-                elif params.sampwidth == 4:
-                    fmt = 'i'  
-                    samples = array.array(fmt, frames)
-                else:
-               
-                    shutil.copy2(input_wav, output_wav)
-                    return False
-                
-      
-                ratio = target_sample_rate / original_rate
-                new_length = int(len(samples) * ratio / params.nchannels) * params.nchannels
-                
-               
-                resampled = array.array(fmt)
-                
-                for i in range(new_length):
-                
-                    orig_pos = i / ratio
-                    orig_idx = int(orig_pos)
                     
-                    if orig_idx < len(samples) - 1:
-           
-                        frac = orig_pos - orig_idx
-                        val = samples[orig_idx] * (1 - frac) + samples[orig_idx + 1] * frac
-                        resampled.append(int(val))
-                    elif orig_idx < len(samples):
-                        resampled.append(samples[orig_idx])
-                    else:
-                        resampled.append(0)
+                resampler = PolyphaseResampler(original_rate, target_sample_rate)
+                stopped = False
                 
                 with wave.open(output_wav, 'wb') as wav_out:
-                    wav_out.setparams((
-                        params.nchannels,
-                        params.sampwidth,
-                        target_sample_rate,
-                        len(resampled) // params.nchannels,
-                        params.comptype,
-                        params.compname
-                    ))
-                    wav_out.writeframes(resampled.tobytes())
+                    wav_out.setnchannels(params.nchannels)
+                    wav_out.setsampwidth(params.sampwidth)
+                    wav_out.setframerate(target_sample_rate)
+                    
+                    while True:
+                        if self.should_stop:
+                            stopped = True
+                            break
+                        frames = wav_in.readframes(PolyphaseResampler.BLOCK_FRAMES)
+                        if not frames:
+                            break
+                        block = PolyphaseResampler.pcm_to_float(frames, params.sampwidth, params.nchannels)
+                        wav_out.writeframes(PolyphaseResampler.float_to_pcm(resampler.process(block), params.sampwidth))
+                        
+                    if not stopped:
+                        wav_out.writeframes(PolyphaseResampler.float_to_pcm(resampler.flush(), params.sampwidth))
                 
-                return True
+            if stopped:
+                DEBUG.log(f"Resampling of {os.path.basename(input_wav)} stopped by user")
+                try:
+                    os.remove(output_wav)
+                except OSError:
+                    pass
+                return False
+                
+            return True
                 
         except Exception as e:
             DEBUG.log(f"Resampling error: {e}", "ERROR")
@@ -2141,24 +4019,117 @@ class WavToWemConverter(QtCore.QObject):
             return False
             
     def create_wsources_file(self, path, wav_file, conversion_value=10):
+        self.create_batch_wsources_file(path, [(wav_file, conversion_value)])
+        
+    def create_batch_wsources_file(self, path, sources):
+        """Write one ExternalSourcesList holding every (wav_file, conversion_value) source"""
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        wav_path = os.path.normpath(wav_file)
+        source_lines = "\n".join(
+            f'    <Source Path="{os.path.normpath(wav_file)}" Conversion="{conversion_value}"/>'
+            for wav_file, conversion_value in sources
+        )
         
         xml_content = f'''<?xml version="1.0" encoding="utf-8"?>
 <ExternalSourcesList SchemaVersion="1" Root="{script_dir}">
-    <Source Path="{wav_path}" Conversion="{conversion_value}"/>
+{source_lines}
 </ExternalSourcesList>'''
         
         with open(path, 'w', encoding='utf-8') as f:
             f.write(xml_content)
             
-    def convert_with_quality(self, wav_file, conversion_value):
-        """Convert with detailed size logging"""
-        cache_key = f"{wav_file}_{conversion_value}"
-        if cache_key in self.conversion_cache:
-            cached_result = self.conversion_cache[cache_key]
-            DEBUG.log(f"Using cached result for Conversion={conversion_value}: {cached_result['size']:,} bytes")
-            return cached_result
+    def run_wwise_cli(self, wsources_path, output_dir, cancel_event=None):
+        """Run WwiseCLI -ConvertExternalSources for a wsources file; returns None if cancel_event or Stop killed it"""
+        wwisecli_path = os.path.normpath(os.path.join(
+            self.wwise_path, "Authoring", "x64", "Release", "bin", "WwiseCLI.exe"
+        ))
+        
+        project_dir = os.path.normpath(self.project_path)
+        project_name = os.path.basename(project_dir)
+        wproj_path = os.path.normpath(os.path.join(project_dir, f"{project_name}.wproj"))
+        
+        cmd = [
+            wwisecli_path, wproj_path, "-ConvertExternalSources", "Windows",
+            wsources_path, "-ExternalSourcesOutput", output_dir, "-Quiet"
+        ]
+        
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=False, creationflags=CREATE_NO_WINDOW
+        )
+        finished = threading.Event()
+        killed = threading.Event()
+        
+        def watch():
+            # Polling from a side thread keeps communicate() blocking, so normal runs return as soon as WwiseCLI exits
+            while not finished.wait(0.1):
+                if self.stop_event.is_set() or (cancel_event is not None and cancel_event.is_set()):
+                    killed.set()
+                    process.kill()
+                    return
+                    
+        threading.Thread(target=watch, daemon=True).start()
+        try:
+            stdout, stderr = process.communicate()
+        finally:
+            finished.set()
+        if killed.is_set():
+            return None
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        
+    def conversion_environment(self):
+        """Fingerprint of what shapes WwiseCLI output besides the WAV: WwiseCLI build, project and conversion settings"""
+        wwisecli_path = os.path.normpath(os.path.join(
+            self.wwise_path, "Authoring", "x64", "Release", "bin", "WwiseCLI.exe"
+        ))
+        project_dir = os.path.normpath(self.project_path)
+        project_name = os.path.basename(project_dir)
+        parts = []
+        try:
+            stat = os.stat(wwisecli_path)
+            parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append("-")
+        for path in (os.path.join(project_dir, f"{project_name}.wproj"),
+                     os.path.join(project_dir, "Conversion Settings", "Default Work Unit.wwu")):
+            try:
+                with open(path, 'rb') as f:
+                    parts.append(hashlib.sha1(f.read()).hexdigest())
+            except OSError:
+                parts.append("-")
+        return "|".join(parts)
+        
+    def load_cached_conversion(self, wav_file, conversion_value, temp_dir):
+        """Copy a persistent cache hit into the job workspace and return its result dict, or None"""
+        if not self.result_cache:
+            return None
+        cached_path = self.result_cache.get(wav_file, conversion_value)
+        if not cached_path:
+            return None
+        fd, wem_file = tempfile.mkstemp(prefix="cached_", suffix=".wem", dir=temp_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(cached_path, wem_file)
+        except OSError as e:
+            DEBUG.log(f"Could not read cached conversion {cached_path}: {e}", "WARNING")
+            return None
+        
+        file_size = os.path.getsize(wem_file)
+        DEBUG.log(f"Reusing cached conversion of {os.path.basename(wav_file)} at Conversion={conversion_value}: {file_size:,} bytes")
+        self.log_conversion(f"    ♻ {os.path.basename(wav_file)} Conversion={conversion_value} → {file_size:,} bytes (cached)")
+        result_data = {
+            'file': wem_file,
+            'size': file_size,
+            'dir': temp_dir,
+            'conversion': conversion_value
+        }
+        with self.cache_lock:
+            self.conversion_cache[f"{wav_file}_{conversion_value}"] = result_data
+        return result_data
+            
+    def get_workspace(self):
+        """Return (output dir, wsources path) for the job running on this thread"""
+        temp_dir = getattr(self.workspace, "temp_dir", None)
+        if temp_dir:
+            return temp_dir, os.path.join(temp_dir, "convert.wsources")
             
         script_dir = os.path.dirname(os.path.abspath(__file__))
         temp_dir = os.path.join(script_dir, "temp_conversion")
@@ -2166,36 +4137,40 @@ class WavToWemConverter(QtCore.QObject):
         
         data_dir = os.path.join(script_dir, "data")
         os.makedirs(data_dir, exist_ok=True)
-        wsources_path = os.path.join(data_dir, "convert.wsources")
+        return temp_dir, os.path.join(data_dir, "convert.wsources")
+        
+    def convert_with_quality(self, wav_file, conversion_value):
+        """Convert with detailed size logging"""
+        cache_key = f"{wav_file}_{conversion_value}"
+        with self.cache_lock:
+            cached_result = self.conversion_cache.get(cache_key)
+        if cached_result:
+            DEBUG.log(f"Using cached result for Conversion={conversion_value}: {cached_result['size']:,} bytes")
+            return cached_result
+            
+        temp_dir, wsources_path = self.get_workspace()
+        
+        cached_result = self.load_cached_conversion(wav_file, conversion_value, temp_dir)
+        if cached_result:
+            return cached_result
         
         wav_size = os.path.getsize(wav_file)
         wav_name = os.path.basename(wav_file)
         DEBUG.log(f"Converting {wav_name} (input size: {wav_size:,} bytes) with Conversion={conversion_value}")
      
-        if hasattr(self.parent, 'append_conversion_log'):
-            self.parent.append_conversion_log(f"  → Testing Conversion={conversion_value} for {wav_name} (input: {wav_size:,} bytes)")
+        self.log_conversion(f"  → Testing Conversion={conversion_value} for {wav_name} (input: {wav_size:,} bytes)")
         
         self.create_wsources_file(wsources_path, wav_file, conversion_value)
         
-        wwisecli_path = os.path.normpath(os.path.join(
-            self.wwise_path, "Authoring", "x64", "Release", "bin", "WwiseCLI.exe"
-        ))
-        
-        project_dir = os.path.normpath(self.project_path)
-        project_name = os.path.basename(project_dir)
-        wproj_path = os.path.normpath(os.path.join(project_dir, f"{project_name}.wproj"))
-        
-        cmd = [
-            wwisecli_path, wproj_path, "-ConvertExternalSources", "Windows",
-            wsources_path, "-ExternalSourcesOutput", temp_dir, "-Quiet"
-        ]
+        result = self.run_wwise_cli(wsources_path, temp_dir, getattr(self.workspace, "cancel_event", None))
         
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=False, creationflags=CREATE_NO_WINDOW)
+        if result is None:
+            DEBUG.log(f"Conversion={conversion_value} for {wav_name} cancelled")
+            return None
         
         if result.returncode != 0:
             DEBUG.log(f"Conversion failed for Conversion={conversion_value}: {result.stderr}", "ERROR")
-            if hasattr(self.parent, 'append_conversion_log'):
-                self.parent.append_conversion_log(f"    ✗ Conversion={conversion_value} failed: {result.stderr}")
+            self.log_conversion(f"    ✗ Conversion={conversion_value} failed: {result.stderr}")
             raise Exception(f"Conversion error: {result.stderr}")
         
         wav_name_no_ext = os.path.splitext(wav_name)[0]
@@ -2205,9 +4180,12 @@ class WavToWemConverter(QtCore.QObject):
             file_size = os.path.getsize(wem_file)
             
             DEBUG.log(f"SUCCESS: Conversion={conversion_value} produced {file_size:,} bytes (ratio: {file_size/wav_size:.2f}x)")
+            if self.size_model:
+                self.size_model.record(wav_file, conversion_value, file_size)
+            if self.result_cache:
+                self.result_cache.put(wav_file, conversion_value, wem_file)
                    
-            if hasattr(self.parent, 'append_conversion_log'):
-                self.parent.append_conversion_log(f"    ✓ Conversion={conversion_value} → {file_size:,} bytes")
+            self.log_conversion(f"    ✓ Conversion={conversion_value} → {file_size:,} bytes")
             
             result_data = {
                 'file': wem_file,
@@ -2215,12 +4193,12 @@ class WavToWemConverter(QtCore.QObject):
                 'dir': temp_dir,
                 'conversion': conversion_value
             }
-            self.conversion_cache[cache_key] = result_data
+            with self.cache_lock:
+                self.conversion_cache[cache_key] = result_data
             return result_data
         else:
             DEBUG.log(f"No WEM file found after conversion with Conversion={conversion_value}", "ERROR")
-            if hasattr(self.parent, 'append_conversion_log'):
-                self.parent.append_conversion_log(f"    ✗ Conversion={conversion_value} - no output file")
+            self.log_conversion(f"    ✗ Conversion={conversion_value} - no output file")
                 
         return None
 
@@ -2235,6 +4213,80 @@ class WavToWemConverter(QtCore.QObject):
                 return path
         return None
         
+    def convert_batch_with_quality(self, requests):
+        """Convert (wav_file, conversion_value) requests with one WwiseCLI run per batch; returns {request: result or None}"""
+        results = {}
+        pending = []
+        temp_root, _ = self.get_workspace()
+        for request in requests:
+            with self.cache_lock:
+                cached_result = self.conversion_cache.get(f"{request[0]}_{request[1]}")
+            if not cached_result:
+                cached_result = self.load_cached_conversion(request[0], request[1], temp_root)
+            if cached_result:
+                results[request] = cached_result
+            else:
+                pending.append(request)
+                
+        while pending:
+            # WwiseCLI names outputs after the WAV, so a batch may hold each file name only once
+            batch, names, deferred = [], set(), []
+            for request in pending:
+                wav_name_no_ext = os.path.splitext(os.path.basename(request[0]))[0].lower()
+                if wav_name_no_ext in names:
+                    deferred.append(request)
+                else:
+                    names.add(wav_name_no_ext)
+                    batch.append(request)
+            pending = deferred
+            
+            batch_dir = tempfile.mkdtemp(prefix="batch_", dir=temp_root)
+            wsources_path = os.path.join(batch_dir, "convert.wsources")
+            self.create_batch_wsources_file(wsources_path, batch)
+            
+            DEBUG.log(f"Converting {len(batch)} sources in one WwiseCLI run")
+            self.log_conversion(f"  → Batch of {len(batch)} files: " + ", ".join(
+                f"{os.path.basename(wav_file)}@{conversion_value}" for wav_file, conversion_value in batch
+            ))
+            
+            result = self.run_wwise_cli(wsources_path, batch_dir)
+            if result is None:
+                DEBUG.log("Batch conversion stopped by user")
+                return results
+            if result.returncode != 0:
+                # One bad source fails the whole run, but the other sources' outputs are still valid
+                DEBUG.log(f"Batch conversion of {len(batch)} sources returned {result.returncode}: {result.stderr}", "ERROR")
+                self.log_conversion(f"    ✗ Batch of {len(batch)} files reported errors: {result.stderr}")
+                
+            for wav_file, conversion_value in batch:
+                wav_name = os.path.basename(wav_file)
+                wem_file = self.find_wem_file(batch_dir, os.path.splitext(wav_name)[0])
+                
+                if not wem_file:
+                    DEBUG.log(f"No WEM file found for {wav_name} after batch conversion with Conversion={conversion_value}", "ERROR")
+                    results[(wav_file, conversion_value)] = None
+                    continue
+                    
+                file_size = os.path.getsize(wem_file)
+                DEBUG.log(f"SUCCESS: {wav_name} Conversion={conversion_value} produced {file_size:,} bytes")
+                if self.size_model:
+                    self.size_model.record(wav_file, conversion_value, file_size)
+                if self.result_cache:
+                    self.result_cache.put(wav_file, conversion_value, wem_file)
+                self.log_conversion(f"    ✓ {wav_name} Conversion={conversion_value} → {file_size:,} bytes")
+                
+                result_data = {
+                    'file': wem_file,
+                    'size': file_size,
+                    'dir': batch_dir,
+                    'conversion': conversion_value
+                }
+                with self.cache_lock:
+                    self.conversion_cache[f"{wav_file}_{conversion_value}"] = result_data
+                results[(wav_file, conversion_value)] = result_data
+                
+        return results
+        
     def increase_file_size(self, file_path, target_size_bytes):
         """Simple file size increase with logging"""
         if not os.path.exists(file_path):
@@ -2356,14 +4408,16 @@ class WavToWemConverter(QtCore.QObject):
                 wav_name = os.path.splitext(os.path.basename(wav_file))[0]
                 
                 DEBUG.log(f"Starting conversion for {wav_name} (target: {target_size:,} bytes)")
-                return self.try_conversion_with_binary_search(wav_file, target_size, file_index, total_files, wav_name)
+                return self.try_conversion_with_binary_search(
+                    wav_file, target_size, file_index, total_files, wav_name, os.path.splitext(file_pair['target_name'])[0]
+                )
         
         except Exception as e:
             DEBUG.log(f"Error in convert_single_file_main: {e}", "ERROR")
             return {'success': False, 'error': f'Conversion error: {str(e)}'}
     
     def convert_single_file_adaptive(self, file_pair, file_index, total_files):
-        """Adaptive conversion with sample rate adjustment"""
+        """Adaptive conversion: the highest sample rate whose minimum quality fits, then the best quality at that rate"""
         if self.should_stop:
             return {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
         
@@ -2371,41 +4425,59 @@ class WavToWemConverter(QtCore.QObject):
             wav_file = file_pair['wav_file']
             target_size = file_pair['target_size']
             wav_name = os.path.splitext(os.path.basename(wav_file))[0]
+            target_id = os.path.splitext(file_pair['target_name'])[0]
             
             DEBUG.log(f"Starting adaptive conversion for {wav_name}")
             
             original_sample_rate = self.get_wav_sample_rate(wav_file)
             DEBUG.log(f"Original sample rate: {original_sample_rate}Hz")
             
-            try:
-                result = self.try_conversion_with_binary_search(wav_file, target_size, file_index, total_files, wav_name)
-                if result.get('success'):
-                    result['resampled'] = False
-                    result['sample_rate'] = original_sample_rate
-                    result['conversion'] = f"{original_sample_rate}Hz (original)"
-                    return result
-            except Exception as e:
-                DEBUG.log(f"Original quality conversion failed: {e}")
+            # Size grows with both sample rate and Conversion, so Conversion=-2 at the original rate decides
+            # whether that rate can fit at all; skip the check when the size model already expects it to
+            known = []
+            search_original = True
+            features = self.size_model.wav_features(wav_file) if self.size_model else None
+            predicted = self.size_model.predict(features, -2) if features else None
+            if predicted is None or predicted > target_size:
+                try:
+                    minimum = self.convert_with_quality(wav_file, -2)
+                    if minimum and minimum.get('size'):
+                        if minimum['size'] <= target_size:
+                            known.append((-2, minimum))
+                        else:
+                            DEBUG.log(f"Minimum size at {original_sample_rate}Hz is {minimum['size']:,} bytes, skipping to sample rate search")
+                            search_original = False
+                except Exception as e:
+                    DEBUG.log(f"Minimum quality check failed: {e}")
             
-            optimal_rate_idx = self.find_optimal_sample_rate(wav_file, target_size, file_index, total_files, wav_name)
+            if search_original:
+                try:
+                    result = self.try_conversion_with_binary_search(
+                        wav_file, target_size, file_index, total_files, wav_name, target_id, known
+                    )
+                    if result.get('success'):
+                        result['resampled'] = False
+                        result['sample_rate'] = original_sample_rate
+                        result['conversion'] = f"{original_sample_rate}Hz (original)"
+                        return result
+                except Exception as e:
+                    DEBUG.log(f"Original quality conversion failed: {e}")
             
-            if optimal_rate_idx >= 0:
-                optimal_rate = self.SUPPORTED_SAMPLE_RATES[optimal_rate_idx]
+            # Resampled intermediates are kept until the file is done so the quality search reuses them
+            resampled = {}
+            try:
+                optimal_rate, minimum = self.find_optimal_sample_rate(
+                    wav_file, target_size, file_index, total_files, wav_name, resampled
+                )
+                if self.should_stop:
+                    return {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
                 
-                if optimal_rate < original_sample_rate: 
+                if optimal_rate is not None:
                     DEBUG.log(f"Using reduced sample rate: {optimal_rate}Hz (from {original_sample_rate}Hz)")
                     
-                    temp_wav = os.path.join(self.output_folder, f"resampled_{wav_name}_{optimal_rate}.wav")
-                    if not self.resample_wav_file(wav_file, temp_wav, optimal_rate):
-                        return {'success': False, 'error': 'Failed to resample audio file'}
-                    
-                    result = self.try_conversion_with_binary_search(temp_wav, target_size, file_index, total_files, wav_name)
-                    
-                    if os.path.exists(temp_wav):
-                        try:
-                            os.remove(temp_wav)
-                        except:
-                            pass
+                    result = self.try_conversion_with_binary_search(
+                        resampled[optimal_rate], target_size, file_index, total_files, wav_name, target_id, [(-2, minimum)]
+                    )
                     
                     if result.get('success'):
                         result['resampled'] = True
@@ -2413,33 +4485,73 @@ class WavToWemConverter(QtCore.QObject):
                         result['conversion'] = f"{original_sample_rate}Hz → {optimal_rate}Hz"
                     
                     return result
-                else:
-                    DEBUG.log(f"Optimal rate {optimal_rate}Hz is not lower than original {original_sample_rate}Hz")
+            finally:
+                for temp_wav in resampled.values():
+                    try:
+                        os.remove(temp_wav)
+                    except:
+                        pass
             
             return {'success': False, 'error': 'Could not find suitable sample rate for target size'}
             
         except Exception as e:
             DEBUG.log(f"Error in adaptive conversion: {e}", "ERROR")
             return {'success': False, 'error': f'Adaptive conversion error: {str(e)}'}
-    def find_optimal_sample_rate(self, wav_file, target_size, file_index, total_files, wav_name):
-        """Binary search to find optimal sample rate for target size"""
+            
+    @staticmethod
+    def estimate_sample_rate(points, target_size):
+        """Sample rate at which the Conversion=-2 size meets target_size, from a power law through measured (rate, size) points"""
+        if not points:
+            return None
+        if len(points) == 1:
+            sample_rate, size = points[0]
+            return sample_rate * target_size / size
+        too_large = [point for point in points if point[1] > target_size]
+        fitting = [point for point in points if point[1] <= target_size]
+        if too_large and fitting:
+            (rate_a, size_a), (rate_b, size_b) = min(too_large), max(fitting)
+        else:
+            (rate_a, size_a), (rate_b, size_b) = sorted(points, key=lambda point: abs(math.log(point[1] / target_size)))[:2]
+        if rate_a == rate_b or size_a == size_b:
+            return None
+        exponent = math.log(size_a / size_b) / math.log(rate_a / rate_b)
+        if exponent <= 0:
+            return None
+        return rate_a * (target_size / size_a) ** (1 / exponent)
+        
+    def find_optimal_sample_rate(self, wav_file, target_size, file_index, total_files, wav_name, resampled):
+        """Highest rate below the original that fits at Conversion=-2, as (rate, result) or (None, None); fills resampled with rate -> WAV"""
         
         original_sample_rate = self.get_wav_sample_rate(wav_file)
-        DEBUG.log(f"Original sample rate: {original_sample_rate}Hz")
         
-        valid_rates = [rate for rate in self.SUPPORTED_SAMPLE_RATES if rate <= original_sample_rate]
+        valid_rates = [rate for rate in self.SUPPORTED_SAMPLE_RATES if rate < original_sample_rate]
         
         if not valid_rates:
             DEBUG.log(f"No valid sample rates found for original rate {original_sample_rate}Hz")
-            return -1
+            return None, None
         
         DEBUG.log(f"Valid sample rates for search: {valid_rates}")
         
+        # Measured (sample rate, size at Conversion=-2) points; the original rate's size is already cached
+        points = []
+        try:
+            minimum = self.convert_with_quality(wav_file, -2)
+            if minimum and minimum.get('size'):
+                points.append((original_sample_rate, minimum['size']))
+        except Exception as e:
+            DEBUG.log(f"Error reading minimum size at {original_sample_rate}Hz: {e}", "ERROR")
+        
         left, right = 0, len(valid_rates) - 1
-        best_idx = -1
+        best = (None, None)
+        estimates = 0
         
-        while left <= right:
+        while left <= right and not self.should_stop:
             mid = (left + right) // 2
+            # Interpolate the boundary from the measured sizes; plain bisection takes over if that keeps missing
+            estimate = self.estimate_sample_rate(points, target_size) if estimates < 3 else None
+            if estimate is not None:
+                estimates += 1
+                mid = next((i for i in range(left, right + 1) if valid_rates[i] <= estimate), right)
             sample_rate = valid_rates[mid]
             
             self.status_updated.emit(
@@ -2447,109 +4559,295 @@ class WavToWemConverter(QtCore.QObject):
                 "blue"
             )
             
-            temp_wav = os.path.join(self.output_folder, f"test_{wav_name}_{sample_rate}.wav")
-            if not self.resample_wav_file(wav_file, temp_wav, sample_rate):
-                left = mid + 1
-                continue
+            temp_wav = resampled.get(sample_rate)
+            if temp_wav is None:
+                temp_wav = os.path.join(self.get_workspace()[0], f"resampled_{wav_name}_{sample_rate}.wav")
+                resampled[sample_rate] = temp_wav
+                if not self.resample_wav_file(wav_file, temp_wav, sample_rate):
+                    left = mid + 1
+                    continue
             
             try:
-                result = self.convert_with_quality(temp_wav, -2)  
-                
-                if result and result['size'] <= target_size:
-                    best_idx = mid
-                    right = mid - 1 
-                else:
-                    left = mid + 1
-                    
+                result = self.convert_with_quality(temp_wav, -2)
             except Exception as e:
                 DEBUG.log(f"Error testing sample rate {sample_rate}: {e}", "ERROR")
+                result = None
+                
+            if result and result.get('size'):
+                points.append((sample_rate, result['size']))
+                
+            if result and result.get('size') and result['size'] <= target_size:
+                best = (sample_rate, result)
+                right = mid - 1
+            else:
                 left = mid + 1
-            finally:
+        
+        if best[0] is not None:
+            DEBUG.log(f"Found optimal sample rate: {best[0]}Hz (original: {original_sample_rate}Hz)")
+        
+        return best
+    def start_binary_search(self, wav_file, target_size, wav_name, target_id=None, known=None):
+        """Return the search state for one file: bracket [-2, 10] narrowed by known (value, result) pairs, best result, attempt history and predicted probes"""
+        state = {
+            'wav_file': wav_file,
+            'target_size': target_size,
+            'wav_name': wav_name,
+            'target_id': target_id,
+            'left': -2,
+            'right': 10,
+            'best_result': None,
+            'best_dir': None,
+            'attempts': 0,
+            'all_attempts': [],
+            'hints': [],
+            'guided': False,
+            'trusted': None
+        }
+        
+        DEBUG.log(f"\n=== BINARY SEARCH START for {wav_name} ===")
+        DEBUG.log(f"Target size: {target_size:,} bytes")
+        DEBUG.log(f"Search range: [{state['left']}, {state['right']}]")
+        
+        self.log_conversion(f"\n📊 Binary search for {wav_name}:")
+        self.log_conversion(f"   Target size: {target_size:,} bytes")
+        
+        for value, result in known or ():
+            self.update_binary_search(state, value, result)
+        
+        if self.size_model:
+            first_probe, trusted = self.size_model.suggest(
+                wav_file, target_size, target_id, range(state['left'], state['right'] + 1)
+            )
+            if first_probe is not None:
+                state['hints'] = [first_probe]
+                state['guided'] = True
+                state['trusted'] = first_probe if trusted else None
+                DEBUG.log(f"Predicted first probe: Conversion={first_probe}{' (remembered)' if trusted else ''}")
+                self.log_conversion(f"   Predicted Conversion={first_probe}{' (remembered)' if trusted else ''}")
+        return state
+        
+    def next_probe(self, state):
+        """Next Conversion value to try: the predicted boundary and its neighbour first, then plain bisection"""
+        while state['hints']:
+            hint = state['hints'].pop(0)
+            if state['left'] <= hint <= state['right']:
+                return hint
+        return (state['left'] + state['right']) // 2
+        
+    def update_binary_search(self, state, mid, result, error=None):
+        """Narrow the search bracket from the result (or error) of converting at Conversion=mid"""
+        if error is not None:
+            DEBUG.log(f"  → ERROR: {error}", "ERROR")
+            state['all_attempts'].append({'conversion': mid, 'size': None, 'status': 'error', 'error': str(error)})
+            state['right'] = mid - 1
+            return
+            
+        if not result or not result.get('size'):
+            DEBUG.log(f"  → No result for Conversion={mid}")
+            state['all_attempts'].append({'conversion': mid, 'size': None, 'status': 'failed'})
+            state['right'] = mid - 1
+            return
+            
+        target_size = state['target_size']
+        current_size = result['size']
+        size_ratio = current_size / target_size
+        
+        DEBUG.log(f"  → Result: {current_size:,} bytes ({size_ratio:.1%} of target)")
+        
+        attempt_info = {
+            'conversion': mid,
+            'size': current_size,
+            'ratio': size_ratio,
+            'status': 'ok' if current_size <= target_size else 'too_large'
+        }
+        state['all_attempts'].append(attempt_info)
+        
+        if current_size <= target_size:
+            DEBUG.log(f"  → Acceptable size! Saving as best result")
+            
+            if not state['best_dir']:
+                # Searches sharing a lockstep group or running side by side may convert WAVs with the same name
+                state['best_dir'] = tempfile.mkdtemp(prefix="best_", dir=self.get_workspace()[0])
+            temp_best_file = os.path.join(state['best_dir'], f"best_{state['wav_name']}_{mid}.wem")
+            shutil.copy2(result['file'], temp_best_file)
+            
+            previous_best = state['best_result']
+            if previous_best and previous_best['file'] != temp_best_file:
                 try:
-                    os.remove(temp_wav)
+                    os.remove(previous_best['file'])
                 except:
                     pass
+            
+            state['best_result'] = {
+                'file': temp_best_file, 
+                'size': current_size,
+                'conversion': mid
+            }
+            
+            DEBUG.log(f"  → Copied best result to: {temp_best_file}")
+            
+            state['left'] = mid + 1 
+            if mid == state['trusted']:
+                state['right'] = mid
+        else:
+            DEBUG.log(f"  → Too large! Reducing quality")
+            state['right'] = mid - 1
+            
+        if state['guided']:
+            # Confirm the predicted boundary from the other side; a miss falls through to bisection
+            state['guided'] = False
+            state['hints'].append(mid + 1 if current_size <= target_size else mid - 1)
+            
+    def pick_probes(self, state, width):
+        """Up to width Conversion values splitting the bracket evenly, predicted ones first"""
+        left, right = state['left'], state['right']
+        if state['trusted'] is not None and left <= state['trusted'] <= right:
+            return [state['trusted']]
+        probes = [hint for hint in state['hints'] if left <= hint <= right][:width]
+        state['hints'] = []
+        count = right - left + 1
+        for i in range(1, width + 1):
+            if len(probes) >= width:
+                break
+            value = left - 1 + (i * (count + 1)) // (width + 1)
+            if left <= value <= right and value not in probes:
+                probes.append(value)
+        return sorted(probes)
+        
+    def convert_probe(self, wav_file, conversion_value, temp_root, cancel_event):
+        """Convert one speculative probe in its own directory so several can run for the same WAV"""
+        self.workspace.temp_dir = tempfile.mkdtemp(prefix=f"probe{conversion_value}_", dir=temp_root)
+        self.workspace.cancel_event = cancel_event
+        try:
+            return self.convert_with_quality(wav_file, conversion_value)
+        finally:
+            self.workspace.temp_dir = None
+            self.workspace.cancel_event = None
+            
+    def run_parallel_probes(self, state, file_index, total_files):
+        """One k-ary search round: convert several values at once and narrow the bracket from every result"""
+        probes = self.pick_probes(state, self.probe_width)
+        state['attempts'] += len(probes)
         
-        if best_idx >= 0:
-            best_rate = valid_rates[best_idx]
-            original_idx = self.SUPPORTED_SAMPLE_RATES.index(best_rate)
-            DEBUG.log(f"Found optimal sample rate: {best_rate}Hz (original: {original_sample_rate}Hz)")
-            return original_idx
+        DEBUG.log(f"\nRound of {len(probes)} parallel probes: Conversion={probes} (range: [{state['left']}, {state['right']}])")
+        self.status_updated.emit(
+            f"File {file_index}/{total_files}: {state['wav_name']} - probing Conversion={', '.join(map(str, probes))}",
+            "blue"
+        )
         
-        return -1
-    def try_conversion_with_binary_search(self, wav_file, target_size, file_index, total_files, wav_name):
+        temp_root, _ = self.get_workspace()
+        cancel_events = {value: threading.Event() for value in probes}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {
+                executor.submit(self.convert_probe, state['wav_file'], value, temp_root, cancel_events[value]): value
+                for value in probes
+            }
+            for future in concurrent.futures.as_completed(futures):
+                value = futures[future]
+                if not state['left'] <= value <= state['right']:
+                    # Another probe already settled this side of the bracket
+                    continue
+                try:
+                    self.update_binary_search(state, value, future.result())
+                except Exception as e:
+                    self.update_binary_search(state, value, None, e)
+                    
+                for other_future, other in futures.items():
+                    if not other_future.done() and not state['left'] <= other <= state['right'] and not cancel_events[other].is_set():
+                        DEBUG.log(f"  → Cancelling probe Conversion={other}")
+                        cancel_events[other].set()
+                        
+    def try_conversion_with_binary_search(self, wav_file, target_size, file_index, total_files, wav_name, target_id=None, known=None):
         """Binary search with file copy to prevent cache corruption"""
-        left, right = -2, 10
-        best_result = None
-        attempts = 0
-        
-        DEBUG.log(f"\n=== BINARY SEARCH START for {wav_name} ===")
-        DEBUG.log(f"Target size: {target_size:,} bytes")
-        DEBUG.log(f"Search range: [{left}, {right}]")
-        
-        if hasattr(self.parent, 'append_conversion_log'):
-            self.parent.append_conversion_log(f"\n📊 Binary search for {wav_name}:")
-            self.parent.append_conversion_log(f"   Target size: {target_size:,} bytes")
-        
-        all_attempts = []
+        state = self.start_binary_search(wav_file, target_size, wav_name, target_id, known)
         
-        while left <= right:
-            mid = (left + right) // 2
-            attempts += 1
+        while state['left'] <= state['right']:
+            if self.should_stop:
+                return {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
+            if self.probe_width > 1:
+                self.run_parallel_probes(state, file_index, total_files)
+                continue
+                
+            mid = self.next_probe(state)
+            state['attempts'] += 1
             
-            DEBUG.log(f"\nAttempt {attempts}: Testing Conversion={mid} (range: [{left}, {right}])")
+            DEBUG.log(f"\nAttempt {state['attempts']}: Testing Conversion={mid} (range: [{state['left']}, {state['right']}])")
             
             self.status_updated.emit(
-                f"File {file_index}/{total_files}: {wav_name} - attempt {attempts} (Conversion={mid})", 
+                f"File {file_index}/{total_files}: {wav_name} - attempt {state['attempts']} (Conversion={mid})", 
                 "blue"
             )
             
             try:
                 result = self.convert_with_quality(wav_file, mid)
+                self.update_binary_search(state, mid, result)
+            except Exception as e:
+                self.update_binary_search(state, mid, None, e)
                 
-                if not result or not result.get('size'):
-                    DEBUG.log(f"  → No result for Conversion={mid}")
-                    all_attempts.append({'conversion': mid, 'size': None, 'status': 'failed'})
-                    right = mid - 1
-                    continue
-                    
-                current_size = result['size']
-                size_ratio = current_size / target_size
+        return self.finish_binary_search(state)
+        
+    def convert_batch_with_binary_search(self, file_pairs):
+        """Run the Conversion binary search for several files in lockstep, one WwiseCLI run per round"""
+        states = [
+            self.start_binary_search(
+                pair['wav_file'], pair['target_size'], os.path.splitext(os.path.basename(pair['wav_file']))[0],
+                os.path.splitext(pair['target_name'])[0]
+            )
+            for pair in file_pairs
+        ]
+        max_rounds = math.ceil(math.log2(states[0]['right'] - states[0]['left'] + 2)) if states else 0
+        round_number = 0
+        
+        while not self.should_stop:
+            active = [state for state in states if state['left'] <= state['right']]
+            if not active:
+                break
                 
-                DEBUG.log(f"  → Result: {current_size:,} bytes ({size_ratio:.1%} of target)")
+            round_number += 1
+            requests = []
+            for state in active:
+                state['mid'] = self.next_probe(state)
+                state['attempts'] += 1
+                requests.append((state['wav_file'], state['mid']))
                 
-                attempt_info = {
-                    'conversion': mid,
-                    'size': current_size,
-                    'ratio': size_ratio,
-                    'status': 'ok' if current_size <= target_size else 'too_large'
-                }
-                all_attempts.append(attempt_info)
+            DEBUG.log(f"\nRound {round_number}: converting {len(active)} files in one batch")
+            self.status_updated.emit(f"Round {round_number}/{max_rounds}: converting {len(active)} files in one batch", "blue")
+            
+            try:
+                batch_results = self.convert_batch_with_quality(requests)
+                batch_error = None
+            except Exception as e:
+                batch_results, batch_error = {}, e
                 
-                if current_size <= target_size:
-                    DEBUG.log(f"  → Acceptable size! Saving as best result")
-                    
-                    temp_best_file = os.path.join(self.output_folder, f"best_{wav_name}_{mid}.wem")
-                    os.makedirs(self.output_folder, exist_ok=True)
-                    shutil.copy2(result['file'], temp_best_file)
-                    
-                    best_result = {
-                        'file': temp_best_file, 
-                        'size': current_size,
-                        'conversion': mid
-                    }
-                    
-                    DEBUG.log(f"  → Copied best result to: {temp_best_file}")
-                    
-                    left = mid + 1 
-                else:
-                    DEBUG.log(f"  → Too large! Reducing quality")
-                    right = mid - 1
+            if self.should_stop:
+                break
+                
+            for state in active:
+                try:
+                    if batch_error is not None:
+                        raise batch_error
+                    self.update_binary_search(state, state['mid'], batch_results.get((state['wav_file'], state['mid'])))
+                except Exception as e:
+                    self.update_binary_search(state, state['mid'], None, e)
                     
-            except Exception as e:
-                DEBUG.log(f"  → ERROR: {e}", "ERROR")
-                all_attempts.append({'conversion': mid, 'size': None, 'status': 'error', 'error': str(e)})
-                right = mid - 1
+            self.progress_updated.emit(min(99, int(round_number / (max_rounds + 1) * 100)))
+            
+        results = []
+        for state in states:
+            if self.should_stop and state['left'] <= state['right']:
+                results.append({'success': False, 'stopped': True, 'error': 'Conversion stopped by user'})
+            else:
+                results.append(self.finish_binary_search(state))
+        return results
+        
+    def finish_binary_search(self, state):
+        """Pad the best result to the target size and write the final output, or explain why the search failed"""
+        wav_file = state['wav_file']
+        target_size = state['target_size']
+        wav_name = state['wav_name']
+        best_result = state['best_result']
+        attempts = state['attempts']
+        all_attempts = state['all_attempts']
         
         DEBUG.log(f"\n=== BINARY SEARCH COMPLETE ===")
         DEBUG.log(f"Total attempts: {attempts}")
@@ -2560,8 +4858,13 @@ class WavToWemConverter(QtCore.QObject):
             else:
                 DEBUG.log(f"  Conversion={attempt['conversion']}: FAILED ({attempt['status']})")
         
-        if hasattr(self.parent, 'append_conversion_log'):
-            self.parent.append_conversion_log(f"   Search complete after {attempts} attempts")
+        self.log_conversion(f"   Search complete after {attempts} attempts")
+        
+        if best_result and self.size_model:
+            too_large = [attempt['conversion'] for attempt in all_attempts if attempt['status'] == 'too_large']
+            self.size_model.remember(
+                state['target_id'], wav_file, best_result['conversion'], min(too_large) if too_large else None
+            )
         
         if best_result:
             DEBUG.log(f"\nBest result: Conversion={best_result['conversion']}, size={best_result['size']:,} bytes")
@@ -2581,9 +4884,8 @@ class WavToWemConverter(QtCore.QObject):
             padding_needed = target_size - best_result['size']
             DEBUG.log(f"Padding needed: {padding_needed:,} bytes")
             
-            if hasattr(self.parent, 'append_conversion_log'):
-                self.parent.append_conversion_log(f"   Best: Conversion={best_result['conversion']} → {best_result['size']:,} bytes")
-                self.parent.append_conversion_log(f"   Adding {padding_needed:,} bytes padding...")
+            self.log_conversion(f"   Best: Conversion={best_result['conversion']} → {best_result['size']:,} bytes")
+            self.log_conversion(f"   Adding {padding_needed:,} bytes padding...")
             
            
             success = self.increase_file_size(best_result['file'], target_size)
@@ -2597,11 +4899,15 @@ class WavToWemConverter(QtCore.QObject):
                 output_filename = f"{wav_name}.wem"
                 output_path = os.path.join(self.output_folder, output_filename)
                 
-                counter = 1
-                while os.path.exists(output_path) and output_path != best_result['file']:
-                    output_filename = f"{wav_name}_{counter}.wem"
-                    output_path = os.path.join(self.output_folder, output_filename)
-                    counter += 1
+                with self.output_lock:
+                    counter = 1
+                    while os.path.exists(output_path) and output_path != best_result['file']:
+                        output_filename = f"{wav_name}_{counter}.wem"
+                        output_path = os.path.join(self.output_folder, output_filename)
+                        counter += 1
+                    if output_path != best_result['file']:
+                        # Claim the name before releasing the lock; parallel jobs may finish WAVs with the same name
+                        open(output_path, 'wb').close()
                 
                 if output_path != best_result['file']:
                     shutil.copy2(best_result['file'], output_path)
@@ -2618,11 +4924,10 @@ class WavToWemConverter(QtCore.QObject):
                 if final_size != target_size:
                     DEBUG.log(f"WARNING: Final size mismatch! Difference: {size_difference:,} bytes ({size_percentage:.1f}%)", "WARNING")
                 
-                if hasattr(self.parent, 'append_conversion_log'):
-                    if final_size == target_size:
-                        self.parent.append_conversion_log(f"   ✅ Success! Final size: {final_size:,} bytes (exact match)")
-                    else:
-                        self.parent.append_conversion_log(f"   ⚠️ Final size: {final_size:,} bytes (diff: {size_difference:,} bytes)")
+                if final_size == target_size:
+                    self.log_conversion(f"   ✅ Success! Final size: {final_size:,} bytes (exact match)")
+                else:
+                    self.log_conversion(f"   ⚠️ Final size: {final_size:,} bytes (diff: {size_difference:,} bytes)")
                 
              
                 if best_result['file'] != output_path and os.path.exists(best_result['file']):
@@ -2655,8 +4960,7 @@ class WavToWemConverter(QtCore.QObject):
                         size_diff = ((min_size - target_size) / target_size) * 100
                         DEBUG.log(f"Minimum possible size: {min_size:,} bytes ({size_diff:.1f}% over target)", "ERROR")
                         
-                        if hasattr(self.parent, 'append_conversion_log'):
-                            self.parent.append_conversion_log(f"   ❌ Failed! Minimum size {min_size:,} > target {target_size:,}")
+                        self.log_conversion(f"   ❌ Failed! Minimum size {min_size:,} > target {target_size:,}")
                         
                         return {
                             'success': False, 
@@ -2681,24 +4985,57 @@ class WavToWemConverter(QtCore.QObject):
             
             return self.try_conversion_with_binary_search(wav_file, target_size, file_index, total_files, wav_name)
             
+    def run_batch_job(self, file_pairs):
+        """Convert a group of files in lockstep inside one temp workspace"""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        temp_root = os.path.join(script_dir, "temp_conversion")
+        os.makedirs(temp_root, exist_ok=True)
+        self.workspace.temp_dir = tempfile.mkdtemp(prefix="batch_job_", dir=temp_root)
+        
+        try:
+            return self.convert_batch_with_binary_search(file_pairs)
+        finally:
+            self.workspace.temp_dir = None
+            
+    def run_conversion_job(self, file_pair, file_index, total_files):
+        """Convert one file in its own temp workspace so jobs can run side by side"""
+        if self.should_stop:
+            return {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
+            
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        temp_root = os.path.join(script_dir, "temp_conversion")
+        os.makedirs(temp_root, exist_ok=True)
+        self.workspace.temp_dir = tempfile.mkdtemp(prefix=f"job{file_index}_", dir=temp_root)
+        
+        try:
+            self.status_updated.emit(f"Converting {file_index}/{total_files}: {file_pair['wav_name']}", "blue")
+            return self.convert_single_file_main(file_pair, file_index, total_files)
+        finally:
+            self.workspace.temp_dir = None
+            
     def convert_all_files(self):
-            """Convert all files with stop checking"""
+            """Convert all files on a pool of max_workers jobs with stop checking"""
+            with self.state_lock:
+                self.running = True
             try:
                 self.should_stop = False
-                results = []
+                self.stop_event.clear()
                 total_files = len(self.file_pairs)
                 
                 if total_files == 0:
                     self.conversion_finished.emit([])
                     return
                 
-                self.conversion_cache.clear()
+                with self.cache_lock:
+                    self.conversion_cache.clear()
                 DEBUG.log("Starting conversion - cache cleared")
                 
                 try:
                     wproj_path = self.ensure_project_exists()
                     
                     DEBUG.log(f"Using Wwise project: {wproj_path}")
+                    if self.result_cache:
+                        self.result_cache.set_environment(self.conversion_environment())
                 except Exception as e:
                     error_result = {
                         'file_pair': {'wav_name': 'Project Setup'},
@@ -2707,30 +5044,68 @@ class WavToWemConverter(QtCore.QObject):
                     self.conversion_finished.emit([error_result])
                     return
                 
-                for i, file_pair in enumerate(self.file_pairs):
-           
-                    if self.should_stop:
-                        DEBUG.log(f"Conversion stopped at file {i+1}/{total_files}")
-                    
-                        for j in range(i, total_files):
-                            results.append({
-                                'file_pair': self.file_pairs[j],
-                                'result': {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
-                            })
-                        break
-                    
-                    progress = int((i / total_files) * 100)
-                    self.progress_updated.emit(progress)
-                    self.status_updated.emit(f"Converting {i+1}/{total_files}: {file_pair['wav_name']}", "blue")
-                    
-                    result = self.convert_single_file_main(file_pair, i+1, total_files)
-                    results.append({
-                        'file_pair': file_pair,
-                        'result': result
-                    })
-                    
-                    if self.should_stop:
-                        break
+                max_workers = max(1, min(total_files, self.max_workers))
+                # Workers left over when there are fewer files than workers go to speculative probes within each file
+                self.probe_width = self.max_probes or min(3, max(1, self.max_workers // total_files))
+                DEBUG.log(f"Converting {total_files} files with {max_workers} parallel jobs, {self.probe_width} probes per file")
+                self.progress_updated.emit(0)
+                
+                results = [None] * total_files
+                completed = 0
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    if self.batch_mode and not self.adaptive_mode and self.probe_width == 1:
+                        # One group per worker; each group advances its files round by round in a single WwiseCLI run
+                        groups = [list(range(total_files))[w::max_workers] for w in range(max_workers)]
+                        batch_futures = {
+                            executor.submit(self.run_batch_job, [self.file_pairs[i] for i in group]): group
+                            for group in groups
+                        }
+                        self.active_futures = list(batch_futures)
+                        for future in concurrent.futures.as_completed(batch_futures):
+                            group = batch_futures[future]
+                            if future.cancelled():
+                                group_results = [{'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}] * len(group)
+                                for i, result in zip(group, group_results):
+                                    results[i] = {
+                                        'file_pair': self.file_pairs[i],
+                                        'result': result
+                                    }
+                                continue
+                            try:
+                                group_results = future.result()
+                            except Exception as e:
+                                group_results = [{'success': False, 'error': f'Conversion error: {str(e)}'}] * len(group)
+                            for i, result in zip(group, group_results):
+                                results[i] = {
+                                    'file_pair': self.file_pairs[i],
+                                    'result': result
+                                }
+                    else:
+                        futures = {
+                            executor.submit(self.run_conversion_job, file_pair, i + 1, total_files): i
+                            for i, file_pair in enumerate(self.file_pairs)
+                        }
+                        self.active_futures = list(futures)
+                        for future in concurrent.futures.as_completed(futures):
+                            i = futures[future]
+                            if future.cancelled():
+                                result = {'success': False, 'stopped': True, 'error': 'Conversion stopped by user'}
+                            else:
+                                try:
+                                    result = future.result()
+                                except Exception as e:
+                                    result = {'success': False, 'error': f'Conversion error: {str(e)}'}
+                            results[i] = {
+                                'file_pair': self.file_pairs[i],
+                                'result': result
+                            }
+                            completed += 1
+                            self.progress_updated.emit(int((completed / total_files) * 100))
+                
+                self.progress_updated.emit(100)
+                
+                if self.should_stop:
+                    DEBUG.log(f"Conversion stopped after {sum(1 for r in results if not r['result'].get('stopped'))}/{total_files} files")
                 
                 self.conversion_finished.emit(results)
                 
@@ -2741,6 +5116,13 @@ class WavToWemConverter(QtCore.QObject):
                     'result': {'success': False, 'error': f'Conversion thread error: {str(e)}'}
                 }
                 self.conversion_finished.emit([error_result])
+            finally:
+                self.active_futures = []
+                with self.state_lock:
+                    self.running = False
+                    reset_pending = self.reset_pending
+                if reset_pending:
+                    self.reset_state()
         
     def cleanup_temp_directories(self, temp_dirs):
         self.status_updated.emit("Cleaning up temporary files...", "blue")
@@ -2761,14 +5143,395 @@ class WavToWemConverter(QtCore.QObject):
             except:
                 pass
     def stop_conversion(self):
-        """Signal the conversion process to stop"""
+        """Signal the conversion process to stop: kill running WwiseCLI processes and cancel queued jobs"""
         self.should_stop = True
+        self.stop_event.set()
+        for future in list(self.active_futures):
+            future.cancel()
         self.status_updated.emit("Stopping conversion...", "orange")
         
-        self.conversion_cache.clear()
+        with self.cache_lock:
+            self.conversion_cache.clear()
         DEBUG.log("Conversion stopped - cache cleared")
     
  
+class SubtitleTableModel(QtCore.QAbstractTableModel):
+    """Table model over filtered subtitle rows; cell text and styling are computed on demand"""
+
+    HEADERS = ["Key", "Original", "Current", "Audio"]
+    MAX_DISPLAY_LENGTH = 150
+
+    def __init__(self, tr=None, parent=None):
+        super().__init__(parent)
+        self.tr = tr or (lambda x: x)
+        self.rows = {}
+        self.keys = []
+        self.search_text = ""
+        self._row_by_key = None
+        self._sort_column = 0
+        self._sort_order = QtCore.Qt.AscendingOrder
+
+    def set_rows(self, rows, search_text=""):
+        self.beginResetModel()
+        self.rows = rows
+        self.keys = list(rows)
+        self.search_text = search_text.lower().strip()
+        self._sort_keys()
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    @staticmethod
+    def truncate_text(text, max_length):
+        if len(text) <= max_length:
+            return text
+        return text[:max_length-3] + "..."
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self.keys[index.row()]
+        row = self.rows[key]
+        column = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return key
+            if column == 1:
+                return self.truncate_text(row['original'], self.MAX_DISPLAY_LENGTH)
+            if column == 2:
+                return self.truncate_text(row['current'], self.MAX_DISPLAY_LENGTH)
+            return "🔊" if row.get('has_audio') else ""
+        if role == QtCore.Qt.ToolTipRole:
+            if column == 1:
+                return row['original']
+            if column == 2:
+                return row['current']
+            if column == 3:
+                return self.tr("has_audio_file") if row.get('has_audio') else self.tr("no_audio_file")
+            return None
+        if role == QtCore.Qt.BackgroundRole:
+            if row.get('is_modified'):
+                return QtGui.QBrush(QtGui.QColor(255, 255, 200))
+            return None
+        if role == QtCore.Qt.FontRole:
+            if self.search_text and (
+                self.search_text in key.lower() or
+                self.search_text in row['original'].lower() or
+                self.search_text in row['current'].lower()
+            ):
+                font = QtGui.QFont()
+                font.setBold(True)
+                return font
+            return None
+        if role == QtCore.Qt.TextAlignmentRole and column == 3:
+            return QtCore.Qt.AlignCenter
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def _sort_keys(self):
+        reverse = self._sort_order == QtCore.Qt.DescendingOrder
+        if self._sort_column == 0:
+            self.keys.sort(reverse=reverse)
+        elif self._sort_column == 3:
+            self.keys.sort(key=lambda k: (not self.rows[k].get('has_audio'), k), reverse=reverse)
+        else:
+            field = 'original' if self._sort_column == 1 else 'current'
+            self.keys.sort(key=lambda k: (self.rows[k][field].lower(), k), reverse=reverse)
+        self._row_by_key = None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Sort in Python on the raw values instead of per-comparison data() calls"""
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        self._sort_keys()
+        self.layoutChanged.emit()
+
+    def key_at(self, row):
+        if 0 <= row < len(self.keys):
+            return self.keys[row]
+        return None
+
+    def row_data(self, row):
+        key = self.key_at(row)
+        return self.rows.get(key) if key is not None else None
+
+    def row_for_key(self, key):
+        if self._row_by_key is None:
+            self._row_by_key = {k: i for i, k in enumerate(self.keys)}
+        return self._row_by_key.get(key, -1)
+
+    def update_row(self, key, current_text, is_modified):
+        row = self.row_for_key(key)
+        if row < 0:
+            return False
+        self.rows[key]['current'] = current_text
+        self.rows[key]['is_modified'] = is_modified
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+
+class AudioTreeModel(QtCore.QAbstractItemModel):
+    """Two-level model (group -> audio entry) over one language's entries; groups are computed once"""
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.source = None
+        self.records = []
+        self.groups = []
+        self.subtitles = {}
+        self.modified_subtitles = set()
+        self.mod_ids = set()
+        self.metadata = {}
+        self._position_by_key = None
+        self._flat = None
+
+    @staticmethod
+    def group_for(shortname):
+        parts = shortname.replace(".wav", "").split("_")
+        if len(parts) >= 3 and parts[0] == "VO":
+            return f"{parts[1]}_{parts[2]}"
+        return "Other"
+
+    def set_entries(self, entries):
+        """Precompute per-entry key, group and search text"""
+        self.beginResetModel()
+        self.source = entries
+        self.records = []
+        for entry in entries:
+            shortname = entry.get("ShortName", "")
+            id_ = entry.get("Id", "")
+            try:
+                id_num = int(id_ or "0")
+            except ValueError:
+                id_num = 0
+            self.records.append({
+                'entry': entry,
+                'key': os.path.splitext(shortname)[0],
+                'shortname': shortname,
+                'name_lower': shortname.lower(),
+                'id': id_,
+                'id_num': id_num,
+                'group': self.group_for(shortname),
+                'search_base': f"{id_} {shortname}".lower()
+            })
+        self.groups = []
+        self._position_by_key = None
+        self._flat = None
+        self.endResetModel()
+
+    @staticmethod
+    def describe_metadata(row):
+        duration_ms = row.get('duration_ms', 0)
+        parts = [f"{int(duration_ms // 60000):02d}:{(duration_ms % 60000) / 1000.0:05.2f}" if duration_ms > 0 else "Unknown"]
+        if row.get('sample_rate'):
+            parts.append(f"{row['sample_rate'] / 1000:.1f} kHz")
+        if row.get('channels'):
+            parts.append(f"{row['channels']} ch")
+        if row.get('codec'):
+            parts.append(row['codec'])
+        parts.append(f"{row.get('size', 0) / 1024:.1f} KB")
+        if row.get('cue_count'):
+            parts.append(f"{row['cue_count']} markers")
+        return " | ".join(parts)
+
+    def apply_filter(self, subtitles, modified_subtitles, mod_ids, filter_type, sort_type, search_text, metadata=None):
+        """Rebuild the visible groups; returns the visible records"""
+        self.subtitles = subtitles
+        self.modified_subtitles = modified_subtitles
+        self.mod_ids = mod_ids
+        self.metadata = metadata or {}
+        search_text = search_text.lower()
+
+        visible = []
+        for record in self.records:
+            subtitle = subtitles.get(record['key'], "")
+            if filter_type == 1 and not subtitle:
+                continue
+            elif filter_type == 2 and subtitle:
+                continue
+            elif filter_type == 3 and record['key'] not in modified_subtitles:
+                continue
+            elif filter_type == 4 and record['id'] not in mod_ids:
+                continue
+            if search_text:
+                if search_text not in record['search_base'] and search_text not in subtitle.lower():
+                    continue
+            visible.append(record)
+
+        if sort_type == 0:
+            visible.sort(key=lambda r: r['name_lower'])
+        elif sort_type == 1:
+            visible.sort(key=lambda r: r['name_lower'], reverse=True)
+        elif sort_type == 2:
+            visible.sort(key=lambda r: r['id_num'])
+        elif sort_type == 3:
+            visible.sort(key=lambda r: r['id_num'], reverse=True)
+        elif sort_type == 5:
+            visible.sort(key=lambda r: self.metadata.get(r['id'], {}).get('duration_ms', 0), reverse=True)
+        elif sort_type == 6:
+            visible.sort(key=lambda r: self.metadata.get(r['id'], {}).get('size', 0), reverse=True)
+
+        grouped = {}
+        for record in visible:
+            grouped.setdefault(record['group'], []).append(record)
+
+        self.beginResetModel()
+        self.groups = [(name, grouped[name]) for name in sorted(grouped)]
+        self._position_by_key = None
+        self._flat = None
+        self.endResetModel()
+        return visible
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QtCore.QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self.groups[parent.row()][1])
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def is_group(self, index):
+        return index.isValid() and index.internalId() == 0
+
+    def record_for_index(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return None
+        group_row = index.internalId() - 1
+        if group_row >= len(self.groups):
+            return None
+        records = self.groups[group_row][1]
+        if index.row() >= len(records):
+            return None
+        return records[index.row()]
+
+    def entry_for_index(self, index):
+        record = self.record_for_index(index)
+        return record['entry'] if record else None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+
+        if index.internalId() == 0:
+            if role == QtCore.Qt.DisplayRole and column == 0:
+                name, records = self.groups[index.row()]
+                return f"{name} ({len(records)})"
+            return None
+
+        record = self.record_for_index(index)
+        if record is None:
+            return None
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return record['shortname']
+            if column == 1:
+                return record['id']
+            if column == 2:
+                return self.subtitles.get(record['key'], "")
+            mod_status = "♪" if record['id'] in self.mod_ids else ""
+            return "✓" + mod_status if record['key'] in self.modified_subtitles else mod_status
+        if role == QtCore.Qt.ToolTipRole and column in (0, 1):
+            row = self.metadata.get(record['id'])
+            return self.describe_metadata(row) if row else None
+        if role == QtCore.Qt.ForegroundRole:
+            if column == 2 and not self.subtitles.get(record['key'], ""):
+                return QtGui.QBrush(QtGui.QColor(128, 128, 128))
+            if column == 0 and record['entry'].get("Source") == "MediaFilesNotInAnyBank":
+                return QtGui.QBrush(QtGui.QColor(100, 100, 200))
+            return None
+        if role == QtCore.Qt.UserRole and column == 0:
+            return record['entry']
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def index_for_key(self, key, column=0):
+        """Model index of the visible entry with the given key"""
+        if self._position_by_key is None:
+            self._position_by_key = {}
+            for group_row, (_, records) in enumerate(self.groups):
+                for row, record in enumerate(records):
+                    self._position_by_key.setdefault(record['key'], (group_row, row))
+        position = self._position_by_key.get(key)
+        if position is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(position[1], column, position[0] + 1)
+
+    def neighbour_entries(self, index, count):
+        """Entries up to count rows after and before index in display order, nearest first"""
+        record = self.record_for_index(index)
+        if record is None or count <= 0:
+            return []
+        if self._flat is None:
+            flat, offsets = [], []
+            for _, records in self.groups:
+                offsets.append(len(flat))
+                flat.extend(records)
+            self._flat = (flat, offsets)
+        flat, offsets = self._flat
+        position = offsets[index.internalId() - 1] + index.row()
+
+        entries = []
+        for distance in range(1, count + 1):
+            for neighbour in (position + distance, position - distance):
+                if 0 <= neighbour < len(flat):
+                    entries.append(flat[neighbour]['entry'])
+        return entries
+
+    def index_for_id(self, id_):
+        for group_row, (_, records) in enumerate(self.groups):
+            for row, record in enumerate(records):
+                if record['id'] == id_:
+                    return self.createIndex(row, 0, group_row + 1)
+        return QtCore.QModelIndex()
+
+    def refresh_key(self, key):
+        """Repaint one entry after its subtitle or status changed"""
+        index = self.index_for_key(key)
+        if index.isValid():
+            self.dataChanged.emit(index, self.createIndex(index.row(), len(self.headers) - 1, index.internalId()))
+            return True
+        return False
+
 class SubtitleEditor(QtWidgets.QDialog):
     def __init__(self, parent=None, key="", subtitle="", original_subtitle=""):
         super().__init__(parent)
@@ -2837,6 +5600,8 @@ class SubtitleEditor(QtWidgets.QDialog):
         return self.text_edit.toPlainText()
 
 class WemSubtitleApp(QtWidgets.QMainWindow):
+    audioDetailsLoaded = QtCore.pyqtSignal(int, str, object, object)
+
     def __init__(self):
         super().__init__()
         DEBUG.log("=== OutlastTrials AudioEditor Starting ===")
@@ -2867,6 +5632,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.soundbanks_path = os.path.join(self.base_path, "SoundbanksInfo.json")
         self.wem_root = os.path.join(self.base_path, "Wems")
         self.mod_p_path = os.path.join(self.base_path, "MOD_P")
+        self.mod_files = ModFileIndex(os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows"))
+        self.mod_files.rebuild()
+        self.wem_index = WemMetadataIndex(os.path.join(self.base_path, "wem_index.db"))
+        self.audio_info_cache = AudioInfoCache()
+        self.wem_indexer = None
         
         self.check_required_files()
         
@@ -2880,10 +5650,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.subtitles = {}
         self.original_subtitles = {}
         self.all_subtitle_files = {}
+        self.subtitle_store = SubtitleStore(self.locres_manager)
         self.all_files = self.load_all_soundbank_files(self.soundbanks_path)
         self.entries_by_lang = self.group_by_language()
 
         self.audio_player = AudioPlayer()
+        self.audio_cache = DecodedAudioCache(
+            os.path.join(tempfile.gettempdir(), "OutlastTrialsAudioEditor", "decoded"),
+            self.settings.data.get("audio_cache_mb", 512) * 1024 * 1024
+        )
+        self.audio_prefetcher = AudioPrefetcher(
+            self.audio_cache, lambda wem_path, wav_path: self.wem_to_wav_vgmstream(wem_path, wav_path, low_priority=True)
+        )
+        self.details_generation = 0
+        self.details_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.audioDetailsLoaded.connect(self.on_audio_details_loaded)
         self.temp_wav = None
         self.currently_playing_item = None
         self.is_playing_mod = False
@@ -2896,6 +5677,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.current_file_duration = 0
 
         self.debug_window = None
+
+        self.mod_files_watcher = QtCore.QFileSystemWatcher(self)
+        self.mod_files_watcher.directoryChanged.connect(self.on_mod_folder_changed)
+        self.mod_files_refresh_timer = QtCore.QTimer(self)
+        self.mod_files_refresh_timer.setSingleShot(True)
+        self.mod_files_refresh_timer.setInterval(500)
+        self.mod_files_refresh_timer.timeout.connect(self.refresh_mod_files)
+        self.watch_mod_folders()
         
         self.auto_save_timer = QtCore.QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save_subtitles)
@@ -2909,6 +5698,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.load_subtitles()
 
         self.update_auto_save_timer()
+        self.start_wem_indexer()
         self.check_updates_on_startup()    
         DEBUG.log("=== OutlastTrials AudioEditor Started Successfully ===")
 
@@ -2957,6 +5747,65 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             DEBUG.log(f"Auto-save failed: {e}", "ERROR")
             self.status_bar.showMessage("Auto-save failed", 2000)
 
+    def start_wem_indexer(self, include_originals=True):
+        """Refresh header metadata of changed WEM files in the background"""
+        if self.wem_indexer and self.wem_indexer.isRunning():
+            self.wem_indexer.stop()
+            self.wem_indexer.wait()
+
+        folders = []
+        if include_originals or "original" not in self.wem_index.scanned:
+            folders.append(("original", self.wem_root, None))
+        folders.append(("mod", self.mod_files.windows_dir, "SFX"))
+
+        self.wem_indexer = WemIndexerThread(self, self.wem_index, folders)
+        self.wem_indexer.statusUpdate.connect(lambda message: self.status_bar.showMessage(message, 2000))
+        self.wem_indexer.indexUpdated.connect(self.on_wem_index_updated)
+        self.wem_indexer.start()
+
+    def on_wem_index_updated(self, files_read):
+        if files_read:
+            for lang in list(self.populated_tabs):
+                self.populate_tree(lang)
+
+    def mod_file_written(self, path):
+        """Record a mod WEM written by the app"""
+        self.mod_files.add_path(path)
+        self.audio_info_cache.invalidate(path)
+
+    def mod_file_removed(self, path):
+        """Record a mod WEM removed by the app"""
+        self.mod_files.discard_path(path)
+        self.audio_info_cache.invalidate(path)
+
+    def watch_mod_folders(self):
+        folders = [folder for folder in self.mod_files.folders() if folder not in self.mod_files_watcher.directories()]
+        if folders:
+            self.mod_files_watcher.addPaths(folders)
+
+    def on_mod_folder_changed(self, path):
+        self.mod_files_refresh_timer.start()
+
+    def refresh_mod_trees(self):
+        for lang in list(self.populated_tabs):
+            self.populate_tree(lang)
+        current_lang = self.get_current_language()
+        if current_lang in self.tab_widgets:
+            self.on_selection_changed(current_lang)
+
+    def on_refresh_mod_files(self):
+        self.refresh_mod_files()
+        self.status_bar.showMessage(self.tr("mod_files_refreshed"), 2000)
+
+    def refresh_mod_files(self):
+        """Rescan MOD_P and refresh trees if the set of mod files changed"""
+        changed = self.mod_files.rebuild()
+        self.watch_mod_folders()
+        self.start_wem_indexer(include_originals=False)
+        if changed:
+            self.refresh_mod_trees()
+        return changed
+
     def delete_mod_audio(self, entry, lang):
         """Delete modified audio file(s)"""
         widgets = self.tab_widgets.get(lang) 
@@ -2964,22 +5813,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             DEBUG.log(f"No widgets found for language: {lang}", "WARNING")
             return
         
-        tree = widgets["tree"]
-        items = tree.selectedItems()
+        items = self.get_selected_tree_indexes(lang)
         
         if len(items) > 1:
             file_list = []
-            for item in items:
-                if item.childCount() == 0:
-                    entry = item.data(0, QtCore.Qt.UserRole)
-                    if entry:
-                        id_ = entry.get("Id", "")
-                        if lang != "SFX":
-                            mod_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{id_}.wem")
-                        else:
-                            mod_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{id_}.wem")
-                        if os.path.exists(mod_path):
-                            file_list.append((entry.get("ShortName", ""), mod_path))
+            for selected_entry in self.get_selected_entries(lang):
+                id_ = selected_entry.get("Id", "")
+                if self.mod_files.has(lang, id_):
+                    file_list.append((selected_entry.get("ShortName", ""), self.mod_files.path_for(lang, id_)))
             
             if not file_list:
                 return
@@ -2995,8 +5836,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 for shortname, path in file_list:
                     try:
                         os.remove(path)
+                        self.mod_file_removed(path)
                         deleted += 1
                         DEBUG.log(f"Deleted mod audio: {path}")
+                    except FileNotFoundError:
+                        self.mod_file_removed(path)
                     except Exception as e:
                         DEBUG.log(f"Error deleting {shortname}: {e}", "ERROR")
                 
@@ -3013,12 +5857,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
         id_ = entry.get("Id", "")
         shortname = entry.get("ShortName", "")
-        if lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{id_}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{id_}.wem")
+        mod_wem_path = self.mod_files.path_for(lang, id_)
         
-        if not os.path.exists(mod_wem_path):
+        if not self.mod_files.has(lang, id_):
             DEBUG.log(f"Mod file does not exist: {mod_wem_path}", "INFO")
             QtWidgets.QMessageBox.information(
                 self, "Info", 
@@ -3035,6 +5876,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if reply == QtWidgets.QMessageBox.Yes:
             try:
                 os.remove(mod_wem_path)
+                self.mod_file_removed(mod_wem_path)
                 DEBUG.log(f"Deleted mod audio: {mod_wem_path}")
 
                 if "play_mod_btn" in widgets:
@@ -3059,7 +5901,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         missing_files = []
         
         required_files = [
-            (self.unreal_locres_path, "UnrealLocres.exe"),
             (self.repak_path, "repak.exe"),
             (self.vgmstream_path, "vgmstream-cli.exe")
         ]
@@ -3081,9 +5922,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.all_subtitle_files = {}
 
         self.scan_localization_folder()
+        self.subtitle_store.clear_views()
 
         subtitle_lang = self.settings.data["subtitle_lang"]
-        self.load_subtitles_for_language(subtitle_lang)
+        self.switch_subtitle_language(subtitle_lang)
+        
+        DEBUG.log("=== Subtitle Loading Complete ===")
+
+    def switch_subtitle_language(self, language):
+        """Show another language from the subtitle store and recompute modified keys"""
+        self.load_subtitles_for_language(language)
 
         self.modified_subtitles.clear()
         for key, value in self.subtitles.items():
@@ -3091,7 +5939,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 self.modified_subtitles.add(key)
         
         DEBUG.log(f"Found {len(self.modified_subtitles)} modified subtitles")
-        DEBUG.log("=== Subtitle Loading Complete ===")
 
     def scan_localization_folder(self):
         """Scan Localization folder for all subtitle files"""
@@ -3163,63 +6010,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         except Exception as e:
             DEBUG.log(f"Error scanning localization folder: {e}", "ERROR")
         
+        self.subtitle_store.set_files(self.all_subtitle_files)
         DEBUG.log(f"Total subtitle files found: {len(self.all_subtitle_files)}")
 
     def create_empty_locres_file(self, path, subtitles):
         """Create an empty locres file"""
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
-            csv_path = path.replace('.locres', '.csv')
-            
-            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-
-                for key, value in subtitles.items():
-                    writer.writerow([f"Subtitles/{key}", value])
-            
-            if os.path.exists(self.unreal_locres_path):
-                result = subprocess.run(
-                    [self.unreal_locres_path, "import", path, csv_path],
-                    capture_output=True,
-                    text=True,
-                    cwd=os.path.dirname(self.unreal_locres_path) or ".",
-                    startupinfo=startupinfo,
-                    creationflags=CREATE_NO_WINDOW
-                )
-                
-                if result.returncode != 0:
-                    DEBUG.log(f"Failed to create locres file: {result.stderr}", "WARNING")
-
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
-                
+            self.locres_manager.create_locres(path, subtitles)
         except Exception as e:
             DEBUG.log(f"Error creating empty locres file: {e}", "ERROR")
 
     def load_subtitles_for_language(self, language):
         DEBUG.log(f"Loading subtitles for language: {language}")
-        
-        self.subtitles = {}
-        self.original_subtitles = {}
-
-        for key, file_info in self.all_subtitle_files.items():
-            if file_info['language'] == language:
-                DEBUG.log(f"Loading file: {file_info['path']}")
 
-                original_subtitles = self.locres_manager.export_locres(file_info['path'])
-                self.original_subtitles.update(original_subtitles)
-
-                working_path = file_info['path'].replace('.locres', '_working.locres')
-                if os.path.exists(working_path):
-                    DEBUG.log(f"Found working copy: {working_path}")
-                    working_subtitles = self.locres_manager.export_locres(working_path)
-                    self.subtitles.update(working_subtitles)
-                else:
-
-                    self.subtitles.update(original_subtitles)
-                    
-                DEBUG.log(f"Loaded {len(original_subtitles)} subtitles from {file_info['filename']}")
+        self.subtitles, self.original_subtitles = self.subtitle_store.language_view(language)
+        DEBUG.log(f"Language {language} has {len(self.subtitles)} subtitles")
 
     def create_ui(self):
         central = QtWidgets.QWidget()
@@ -3282,6 +6087,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         """Refresh subtitle editor data"""
         DEBUG.log("Refreshing subtitle editor")
         self.scan_localization_folder()
+        self.invalidate_subtitle_rows()
         self.populate_subtitle_editor_controls()
         self.status_bar.showMessage("Localization editor refreshed", 2000)
 
@@ -3362,19 +6168,24 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.modified_only_checkbox.toggled.connect(self.on_subtitle_filter_changed)
         self.with_audio_only_checkbox.toggled.connect(self.on_subtitle_filter_changed)
         
-        self.subtitle_table = QtWidgets.QTableWidget()
-        self.subtitle_table.setColumnCount(4)
-        self.subtitle_table.setHorizontalHeaderLabels(["Key", "Original", "Current", "Audio"])
+        self.subtitle_table_model = SubtitleTableModel(self.tr, self)
+        self.subtitle_table = QtWidgets.QTableView()
+        self.subtitle_table.setModel(self.subtitle_table_model)
+        self.subtitle_table.setSortingEnabled(True)
+        self.subtitle_table.sortByColumn(0, QtCore.Qt.AscendingOrder)
+        self.subtitle_table.verticalHeader().setDefaultSectionSize(24)
         
         header = self.subtitle_table.horizontalHeader()
-        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.Interactive)
+        header.resizeSection(0, 300)
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.Stretch)
-        header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)
+        header.resizeSection(3, 60)
         
         self.subtitle_table.setAlternatingRowColors(True)
         self.subtitle_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.subtitle_table.itemDoubleClicked.connect(self.edit_subtitle_from_table)
+        self.subtitle_table.doubleClicked.connect(self.edit_subtitle_from_table)
         
         self.subtitle_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.subtitle_table.customContextMenuRequested.connect(self.show_subtitle_table_context_menu)
@@ -3399,6 +6210,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.subtitle_editor_loaded = False
         self.audio_keys_cache = None
         self.subtitle_loader_thread = None
+        self.invalidate_subtitle_rows()
         
         self.tabs.addTab(tab, self.tr("localization_editor"))
         self.global_search.searchChanged.connect(self.on_global_search_changed_for_subtitles)
@@ -3466,6 +6278,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         """Handle filter changes with debouncing"""
         if hasattr(self, 'filter_timer'):
             self.filter_timer.stop()
+
+        rows_key = (self.settings.data["subtitle_lang"], self.subtitle_category_combo.currentText())
+        if self.subtitle_rows_cache is not None and self.subtitle_rows_cache_key == rows_key:
+            self.apply_subtitle_filters()
+            return
         
         self.filter_timer = QtCore.QTimer()
         self.filter_timer.setSingleShot(True)
@@ -3494,71 +6311,96 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         return self.audio_keys_cache
 
     def load_subtitle_editor_data(self):
-        """Load subtitle data for editor asynchronously"""
+        """Show subtitle editor data, reading files only when the selection is not cached yet"""
         selected_category = self.subtitle_category_combo.currentText()
-        orphaned_only = self.orphaned_only_checkbox.isChecked()
-        modified_only = self.modified_only_checkbox.isChecked()
-        with_audio_only = self.with_audio_only_checkbox.isChecked()
-        search_text = self.get_global_search_text()
-        
-        DEBUG.log(f"Loading subtitle editor data: category={selected_category}, language={self.settings.data['subtitle_lang']}, orphaned={orphaned_only}, modified={modified_only}, with_audio={with_audio_only}")
-        
- 
-        if orphaned_only and with_audio_only:
-            self.with_audio_only_checkbox.setChecked(False)
-            with_audio_only = False
-            DEBUG.log("Disabled 'with_audio_only' because 'orphaned_only' is active")
+        selected_lang = self.settings.data["subtitle_lang"]
+        rows_key = (selected_lang, selected_category)
+
+        if self.subtitle_rows_cache is not None and self.subtitle_rows_cache_key == rows_key:
+            self.apply_subtitle_filters()
+            return
+
+        DEBUG.log(f"Loading subtitle editor data: category={selected_category}, language={selected_lang}")
         
         if self.subtitle_loader_thread and self.subtitle_loader_thread.isRunning():
             self.subtitle_loader_thread.stop()
             self.subtitle_loader_thread.wait(1000)
-
-        if (orphaned_only or with_audio_only):
-            if self.audio_keys_cache is None:
-                self.build_audio_keys_cache()
-            DEBUG.log(f"Audio cache has {len(self.audio_keys_cache) if self.audio_keys_cache else 0} keys")
         
         self.show_subtitle_loading_ui()
         self.subtitle_status_label.setText("Loading subtitles...")
         self.subtitle_progress.setValue(0)
         
-        self.subtitle_table.setRowCount(0)
+        self.subtitle_table_model.set_rows({})
 
         self.subtitle_loader_thread = SubtitleLoaderThread(
-            self, self.all_subtitle_files, self.locres_manager, 
-            self.subtitles, self.original_subtitles,
-            self.settings.data["subtitle_lang"], selected_category, orphaned_only, modified_only, with_audio_only,
-            search_text, self.audio_keys_cache, self.modified_subtitles
+            self, self.all_subtitle_files, self.subtitle_store, selected_lang, selected_category
         )
         
-        self.subtitle_loader_thread.dataLoaded.connect(self.on_subtitle_data_loaded)
+        self.subtitle_loader_thread.dataLoaded.connect(
+            lambda base_rows, rows_key=rows_key: self.on_subtitle_data_loaded(base_rows, rows_key)
+        )
         self.subtitle_loader_thread.statusUpdate.connect(self.subtitle_status_label.setText)
         self.subtitle_loader_thread.progressUpdate.connect(self.subtitle_progress.setValue)
         
         self.subtitle_loader_thread.start()
-    def on_subtitle_data_loaded(self, subtitles_to_show):
-        """Handle loaded subtitle data"""
+    def on_subtitle_data_loaded(self, base_rows, rows_key):
+        """Cache loaded rows and show them through the current filters"""
         self.hide_subtitle_loading_ui()
+        self.subtitle_rows_cache = base_rows
+        self.subtitle_rows_cache_key = rows_key
+        self.apply_subtitle_filters()
+
+    def invalidate_subtitle_rows(self):
+        """Drop cached editor rows so the next load re-reads files"""
+        self.subtitle_rows_cache = None
+        self.subtitle_rows_cache_key = None
+
+    def apply_subtitle_filters(self):
+        """Re-filter cached rows without touching the files"""
+        if self.subtitle_rows_cache is None:
+            return
+
+        selected_category = self.subtitle_category_combo.currentText()
+        orphaned_only = self.orphaned_only_checkbox.isChecked()
+        modified_only = self.modified_only_checkbox.isChecked()
+        with_audio_only = self.with_audio_only_checkbox.isChecked()
         
+        if orphaned_only and with_audio_only:
+            self.with_audio_only_checkbox.blockSignals(True)
+            self.with_audio_only_checkbox.setChecked(False)
+            self.with_audio_only_checkbox.blockSignals(False)
+            with_audio_only = False
+            DEBUG.log("Disabled 'with_audio_only' because 'orphaned_only' is active")
+
+        if (orphaned_only or with_audio_only) and self.audio_keys_cache is None:
+            self.build_audio_keys_cache()
+
+        subtitles_to_show = SubtitleLoaderThread.filter_rows(
+            self.subtitle_rows_cache, self.subtitles, self.original_subtitles,
+            self.modified_subtitles, self.audio_keys_cache,
+            orphaned_only, modified_only, with_audio_only,
+            self.get_global_search_text(),
+            selected_category == "All Categories" and self.subtitle_rows_cache_key[0] == "All Languages"
+        )
+
         self.populate_subtitle_table(subtitles_to_show)
         
         status_parts = [f"{len(subtitles_to_show)} subtitles"]
         
         filters_active = []
-        if self.orphaned_only_checkbox.isChecked():
+        if orphaned_only:
             filters_active.append("without audio")
         
-        if self.modified_only_checkbox.isChecked():
+        if modified_only:
             filters_active.append("modified only")
             
-        if self.with_audio_only_checkbox.isChecked():
+        if with_audio_only:
             filters_active.append("with audio only")
         
         search_text = self.get_global_search_text().strip()
         if search_text:
             filters_active.append(f"search: '{search_text}'")
         
-        selected_category = self.subtitle_category_combo.currentText()
         if selected_category and selected_category != "All Categories":
             filters_active.append(f"category: {selected_category}")
         
@@ -3569,138 +6411,50 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
     def populate_subtitle_table(self, subtitles_to_show):
         """Populate the subtitle table with data"""
-        self.subtitle_table.setRowCount(len(subtitles_to_show))
-        
-        if len(subtitles_to_show) == 0:
-            return
-        
-        sorted_items = sorted(subtitles_to_show.items())
-        
-        for row, (key, data) in enumerate(sorted_items):
-            key_item = QtWidgets.QTableWidgetItem(key)
-            key_item.setFlags(key_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.subtitle_table.setItem(row, 0, key_item)
-            
-            original_text = data['original']
-            original_display = self.truncate_text(original_text, 150)
-            original_item = QtWidgets.QTableWidgetItem(original_display)
-            original_item.setFlags(original_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            original_item.setToolTip(original_text)
-            self.subtitle_table.setItem(row, 1, original_item)
-            
-            current_text = data['current']
-            current_display = self.truncate_text(current_text, 150)
-            current_item = QtWidgets.QTableWidgetItem(current_display)
-            current_item.setToolTip(current_text)
-            self.subtitle_table.setItem(row, 2, current_item)
-            
-            has_audio = data.get('has_audio', False)
-            audio_item = QtWidgets.QTableWidgetItem("🔊" if has_audio else "")
-            audio_item.setFlags(audio_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            audio_item.setToolTip(self.tr("has_audio_file") if has_audio else self.tr("no_audio_file"))
-            audio_item.setTextAlignment(QtCore.Qt.AlignCenter)
-            self.subtitle_table.setItem(row, 3, audio_item)
-            
-            is_modified = data.get('is_modified', False)
-            if is_modified:
-                for col in range(4):
-                    item = self.subtitle_table.item(row, col)
-                    if item:
-                        item.setBackground(QtGui.QColor(255, 255, 200))
-            
-            search_text = self.get_global_search_text().lower().strip()
-            if search_text:
-                if (search_text in key.lower() or 
-                    search_text in original_text.lower() or 
-                    search_text in current_text.lower()):
-                    for col in range(4):
-                        item = self.subtitle_table.item(row, col)
-                        if item:
-                            font = item.font()
-                            font.setBold(True)
-                            item.setFont(font)
+        self.subtitle_table_model.set_rows(subtitles_to_show, self.get_global_search_text())
 
     def truncate_text(self, text, max_length):
         """Truncate text for display"""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length-3] + "..."
+        return SubtitleTableModel.truncate_text(text, max_length)
 
-    def edit_subtitle_from_table(self, item):
+    def edit_subtitle_from_table(self, index):
         """Edit subtitle from table double-click"""
-        if not item:
+        if not index or not index.isValid():
             return
             
-        try:
-            row = item.row()
-            key = self.subtitle_table.item(row, 0).text()
-            current_text = self.subtitle_table.item(row, 2).toolTip() or self.subtitle_table.item(row, 2).text()
-            original_text = self.subtitle_table.item(row, 1).toolTip() or self.subtitle_table.item(row, 1).text()
-            
-            stored_key = key
-            stored_row = row
+        key = self.subtitle_table_model.key_at(index.row())
+        data = self.subtitle_table_model.row_data(index.row())
+        if key is None or data is None:
+            return
+
+        current_text = data['current']
+        original_text = data['original']
+        
+        editor = SubtitleEditor(self, key, current_text, original_text)
+        if editor.exec_() == QtWidgets.QDialog.Accepted:
+            new_text = editor.get_text()
+            self.subtitles[key] = new_text
             
-            editor = SubtitleEditor(self, key, current_text, original_text)
-            if editor.exec_() == QtWidgets.QDialog.Accepted:
-                new_text = editor.get_text()
-                self.subtitles[key] = new_text
-                
-                if new_text != original_text:
-                    self.modified_subtitles.add(key)
-                else:
-                    self.modified_subtitles.discard(key)
-                
-                target_row = self.find_table_row_by_key(stored_key)
-                if target_row >= 0:
-                    try:
-                        current_item = self.subtitle_table.item(target_row, 2)
-                        if current_item:
-                            display_text = self.truncate_text(new_text, 150)
-                            current_item.setText(display_text)
-                            current_item.setToolTip(new_text)
-                            
-                            if new_text != original_text:
-                                for col in range(4):
-                                    cell_item = self.subtitle_table.item(target_row, col)
-                                    if cell_item:
-                                        cell_item.setBackground(QtGui.QColor(255, 255, 200))
-                            else:
-                                for col in range(4):
-                                    cell_item = self.subtitle_table.item(target_row, col)
-                                    if cell_item:
-                                        cell_item.setBackground(QtGui.QColor(255, 255, 255))
-                                        
-                    except RuntimeError as e:
-                        DEBUG.log(f"Table item was deleted during update: {e}", "WARNING")
-                        self.load_subtitle_editor_data()
-                else:
-                    DEBUG.log("Table row not found after edit, refreshing")
-                    self.load_subtitle_editor_data()
-                
-                self.update_status()
-                
-        except RuntimeError as e:
-            DEBUG.log(f"Error in edit_subtitle_from_table: {e}", "ERROR")
-            self.load_subtitle_editor_data()
+            if new_text != original_text:
+                self.modified_subtitles.add(key)
+            else:
+                self.modified_subtitles.discard(key)
+            
+            if not self.subtitle_table_model.update_row(key, new_text, new_text != original_text):
+                DEBUG.log("Table row not found after edit, refreshing")
+                self.load_subtitle_editor_data()
+            
+            self.update_status()
 
     def find_table_row_by_key(self, target_key):
         """Find table row by subtitle key"""
-        for row in range(self.subtitle_table.rowCount()):
-            try:
-                key_item = self.subtitle_table.item(row, 0)
-                if key_item and key_item.text() == target_key:
-                    return row
-            except RuntimeError:
-                continue
-        return -1
+        return self.subtitle_table_model.row_for_key(target_key)
 
     def edit_selected_subtitle(self):
         """Edit currently selected subtitle"""
-        current_row = self.subtitle_table.currentRow()
-        if current_row >= 0:
-            item = self.subtitle_table.item(current_row, 0)
-            if item:
-                self.edit_subtitle_from_table(item)
+        index = self.subtitle_table.currentIndex()
+        if index.isValid():
+            self.edit_subtitle_from_table(index)
 
     def save_all_subtitle_changes(self):
         """Save all subtitle changes to working files"""
@@ -3709,21 +6463,23 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
     def show_subtitle_table_context_menu(self, pos):
         """Show context menu for subtitle table"""
-        item = self.subtitle_table.itemAt(pos)
-        if not item:
+        index = self.subtitle_table.indexAt(pos)
+        if not index.isValid():
             return
         
-        row = item.row()
-        key = self.subtitle_table.item(row, 0).text()
-        has_audio = self.subtitle_table.item(row, 3).text() == "🔊"
+        key = self.subtitle_table_model.key_at(index.row())
+        data = self.subtitle_table_model.row_data(index.row())
+        if key is None or data is None:
+            return
+        has_audio = data.get('has_audio', False)
         
         menu = QtWidgets.QMenu()
         
         edit_action = menu.addAction("✏ Edit Subtitle")
-        edit_action.triggered.connect(lambda: self.edit_subtitle_from_table(item))
+        edit_action.triggered.connect(lambda: self.edit_subtitle_from_table(index))
         
         revert_action = menu.addAction("↩ Revert to Original")
-        revert_action.triggered.connect(lambda: self.revert_subtitle_from_table(row, key))
+        revert_action.triggered.connect(lambda: self.revert_subtitle_from_table(key))
         
         menu.addSeparator()
         
@@ -3737,10 +6493,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         copy_key_action.triggered.connect(lambda: QtWidgets.QApplication.clipboard().setText(key))
         
         copy_text_action = menu.addAction("📋 Copy Text")
-        current_text = self.subtitle_table.item(row, 2).toolTip() or self.subtitle_table.item(row, 2).text()
+        current_text = data['current']
         copy_text_action.triggered.connect(lambda: QtWidgets.QApplication.clipboard().setText(current_text))
         
-        menu.exec_(self.subtitle_table.mapToGlobal(pos))
+        menu.exec_(self.subtitle_table.viewport().mapToGlobal(pos))
 
     def go_to_audio_file(self, subtitle_key):
         """Navigate to audio file corresponding to subtitle"""
@@ -3791,61 +6547,32 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if lang not in self.tab_widgets:
             return
         
-        tree = self.tab_widgets[lang]["tree"]
+        model = self.tab_widgets[lang]["tree_model"]
         target_id = target_entry.get("Id", "")
         target_shortname = target_entry.get("ShortName", "")
         
-        def search_items(parent_item):
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                
-                if item.childCount() == 0:
-                    try:
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            if (entry.get("Id") == target_id or 
-                                entry.get("ShortName") == target_shortname):
-                                tree.clearSelection()
-                                tree.setCurrentItem(item)
-                                item.setSelected(True)
-                                
-                                parent = item.parent()
-                                if parent:
-                                    parent.setExpanded(True)
-                                
-                                tree.scrollToItem(item)
-                                self.on_selection_changed(lang)
-                                
-                                return True
-                    except RuntimeError:
-                        continue
-                else:
-                    if search_items(item):
-                        return True
-            return False
-        
-        try:
-            root = tree.invisibleRootItem()
-            if not search_items(root):
-                DEBUG.log(f"Could not find item in tree for: {target_shortname}")
-        except RuntimeError:
-            pass
+        index = model.index_for_key(os.path.splitext(target_shortname)[0])
+        if not index.isValid():
+            index = model.index_for_id(target_id)
+        if not index.isValid():
+            DEBUG.log(f"Could not find item in tree for: {target_shortname}")
+            return
 
-    def revert_subtitle_from_table(self, row, key):
+        self.select_tree_index(lang, index)
+        self.on_selection_changed(lang)
+
+    def revert_subtitle_from_table(self, key):
         """Revert subtitle to original from table"""
-        original_text = self.subtitle_table.item(row, 1).toolTip() or self.subtitle_table.item(row, 1).text()
+        row = self.subtitle_table_model.row_for_key(key)
+        data = self.subtitle_table_model.row_data(row)
+        if data is None:
+            return
+        original_text = data['original']
         
         self.subtitles[key] = original_text
         self.modified_subtitles.discard(key)
         
-        current_item = self.subtitle_table.item(row, 2)
-        current_item.setText(self.truncate_text(original_text, 150))
-        current_item.setToolTip(original_text)
-        
-        for col in range(4):
-            item = self.subtitle_table.item(row, col)
-            if item:
-                item.setBackground(QtGui.QColor(255, 255, 255))
+        self.subtitle_table_model.update_row(key, original_text, False)
         
         self.update_status()
 
@@ -4091,6 +6818,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                             classification += " (duplicate renamed)"
                         
                         shutil.move(src_path, dest_path)
+                        self.mod_file_written(dest_path)
                         processed += 1
                         
                         if is_voice:
@@ -4111,6 +6839,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                         DEBUG.log(f"Error processing {filename}: {e}", "ERROR")
                         
         progress.close()
+        self.watch_mod_folders()
+        self.refresh_mod_trees()
         
         success_rate = (renamed_count / voice_processed * 100) if voice_processed > 0 else 0
         
@@ -4134,6 +6864,45 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             f"Kept original names: {processed - renamed_count}"
         )
 
+    def get_subtitle_key_index(self, language):
+        """Return the key -> subtitle files index for a language"""
+        return self.subtitle_store.key_index(language)
+
+    def group_modified_subtitles_by_file(self, language, skip_original_copies=False):
+        """Group modified subtitles by their source file with a single read per file"""
+        index = self.get_subtitle_key_index(language)
+        files = {}
+
+        for modified_key in self.modified_subtitles:
+            found_in_file = None
+            found_file_key = None
+            for file_key in index.get(modified_key, []):
+                file_info = self.all_subtitle_files.get(file_key)
+                if not file_info:
+                    continue
+                if skip_original_copies and '.original.' in file_info['filename']:
+                    continue
+                found_in_file = file_info
+                found_file_key = file_key
+                break
+
+            if not found_in_file:
+                DEBUG.log(f"Warning: Could not find source file for modified key: {modified_key}", "WARNING")
+                continue
+
+            file_path = found_in_file['path']
+            if file_path not in files:
+                files[file_path] = {
+                    'file_info': found_in_file,
+                    'file_key': found_file_key,
+                    'all_subtitles': self.subtitle_store.file_subtitles(found_file_key),
+                    'working_path': file_path.replace('.locres', '_working.locres')
+                }
+
+            files[file_path]['all_subtitles'][modified_key] = self.subtitles[modified_key]
+
+        return files
+
     def save_subtitles_to_file(self):
 
         DEBUG.log("=== Saving Subtitles (Fixed) ===")
@@ -4146,42 +6915,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             saved_files = 0
             current_language = self.settings.data["subtitle_lang"]
 
-            files_to_save = {}
-            
-            for modified_key in self.modified_subtitles:
-                found_in_file = None
-                
-                for file_key, file_info in self.all_subtitle_files.items():
-                    if file_info['language'] != current_language:
-                        continue
-                    
-                    if '.original.' in file_info['filename']:
-                        continue
-
-                    working_path = file_info['path'].replace('.locres', '_working.locres')
-                    check_path = working_path if os.path.exists(working_path) else file_info['path']
-                    
-                    file_subtitles = self.locres_manager.export_locres(check_path)
-                    if modified_key in file_subtitles:
-                        found_in_file = file_info
-                        break
-                
-                if found_in_file:
-                    file_path = found_in_file['path']
-                    if file_path not in files_to_save:
-
-                        working_path = file_path.replace('.locres', '_working.locres')
-                        source_path = working_path if os.path.exists(working_path) else file_path
-                        
-                        files_to_save[file_path] = {
-                            'file_info': found_in_file,
-                            'all_subtitles': self.locres_manager.export_locres(source_path),
-                            'working_path': working_path
-                        }
-
-                    files_to_save[file_path]['all_subtitles'][modified_key] = self.subtitles[modified_key]
-                else:
-                    DEBUG.log(f"Warning: Could not find source file for modified key: {modified_key}", "WARNING")
+            files_to_save = self.group_modified_subtitles_by_file(current_language, skip_original_copies=True)
             
             DEBUG.log(f"Found {len(files_to_save)} files to save for language {current_language}")
             
@@ -4203,6 +6937,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     DEBUG.log(f"Created working copy from original: {file_path}")
 
                 success = self.locres_manager.import_locres(working_path, all_subtitles)
+                self.subtitle_store.invalidate_file(data['file_key'])
                 
                 if success:
                     saved_files += 1
@@ -4298,6 +7033,52 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
         layout.addRow(f"{self.tr("wem_process_language")}", wem_lang_combo)
 
+        audio_cache_spin = QtWidgets.QSpinBox()
+        audio_cache_spin.setRange(0, 16384)
+        audio_cache_spin.setSingleStep(128)
+        audio_cache_spin.setSuffix(" MB")
+        audio_cache_spin.setValue(self.settings.data.get("audio_cache_mb", 512))
+        audio_cache_spin.setToolTip(self.tr("audio_cache_size_desc"))
+        layout.addRow(self.tr("audio_cache_size"), audio_cache_spin)
+
+        prefetch_spin = QtWidgets.QSpinBox()
+        prefetch_spin.setRange(0, 10)
+        prefetch_spin.setValue(self.settings.data.get("prefetch_count", 2))
+        prefetch_spin.setToolTip(self.tr("prefetch_count_desc"))
+        layout.addRow(self.tr("prefetch_count"), prefetch_spin)
+
+        export_workers_spin = QtWidgets.QSpinBox()
+        export_workers_spin.setRange(0, 64)
+        export_workers_spin.setSpecialValueText(f"Auto ({os.cpu_count() or 4})")
+        export_workers_spin.setValue(self.settings.data.get("export_workers", 0))
+        layout.addRow(self.tr("export_workers"), export_workers_spin)
+
+        conversion_workers_spin = QtWidgets.QSpinBox()
+        conversion_workers_spin.setRange(0, 32)
+        conversion_workers_spin.setSpecialValueText(f"Auto ({os.cpu_count() or 1})")
+        conversion_workers_spin.setValue(self.settings.data.get("conversion_workers", 0))
+        layout.addRow(self.tr("conversion_workers"), conversion_workers_spin)
+
+        batch_conversion_check = QtWidgets.QCheckBox(self.tr("batch_conversion"))
+        batch_conversion_check.setChecked(self.settings.data.get("batch_conversion", True))
+        batch_conversion_check.setToolTip(self.tr("batch_conversion_desc"))
+        layout.addRow(batch_conversion_check)
+
+        parallel_probes_spin = QtWidgets.QSpinBox()
+        parallel_probes_spin.setRange(0, 12)
+        parallel_probes_spin.setSpecialValueText("Auto")
+        parallel_probes_spin.setValue(self.settings.data.get("parallel_probes", 0))
+        parallel_probes_spin.setToolTip(self.tr("parallel_probes_desc"))
+        layout.addRow(self.tr("parallel_probes"), parallel_probes_spin)
+
+        conversion_cache_spin = QtWidgets.QSpinBox()
+        conversion_cache_spin.setRange(0, 65536)
+        conversion_cache_spin.setSingleStep(256)
+        conversion_cache_spin.setSuffix(" MB")
+        conversion_cache_spin.setValue(self.settings.data.get("conversion_cache_mb", 1024))
+        conversion_cache_spin.setToolTip(self.tr("conversion_cache_size_desc"))
+        layout.addRow(self.tr("conversion_cache_size"), conversion_cache_spin)
+
         btn_box = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
         )
@@ -4318,7 +7099,17 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.settings.data["game_path"] = game_path_edit.text()
             self.settings.data["auto_save"] = auto_save_check.isChecked()
             self.settings.data["wem_process_language"] = wem_lang_combo.currentData() 
+            self.settings.data["audio_cache_mb"] = audio_cache_spin.value()
+            self.settings.data["prefetch_count"] = prefetch_spin.value()
+            self.settings.data["export_workers"] = export_workers_spin.value()
+            self.settings.data["conversion_workers"] = conversion_workers_spin.value()
+            self.settings.data["batch_conversion"] = batch_conversion_check.isChecked()
+            self.settings.data["parallel_probes"] = parallel_probes_spin.value()
+            self.settings.data["conversion_cache_mb"] = conversion_cache_spin.value()
             self.settings.save()
+            self.audio_cache.set_max_bytes(audio_cache_spin.value() * 1024 * 1024)
+            if hasattr(self, 'wav_converter') and self.wav_converter.result_cache:
+                self.wav_converter.result_cache.set_max_bytes(conversion_cache_spin.value() * 1024 * 1024)
 
             if wem_lang_combo.currentData() != old_wem_lang:
                 DEBUG.log(f"WEM process language changed: {old_wem_lang} → {wem_lang_combo.currentData()}")
@@ -4335,8 +7126,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
             if subtitle_combo.currentText() != old_lang:
                 DEBUG.log(f"Subtitle language changed from {old_lang} to {subtitle_combo.currentText()}")
-                self.load_subtitles()
-                self.modified_subtitles.clear()
+                self.switch_subtitle_language(subtitle_combo.currentText())
 
                 for lang in list(self.populated_tabs):
                     self.populate_tree(lang)
@@ -4466,170 +7256,82 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
         widgets = self.tab_widgets[lang]
         tree = widgets["tree"]
-        selected_keys = []
-        try:
-            for item in tree.selectedItems():
-                if item.childCount() == 0:  # Leaf item
-                    entry = item.data(0, QtCore.Qt.UserRole)
-                    if entry:
-                        shortname = entry.get("ShortName", "")
-                        key = os.path.splitext(shortname)[0]
-                        selected_keys.append(key)
-        except RuntimeError:
-
-            pass
+        model = widgets["tree_model"]
+        selected_keys = [
+            os.path.splitext(entry.get("ShortName", ""))[0]
+            for entry in self.get_selected_entries(lang)
+        ]
         filter_type = widgets["filter_combo"].currentIndex()
         sort_type = widgets["sort_combo"].currentIndex()
         search_text = self.global_search.text().lower()
         
-        try:
-            tree.clear()
-        except RuntimeError:
-            DEBUG.log("Error clearing tree, creating new tree", "WARNING")
-   
-            return
+        entries = self.entries_by_lang.get(lang, [])
+        if model.source is not entries or len(model.records) != len(entries):
+            model.set_entries(entries)
+
+        mod_ids = self.mod_files.ids_for(lang)
         
-        filtered_entries = []
-        for entry in self.entries_by_lang.get(lang, []):
-            shortname = entry.get("ShortName", "")
-            key = os.path.splitext(shortname)[0]
-            subtitle = self.subtitles.get(key, "")
-            if lang != "SFX":
-                mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{entry.get('Id', '')}.wem")
-            else:
-                mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{entry.get('Id', '')}.wem")
-            has_mod_audio = os.path.exists(mod_wem_path)
-            
-            if filter_type == 1 and not subtitle:  # With subtitles
-                continue
-            elif filter_type == 2 and subtitle:  # Without subtitles
-                continue
-            elif filter_type == 3 and key not in self.modified_subtitles:  # Modified
-                continue
-            elif filter_type == 4 and not has_mod_audio:  # Modded (audio)
-                continue
-                
-            if search_text:
-                searchable = f"{entry.get('Id', '')} {shortname} {subtitle}".lower()
-                if search_text not in searchable:
-                    continue
-                    
-            filtered_entries.append(entry)
-        
-        DEBUG.log(f"Filtered entries: {len(filtered_entries)} out of {len(self.entries_by_lang.get(lang, []))}")
-        
-        if sort_type == 0:  # Name A-Z
-            filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower())
-        elif sort_type == 1:  # Name Z-A
-            filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower(), reverse=True)
-        elif sort_type == 2:  # ID ascending
-            filtered_entries.sort(key=lambda x: int(x.get("Id", "0")))
-        elif sort_type == 3:  # ID descending
-            filtered_entries.sort(key=lambda x: int(x.get("Id", "0")), reverse=True)
-        
-        groups = {}
-        vo_count = 0
-        for entry in filtered_entries:
-            shortname = entry.get("ShortName", "")
-            parts = shortname.replace(".wav", "").split("_")
-            
-            if len(parts) >= 3 and parts[0] == "VO":
-                group = f"{parts[1]}_{parts[2]}"
-                vo_count += 1
-            else:
-                group = "Other"
-                
-            groups.setdefault(group, []).append(entry)
+        filtered_records = model.apply_filter(
+            self.subtitles, self.modified_subtitles, mod_ids, filter_type, sort_type, search_text,
+            self.wem_index.language_rows("original", lang)
+        )
         
-        DEBUG.log(f"VO files found: {vo_count}")
-        DEBUG.log(f"Groups created: {len(groups)}")
+        DEBUG.log(f"Filtered entries: {len(filtered_records)} out of {len(entries)}")
+        DEBUG.log(f"VO files found: {sum(len(records) for name, records in model.groups if name != 'Other')}")
+        DEBUG.log(f"Groups created: {len(model.groups)}")
         
-        # Populate tree
-        for group_name in sorted(groups.keys()):
-            group_item = QtWidgets.QTreeWidgetItem(tree, [f"{group_name} ({len(groups[group_name])})", "", "", ""])
-            group_item.setExpanded(True)
-            
-            for entry in groups[group_name]:
-                shortname = entry.get("ShortName", "")
-                key = os.path.splitext(shortname)[0]
-                subtitle = self.subtitles.get(key, "")
-                
-                mod_status = ""
-                if lang != "SFX":
-                    mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{entry.get('Id', '')}.wem")
-                else:
-                    mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{entry.get('Id', '')}.wem")
-                if os.path.exists(mod_wem_path):
-                    mod_status = "♪"
-                
-                item = QtWidgets.QTreeWidgetItem(group_item, [
-                    shortname,
-                    entry.get("Id", ""),
-                    subtitle,
-                    "✓" + mod_status if key in self.modified_subtitles else mod_status
-                ])
-                
-
-                item.setData(0, QtCore.Qt.UserRole, entry)
-                
-
-                if not subtitle:
-                    item.setForeground(2, QtGui.QBrush(QtGui.QColor(128, 128, 128)))
-                    
-                if entry.get("Source") == "MediaFilesNotInAnyBank":
-                    item.setForeground(0, QtGui.QBrush(QtGui.QColor(100, 100, 200)))
+        tree.expandAll()
         
         if selected_keys:
-                self.restore_tree_selection(tree, selected_keys)
-        subtitle_count = sum(1 for entry in filtered_entries if self.subtitles.get(os.path.splitext(entry.get("ShortName", ""))[0], ""))
-        widgets["stats_label"].setText(f"Showing {len(filtered_entries)} of {len(self.entries_by_lang.get(lang, []))} files | Subtitles: {subtitle_count}")
+            self.restore_tree_selection(lang, selected_keys)
+        subtitle_count = sum(1 for record in filtered_records if self.subtitles.get(record['key'], ""))
+        widgets["stats_label"].setText(f"Showing {len(filtered_records)} of {len(entries)} files | Subtitles: {subtitle_count}")
     
-    def restore_tree_selection(self, tree, target_keys):
+    def restore_tree_selection(self, lang, target_keys):
         """Restore tree selection after refresh"""
-        def search_and_select(parent_item):
-            for i in range(parent_item.childCount()):
-                try:
-                    item = parent_item.child(i)
-                    if item.childCount() == 0:  # Leaf item
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            shortname = entry.get("ShortName", "")
-                            key = os.path.splitext(shortname)[0]
-                            if key in target_keys:
-                                item.setSelected(True)
-                                tree.setCurrentItem(item)
-                                return True
-                    else:
-                        if search_and_select(item):
-                            return True
-                except RuntimeError:
-                    continue
-            return False
-        
-        try:
-            root = tree.invisibleRootItem()
-            search_and_select(root)
-        except RuntimeError:
-            pass
+        model = self.tab_widgets[lang]["tree_model"]
+        for key in target_keys:
+            index = model.index_for_key(key)
+            if index.isValid():
+                self.select_tree_index(lang, index)
+                return
+
+    def get_selected_tree_indexes(self, lang):
+        """Selected rows of a language tree (column 0 indexes)"""
+        return self.tab_widgets[lang]["tree"].selectionModel().selectedRows(0)
+
+    def get_selected_entries(self, lang):
+        """Entries of all selected file rows, skipping groups"""
+        model = self.tab_widgets[lang]["tree_model"]
+        entries = []
+        for index in self.get_selected_tree_indexes(lang):
+            entry = model.entry_for_index(index)
+            if entry:
+                entries.append(entry)
+        return entries
+
+    def get_selected_entry(self, lang):
+        """Entry of the first selected row, or None if nothing or a group is selected"""
+        indexes = self.get_selected_tree_indexes(lang)
+        if not indexes:
+            return None
+        return self.tab_widgets[lang]["tree_model"].entry_for_index(indexes[0])
+
+    def select_tree_index(self, lang, index):
+        tree = self.tab_widgets[lang]["tree"]
+        tree.expand(index.parent())
+        tree.selectionModel().setCurrentIndex(
+            index, QtCore.QItemSelectionModel.ClearAndSelect | QtCore.QItemSelectionModel.Rows
+        )
+        tree.scrollTo(index)
 
     def on_selection_changed(self, lang):
         """Updated selection handler without summary"""
         widgets = self.tab_widgets[lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
-        
-        if not items:
-            widgets["play_mod_btn"].hide()
-            return
-            
-        item = items[0]
-        if item.childCount() > 0:  # Group item
-            widgets["play_mod_btn"].hide()
-            return
-            
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(lang)
         if not entry:
             widgets["play_mod_btn"].hide()
+            self.audio_prefetcher.cancel()
             return
 
         shortname = entry.get("ShortName", "")
@@ -4653,37 +7355,85 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         
         # Check for mod file
         file_id = entry.get("Id", "")
-        if lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{file_id}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{file_id}.wem")
-        
-        has_mod = os.path.exists(mod_wem_path)
+        has_mod = self.mod_files.has(lang, file_id)
         widgets["play_mod_btn"].setVisible(has_mod)
         
-        self.load_audio_comparison_info(file_id, lang, widgets)
-    def load_audio_comparison_info(self, file_id, lang, widgets):
+        self.request_audio_details(file_id, lang, widgets)
+        self.schedule_prefetch(lang)
+
+    def schedule_prefetch(self, lang):
+        """Decode the selected entry's neighbours in tree order so stepping through them plays instantly"""
+        count = self.settings.data.get("prefetch_count", 2)
+        indexes = self.get_selected_tree_indexes(lang)
+        if count <= 0 or self.audio_cache.max_bytes <= 0 or len(indexes) != 1:
+            self.audio_prefetcher.cancel()
+            return
+
+        model = self.tab_widgets[lang]["tree_model"]
+        wem_paths = []
+        for entry in [model.entry_for_index(indexes[0])] + model.neighbour_entries(indexes[0], count):
+            file_id = entry.get("Id", "")
+            original_wem_path = os.path.join(self.wem_root, lang, f"{file_id}.wem")
+            if os.path.exists(original_wem_path):
+                wem_paths.append(original_wem_path)
+            if self.mod_files.has(lang, file_id):
+                wem_paths.append(self.mod_files.path_for(lang, file_id))
+        self.audio_prefetcher.schedule(wem_paths)
+
+    def request_audio_details(self, file_id, lang, widgets):
+        """Load durations, bitrates and markers off the GUI thread; only the newest request is shown"""
+        self.details_generation += 1
+        generation = self.details_generation
+
+        for labels in (widgets["original_info_labels"], widgets["modified_info_labels"]):
+            for label in labels.values():
+                label.setText("...")
+        for markers_list in (widgets["original_markers_list"], widgets["modified_markers_list"]):
+            markers_list.clear()
+            markers_list.addItem("Loading...")
+
+        self.details_executor.submit(self._load_audio_details, generation, file_id, lang)
+
+    def _load_audio_details(self, generation, file_id, lang):
+        is_stale = lambda: generation != self.details_generation
+        if is_stale():
+            return
+        try:
+            original_info, modified_info = self.read_audio_comparison_info(file_id, lang, is_stale)
+        except Exception as e:
+            DEBUG.log(f"Error loading audio details for {file_id}: {e}", "ERROR")
+            original_info, modified_info = None, None
+        if not is_stale():
+            self.audioDetailsLoaded.emit(generation, lang, original_info, modified_info)
+
+    def on_audio_details_loaded(self, generation, lang, original_info, modified_info):
+        if generation != self.details_generation or lang not in self.tab_widgets:
+            return
+        self.show_audio_comparison_info(self.tab_widgets[lang], original_info, modified_info)
 
+    def read_audio_comparison_info(self, file_id, lang, is_stale=None):
+        """Return (original_info, modified_info); safe to call from a worker thread"""
         original_wem_path = os.path.join(self.wem_root, lang, f"{file_id}.wem")
-        
-        if lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{file_id}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{file_id}.wem")
+        mod_wem_path = self.mod_files.path_for(lang, file_id)
         
         original_info = None
         if os.path.exists(original_wem_path):
             original_info = self.get_wem_audio_info_with_markers(original_wem_path)
             if original_info:
                 original_info['file_size'] = os.path.getsize(original_wem_path)
+
+        if is_stale and is_stale():
+            return None, None
         
         modified_info = None
-        modified_exists = os.path.exists(mod_wem_path)
-        if modified_exists:
+        if self.mod_files.has(lang, file_id):
             modified_info = self.get_wem_audio_info_with_markers(mod_wem_path)
             if modified_info:
                 modified_info['file_size'] = os.path.getsize(mod_wem_path)
-        
+
+        return original_info, modified_info
+
+    def show_audio_comparison_info(self, widgets, original_info, modified_info):
         if original_info:
             formatted_original = self.format_audio_info(original_info)
             widgets["original_info_labels"]["duration"].setText(formatted_original["duration"])
@@ -4711,7 +7461,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             widgets["original_markers_list"].clear()
             widgets["original_markers_list"].addItem("File not available")
         
-        if modified_exists and modified_info:
+        if modified_info:
             formatted_modified = self.format_audio_info(modified_info)
             widgets["modified_info_labels"]["duration"].setText(formatted_modified["duration"])
             widgets["modified_info_labels"]["sample_rate"].setText(formatted_modified["sample_rate"])
@@ -4765,13 +7515,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             widgets["info_labels"]["duration"].setText("N/A")
             
 
-        if lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{file_id}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{file_id}.wem")
+        mod_wem_path = self.mod_files.path_for(lang, file_id)
         self.mod_duration = 0
         
-        if os.path.exists(mod_wem_path):
+        if self.mod_files.has(lang, file_id):
             duration = self.get_wem_duration(mod_wem_path)
             if duration > 0:
                 self.mod_duration = duration
@@ -4786,33 +7533,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     
     def get_wem_duration(self, wem_path):
         """Get the duration of a WEM file in milliseconds"""
-        try:
-            result = subprocess.run(
-                [self.vgmstream_path, "-m", wem_path],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                startupinfo=startupinfo,
-                creationflags=CREATE_NO_WINDOW
-            )
-            
-            if result.returncode == 0:
-                samples = None
-                sample_rate = 48000  # default
-                
-                for line in result.stdout.split('\n'):
-                    if "stream total samples:" in line:
-                        samples = int(line.split(':')[1].strip().split()[0])
-                    elif "sample rate:" in line:
-                        sample_rate = int(line.split(':')[1].strip().split()[0])
-                
-                if samples:
-                    duration_ms = int((samples / sample_rate) * 1000)
-                    return duration_ms
-                    
-        except Exception as e:
-            DEBUG.log(f"Error getting duration: {e}", "ERROR")
-            
+        info = self.get_wem_audio_info_with_markers(wem_path)
+        if info:
+            return info['duration_ms']
         return 0   
     def get_file_size(self, file_id, lang, widgets):
         """Get the size of both original and mod WEM files"""
@@ -4825,12 +7548,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.original_size = 0
             widgets["info_labels"]["size"].setText("N/A")
             
-        if lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{file_id}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{file_id}.wem")
+        mod_wem_path = self.mod_files.path_for(lang, file_id)
         
-        if os.path.exists(mod_wem_path):
+        if self.mod_files.has(lang, file_id):
             self.mod_size = os.path.getsize(mod_wem_path)
             widgets["info_labels"]["mod_size"].setText(f"{self.mod_size / 1024:.1f} KB")
             
@@ -4851,15 +7571,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not current_lang or current_lang not in self.tab_widgets:
             return
             
-        widgets = self.tab_widgets[current_lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
-        
-        if not items or items[0].childCount() > 0:
-            return
-            
-        item = items[0]
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(current_lang)
         if not entry:
             return
             
@@ -4867,11 +7579,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         
         if play_mod:
        
-            if current_lang != "SFX":
-                wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", current_lang, f"{entry.get('Id', '')}.wem")
-            else:
-                wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{entry.get('Id', '')}.wem")
-            if not os.path.exists(wem_path):
+            wem_path = self.mod_files.path_for(current_lang, id_)
+            if not self.mod_files.has(current_lang, id_):
                 self.status_bar.showMessage("Mod audio not found", 3000)
                 return
             self.is_playing_mod = True
@@ -4883,6 +7592,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.is_playing_mod = False
             
         source_type = "MOD" if play_mod else "Original"
+        cached_wav = self.audio_cache.get(wem_path)
+        if cached_wav:
+            self._play_converted(True, cached_wav, "", current_lang)
+            return
+
         self.status_bar.showMessage(f"Converting {source_type} to WAV...")
         QtWidgets.QApplication.processEvents()
         
@@ -4892,7 +7606,12 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         thread.start()
 
     def _convert_and_play(self, wem_path, wav_path, lang):
-        ok, err = self.wem_to_wav_vgmstream(wem_path, wav_path)
+        if self.audio_cache.max_bytes > 0:
+            ok, cached_wav, err = self.audio_cache.decode(wem_path, self.wem_to_wav_vgmstream)
+            if ok:
+                wav_path = cached_wav
+        else:
+            ok, err = self.wem_to_wav_vgmstream(wem_path, wav_path)
         
         QtCore.QMetaObject.invokeMethod(self, "_play_converted", 
                                        QtCore.Qt.QueuedConnection,
@@ -4904,7 +7623,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     @QtCore.pyqtSlot(bool, str, str, str)
     def _play_converted(self, ok, wav_path, error, lang):
         if ok:
-            self.temp_wav = wav_path
+            # Files from the decoded audio cache outlive playback; only one-off conversions are deleted
+            self.temp_wav = None if os.path.dirname(wav_path) == self.audio_cache.cache_dir else wav_path
             self.audio_player.play(wav_path)
             source_type = "MOD" if self.is_playing_mod else "Original"
             self.status_bar.showMessage(f"Playing {source_type} audio...", 2000)
@@ -4962,14 +7682,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             return
             
         widgets = self.tab_widgets[current_lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
-        
-        if not items or items[0].childCount() > 0:
-            return
-            
-        item = items[0]
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(current_lang)
         if not entry:
             return
             
@@ -4978,9 +7691,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         current_subtitle = self.subtitles.get(key, "")
         original_subtitle = self.original_subtitles.get(key, "")
         
-        item_key = key
-        item_entry = entry.copy() if isinstance(entry, dict) else entry
-        
         DEBUG.log(f"Editing subtitle for: {key}")
         DEBUG.log(f"Current subtitle: {current_subtitle[:50] if current_subtitle else 'None'}...")
         
@@ -4998,88 +7708,23 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             DEBUG.log(f"Subtitle updated for {key}")
             DEBUG.log(f"New subtitle: {new_subtitle[:50]}...")
             
-            updated_item = self.find_tree_item_by_key(tree, item_key, item_entry)
-            
-            if updated_item and not self.is_item_deleted(updated_item):
-                try:
-    
-                    updated_item.setText(2, new_subtitle)
-                    
-                    current_status = updated_item.text(3).replace("✓", "")  # Remove existing checkmark
-                    if key in self.modified_subtitles:
-                        updated_item.setText(3, "✓" + current_status)
-                    else:
-                        updated_item.setText(3, current_status)
-                        
-                except RuntimeError as e:
-                    DEBUG.log(f"Item was deleted during update, refreshing tree: {e}", "WARNING")
-             
-                    self.populate_tree(current_lang)
-            else:
-
+            if not widgets["tree_model"].refresh_key(key):
                 DEBUG.log("Item not found after edit, refreshing tree")
                 self.populate_tree(current_lang)
             
-            try:
-                current_items = tree.selectedItems()
-                if current_items and len(current_items) > 0:
-                    current_item = current_items[0]
-                    current_entry = current_item.data(0, QtCore.Qt.UserRole)
-                    if current_entry and current_entry.get("ShortName") == shortname:
-                        # Update details
-                        widgets["subtitle_text"].setPlainText(new_subtitle)
-                        if original_subtitle and original_subtitle != new_subtitle:
-                            widgets["original_subtitle_label"].setText(f"{self.tr('original')}: {original_subtitle}")
-                            widgets["original_subtitle_label"].show()
-                        else:
-                            widgets["original_subtitle_label"].hide()
-            except RuntimeError:
-        
-                pass
+            current_entry = self.get_selected_entry(current_lang)
+            if current_entry and current_entry.get("ShortName") == shortname:
+                # Update details
+                widgets["subtitle_text"].setPlainText(new_subtitle)
+                if original_subtitle and original_subtitle != new_subtitle:
+                    widgets["original_subtitle_label"].setText(f"{self.tr('original')}: {original_subtitle}")
+                    widgets["original_subtitle_label"].show()
+                else:
+                    widgets["original_subtitle_label"].hide()
             
             self.status_bar.showMessage("Subtitle updated", 2000)
             self.update_status()
 
-    def find_tree_item_by_key(self, tree, target_key, target_entry):
-        """Find tree item by key and entry data"""
-        def search_items(parent_item):
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                
-                if item.childCount() == 0: 
-                    try:
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            shortname = entry.get("ShortName", "")
-                            key = os.path.splitext(shortname)[0]
-                            
-                            if key == target_key:
-                                return item
-                    except RuntimeError:
-                  
-                        continue
-                else:
-           
-                    result = search_items(item)
-                    if result:
-                        return result
-            return None
-        
-        try:
-            root = tree.invisibleRootItem()
-            return search_items(root)
-        except RuntimeError:
-            return None
-
-    def is_item_deleted(self, item):
-        """Check if QTreeWidgetItem is still valid"""
-        try:
- 
-            _ = item.text(0)
-            return False
-        except RuntimeError:
-            return True
-
     def revert_subtitle(self):
         """Revert selected subtitle to original"""
         current_lang = self.get_current_language()
@@ -5087,14 +7732,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             return
             
         widgets = self.tab_widgets[current_lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
-        
-        if not items or items[0].childCount() > 0:
-            return
-            
-        item = items[0]
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(current_lang)
         if not entry:
             return
             
@@ -5107,9 +7745,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.modified_subtitles.discard(key)
             
 
-            item.setText(2, original)
-            current_status = item.text(3).replace("✓", "")
-            item.setText(3, current_status)
+            widgets["tree_model"].refresh_key(key)
             
             widgets["subtitle_text"].setPlainText(original)
             widgets["original_subtitle_label"].hide()
@@ -5307,38 +7943,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             exported_files = 0
             
             # Group modified subtitles by their source files
-            subtitle_files_to_update = {}
-            
-            for modified_key in self.modified_subtitles:
-                found_in_file = None
-                
-                for file_key, file_info in self.all_subtitle_files.items():
-                    if file_info['language'] != current_language:
-                        continue
-                        
-                    working_path = file_info['path'].replace('.locres', '_working.locres')
-                    check_path = working_path if os.path.exists(working_path) else file_info['path']
-                    
-                    file_subtitles = self.locres_manager.export_locres(check_path)
-                    if modified_key in file_subtitles:
-                        found_in_file = file_info
-                        break
-                
-                if found_in_file:
-                    file_path = found_in_file['path']
-                    if file_path not in subtitle_files_to_update:
-                        working_path = file_path.replace('.locres', '_working.locres')
-                        source_path = working_path if os.path.exists(working_path) else file_path
-                        
-                        subtitle_files_to_update[file_path] = {
-                            'file_info': found_in_file,
-                            'all_subtitles': self.locres_manager.export_locres(source_path),
-                            'working_path': working_path
-                        }
-
-                    subtitle_files_to_update[file_path]['all_subtitles'][modified_key] = self.subtitles[modified_key]
-                else:
-                    DEBUG.log(f"Warning: Could not find source file for modified key: {modified_key}", "WARNING")
+            subtitle_files_to_update = self.group_modified_subtitles_by_file(current_language)
             
             DEBUG.log(f"Found {len(subtitle_files_to_update)} files to save for language {current_language}")
             
@@ -5415,22 +8020,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not current_lang or current_lang not in self.tab_widgets:
             return
             
-        widgets = self.tab_widgets[current_lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
+        indexes = self.get_selected_tree_indexes(current_lang)
         
-        if not items:
+        if not indexes:
             return
 
-        if len(items) > 1:
-            self.batch_export_wav(items, current_lang)
-            return
-            
-        item = items[0]
-        if item.childCount() > 0:
+        if len(indexes) > 1:
+            self.batch_export_wav(self.get_selected_entries(current_lang), current_lang)
             return
             
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(current_lang)
         if not entry:
             return
             
@@ -5444,11 +8043,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         original_btn = msg.addButton(self.tr("original"), QtWidgets.QMessageBox.ActionRole)
         mod_btn = None
         
-        if current_lang != "SFX":
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", current_lang, f"{entry.get('Id', '')}.wem")
-        else:
-            mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{entry.get('Id', '')}.wem")
-        if os.path.exists(mod_wem_path):
+        mod_wem_path = self.mod_files.path_for(current_lang, id_)
+        if self.mod_files.has(current_lang, id_):
             mod_btn = msg.addButton(self.tr("mod"), QtWidgets.QMessageBox.ActionRole)
             
         msg.addButton(QtWidgets.QMessageBox.Cancel)
@@ -5480,7 +8076,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             else:
                 QtWidgets.QMessageBox.warning(self, "Error", f"Conversion failed: {err}")
 
-    def wem_to_wav_vgmstream(self, wem_path, wav_path):
+    def wem_to_wav_vgmstream(self, wem_path, wav_path, low_priority=False):
         try:
             result = subprocess.run(
                 [self.vgmstream_path, wem_path, "-o", wav_path],
@@ -5488,7 +8084,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 stderr=subprocess.PIPE,
                 timeout=10,
                 startupinfo=startupinfo,
-                creationflags=CREATE_NO_WINDOW
+                creationflags=CREATE_NO_WINDOW | (BELOW_NORMAL_PRIORITY_CLASS if low_priority else 0)
             )
             return result.returncode == 0, result.stderr.decode()
         except Exception as e:
@@ -5535,6 +8131,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.deploy_action = tools_menu.addAction(self.tr("deploy_and_run"))
         self.deploy_action.setShortcut("F5")
         self.deploy_action.triggered.connect(self.deploy_and_run_game)
+
+        self.refresh_mod_files_action = tools_menu.addAction(self.tr("refresh_mod_files"))
+        self.refresh_mod_files_action.triggered.connect(self.on_refresh_mod_files)
         
         tools_menu.addSeparator()
         
@@ -5607,25 +8206,17 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not current_lang or current_lang not in self.tab_widgets:
             return
             
-        widgets = self.tab_widgets[current_lang]
-        tree = widgets["tree"]
-        items = tree.selectedItems()
-        
-        if not items or items[0].childCount() > 0:
-            return
-            
-        item = items[0]
-        entry = item.data(0, QtCore.Qt.UserRole)
+        entry = self.get_selected_entry(current_lang)
         if not entry:
             return
             
         self.delete_mod_audio(entry, current_lang)
 
-    def on_item_double_clicked(self, item, column):
-        if item.childCount() > 0: 
+    def on_item_double_clicked(self, index):
+        if not index.isValid() or index.model().is_group(index): 
             return
             
-        if column == 2:  
+        if index.column() == 2:  
             self.edit_current_subtitle()
         else:
             self.play_current()
@@ -5633,26 +8224,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     def show_context_menu(self, lang, pos):
         widgets = self.tab_widgets[lang]
         tree = widgets["tree"]
-        items = tree.selectedItems()
+        items = self.get_selected_tree_indexes(lang)
         
         if not items:
             return
             
         menu = QtWidgets.QMenu()
         
-    
-        if len(items) == 1 and items[0].childCount() == 0:
+        entry = self.get_selected_entry(lang)
+        if len(items) == 1 and entry:
             play_action = menu.addAction(self.tr("play_original"))
             play_action.triggered.connect(self.play_current)
             
         
-            entry = items[0].data(0, QtCore.Qt.UserRole)
             if entry:
-                if lang != "SFX":
-                    mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", lang, f"{entry.get('Id', '')}.wem")
-                else:
-                    mod_wem_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{entry.get('Id', '')}.wem")
-                if os.path.exists(mod_wem_path):
+                if self.mod_files.has(lang, entry.get("Id", "")):
                     play_mod_action = menu.addAction(self.tr("play_mod"))
                     play_mod_action.triggered.connect(lambda: self.play_current(play_mod=True))
 
@@ -5677,9 +8263,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
         menu.exec_(tree.viewport().mapToGlobal(pos))
 
-    def batch_export_wav(self, items, lang):
+    def batch_export_wav(self, entries, lang):
 
-        file_items = [item for item in items if item.childCount() == 0]
+        file_items = [entry for entry in entries if entry]
         
         if not file_items:
             return
@@ -5687,55 +8273,75 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         msg = QtWidgets.QMessageBox()
         msg.setWindowTitle(self.tr("batch_export"))
         msg.setText(self.tr("which_version_export"))
-        msg.addButton("Original", QtWidgets.QMessageBox.ActionRole)
+        original_btn = msg.addButton("Original", QtWidgets.QMessageBox.ActionRole)
+        mod_btn = None
+        if any(self.mod_files.has(lang, entry.get("Id", "")) for entry in file_items):
+            mod_btn = msg.addButton(self.tr("mod"), QtWidgets.QMessageBox.ActionRole)
         msg.addButton("Cancel", QtWidgets.QMessageBox.RejectRole)
         msg.exec_()
         
-        if msg.result() != 0:
+        if msg.clickedButton() == original_btn:
+            export_mod = False
+        elif mod_btn and msg.clickedButton() == mod_btn:
+            export_mod = True
+        else:
             return
             
         directory = QtWidgets.QFileDialog.getExistingDirectory(self, self.tr("select_output_directory"))
         if not directory:
             return
-            
-        progress = ProgressDialog(self, self.tr("exporting_files").format(count=len(file_items)))
-        progress.show()
-        
-        errors = []
-        
-        for i, item in enumerate(file_items):
-            entry = item.data(0, QtCore.Qt.UserRole)
-            if not entry:
-                continue
-                
+
+        jobs = []
+        for entry in file_items:
             id_ = entry.get("Id", "")
             shortname = entry.get("ShortName", "")
-            wem_path = os.path.join(self.wem_root, lang, f"{id_}.wem")
-            wav_path = os.path.join(directory, shortname)
-            
-            progress.set_progress(int((i / len(file_items)) * 100), f"Converting {shortname}...")
-            QtWidgets.QApplication.processEvents()
-            
-            if os.path.exists(wem_path):
-                ok, err = self.wem_to_wav_vgmstream(wem_path, wav_path)
-                if not ok:
-                    errors.append(f"{shortname}: {err}")
-                    progress.append_details(f"Failed: {shortname}")
+            if export_mod:
+                if not self.mod_files.has(lang, id_):
+                    continue
+                wem_path = self.mod_files.path_for(lang, id_)
+                wav_path = os.path.join(directory, f"{os.path.splitext(shortname)[0]}_MOD.wav")
             else:
-                errors.append(f"{shortname}: File not found")
-                
-        progress.close()
+                wem_path = os.path.join(self.wem_root, lang, f"{id_}.wem")
+                wav_path = os.path.join(directory, shortname)
+            jobs.append((shortname, wem_path, wav_path))
+            
+        progress = ProgressDialog(self, self.tr("exporting_files").format(count=len(jobs)))
         
-        if errors:
-            QtWidgets.QMessageBox.warning(
-                self, self.tr("export_complete"),
-                self.tr("export_results").format(
-                    successful=len(file_items) - len(errors),
-                    errors=len(errors)
+        self.wav_export_thread = WavExportThread(
+            self, jobs, self.wem_to_wav_vgmstream, self.audio_cache,
+            self.settings.data.get("export_workers", 0)
+        )
+        progress.add_cancel_button(self.wav_export_thread.stop)
+
+        def on_file_finished(done, shortname, status, message):
+            progress.set_progress(int((done / len(jobs)) * 100), f"Converted {done}/{len(jobs)}: {shortname}")
+            if status == "failed":
+                progress.append_details(f"Failed: {shortname} ({message})")
+            elif status == "skipped":
+                progress.append_details(f"Skipped (up to date): {shortname}")
+
+        def on_export_finished(results):
+            progress.close()
+            exported = results["ok"] + results["skipped"]
+            DEBUG.log(f"Batch export finished: {results['ok']} converted, {results['skipped']} up to date, "
+                      f"{results['failed']} failed, {results['cancelled']} cancelled")
+            if results["errors"]:
+                QtWidgets.QMessageBox.warning(
+                    self, self.tr("export_complete"),
+                    self.tr("export_results").format(
+                        successful=exported,
+                        errors=len(results["errors"])
+                    )
                 )
-            )
-        else:
-            self.status_bar.showMessage(f"Exported {len(file_items)} files successfully", 3000)
+            elif results["cancelled"]:
+                self.status_bar.showMessage(f"Export cancelled after {exported} of {len(jobs)} files", 3000)
+            else:
+                self.status_bar.showMessage(f"Exported {exported} files successfully", 3000)
+
+        self.wav_export_thread.fileFinished.connect(on_file_finished)
+        self.wav_export_thread.exportFinished.connect(on_export_finished)
+        progress.show()
+        self.wav_export_thread.start()
 
     def on_global_search(self, text):
         current_lang = self.get_current_language()
@@ -5830,14 +8436,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             border-bottom: 2px solid #007acc;
         }
         
-        QTreeWidget {
+        QTreeView {
             background-color: #252526;
             alternate-background-color: #2d2d30;
             border: 1px solid #3e3e42;
             selection-background-color: #094771;
         }
         
-        QTreeWidget::item:hover {
+        QTreeView::item:hover {
             background-color: #2a2d2e;
         }
         
@@ -5973,14 +8579,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             border-bottom: 2px solid #0078d4;
         }
         
-        QTreeWidget {
+        QTreeView {
             background-color: #ffffff;
             alternate-background-color: #f9f9f9;
             border: 1px solid #cccccc;
             selection-background-color: #bee6fd;
         }
         
-        QTreeWidget::item:hover {
+        QTreeView::item:hover {
             background-color: #e5f3ff;
         }
         
@@ -6367,6 +8973,12 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.wav_converter.progress_updated.connect(self.conversion_progress.setValue)
         self.wav_converter.status_updated.connect(self.update_conversion_status)
         self.wav_converter.conversion_finished.connect(self.on_conversion_finished)
+        self.wav_converter.log_updated.connect(self.append_conversion_log)
+        self.wav_converter.size_model = ConversionSizeModel(os.path.join(self.base_path, "conversion_sizes.db"))
+        self.wav_converter.result_cache = ConversionResultCache(
+            os.path.join(self.base_path, "conversion_cache"),
+            self.settings.data.get("conversion_cache_mb", 1024) * 1024 * 1024
+        )
         
         self.converter_tabs.addTab(main_tab, self.tr("wav_to_wem_converter"))
     def toggle_conversion(self):
@@ -6734,18 +9346,13 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                
       
         wem_index = {}
-        for root, dirs, files in os.walk(wems_folder):
-            folder_name = os.path.basename(root)
-            for file in files:
-                if file.endswith('.wem'):
-                    file_id = os.path.splitext(file)[0]
-                    if file_id not in wem_index:
-                        wem_index[file_id] = {}
-                        
-                    wem_index[file_id][folder_name] = {
-                        'path': os.path.join(root, file),
-                        'size': os.path.getsize(os.path.join(root, file))
-                    }
+        if "original" in self.wem_index.scanned:
+            for (source, file_id), folders in self.wem_index.by_id.items():
+                if source == "original":
+                    wem_index[file_id] = {folder: {'path': row['path'], 'size': row['size']} for folder, row in folders.items()}
+        else:
+            for path, folder_name, file_id, size, _ in WemMetadataIndex.scan_folder(wems_folder):
+                wem_index.setdefault(file_id, {})[folder_name] = {'path': path, 'size': size}
         
         
         matched_count = 0
@@ -6954,9 +9561,19 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not os.path.exists(project_path):
             os.makedirs(project_path, exist_ok=True)
             
+        if self.conversion_thread and self.conversion_thread.is_alive():
+            self.append_conversion_log("Previous conversion is still stopping, please wait")
+            QtWidgets.QMessageBox.warning(self, "Error", "Previous conversion is still stopping, please try again in a moment.")
+            return
+            
         self.set_conversion_state(True)
         
         self.wav_converter.set_adaptive_mode(self.adaptive_mode_radio.isChecked())
+        self.wav_converter.set_max_workers(self.settings.data.get("conversion_workers", 0))
+        self.wav_converter.set_batch_mode(self.settings.data.get("batch_conversion", True))
+        self.wav_converter.set_max_probes(self.settings.data.get("parallel_probes", 0))
+        self.append_conversion_log(f"Parallel conversions: {self.wav_converter.max_workers}")
+        self.append_conversion_log(f"Batched WwiseCLI runs: {self.wav_converter.batch_mode and not self.wav_converter.adaptive_mode}")
         
         temp_output = os.path.join(self.base_path, "temp_wem_output")
         os.makedirs(temp_output, exist_ok=True)
@@ -7045,7 +9662,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 self.conversion_thread.join(timeout=3.0)
                 
                 if self.conversion_thread.is_alive():
-                    self.append_conversion_log("Warning: Conversion thread did not stop gracefully")
+                    self.append_conversion_log("Warning: Conversion thread is still finishing, temp files will be cleaned up when it exits")
             
             self.set_conversion_state(False)
             self.update_conversion_status("Conversion stopped by user", "red")
@@ -7142,6 +9759,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
             try:
                 deployed_count = self.auto_deploy_converted_files_by_language(successful)
+                self.watch_mod_folders()
+                self.refresh_mod_trees()
                 
                 self.update_conversion_status(
                     f"Done! Converted: {len(successful)}, deployed: {deployed_count}", 
@@ -7204,6 +9823,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 dest_path = os.path.join(target_dir, dest_filename)
                 
                 shutil.copy2(source_path, dest_path)
+                self.mod_file_written(dest_path)
                 deployed_count += 1
                 
                 DEBUG.log(f"Deployed: {file_pair['wav_name']} -> {dest_filename} in {language}")
@@ -7233,6 +9853,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 dest_path = os.path.join(target_dir, filename)
                 
                 shutil.copy2(source_path, dest_path)
+                self.mod_file_written(dest_path)
                 copied_count += 1
                 
                 DEBUG.log(f"Deployed: {filename} to {language}")
@@ -7746,7 +10367,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.tr("name_z_a"), 
             self.tr("id_asc"), 
             self.tr("id_desc"), 
-            self.tr("recent_first")
+            self.tr("recent_first"),
+            self.tr("duration_desc"),
+            self.tr("size_desc")
         ])
         sort_combo.currentIndexChanged.connect(lambda: self.populate_tree(lang))
         
@@ -7763,8 +10386,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         
         splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
         
-        tree = QtWidgets.QTreeWidget()
-        tree.setHeaderLabels([self.tr("name"), self.tr("id"), self.tr("subtitle"), self.tr("status")])
+        tree_model = AudioTreeModel([self.tr("name"), self.tr("id"), self.tr("subtitle"), self.tr("status")], self)
+        tree = QtWidgets.QTreeView()
+        tree.setModel(tree_model)
+        tree.setUniformRowHeights(True)
         tree.setColumnWidth(0, 350)
         tree.setColumnWidth(1, 100)
         tree.setColumnWidth(2, 400)
@@ -7772,8 +10397,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         tree.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         tree.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         tree.customContextMenuRequested.connect(lambda pos: self.show_context_menu(lang, pos))
-        tree.itemSelectionChanged.connect(lambda: self.on_selection_changed(lang))
-        tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        tree.selectionModel().selectionChanged.connect(lambda *_: self.on_selection_changed(lang))
+        tree.doubleClicked.connect(self.on_item_double_clicked)
         
         splitter.addWidget(tree)
         
@@ -7994,6 +10619,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             "filter_combo": filter_combo,
             "sort_combo": sort_combo,
             "tree": tree,
+            "tree_model": tree_model,
             "stats_label": stats_label,
             "subtitle_text": subtitle_text,
             "original_subtitle_label": original_subtitle_label,
@@ -8014,15 +10640,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.tabs.addTab(tab, f"{lang} ({len(self.entries_by_lang.get(lang, []))})")
     def get_wem_audio_info_with_markers(self, wem_path):
         """Get detailed audio information including markers from WEM file"""
-        info = self.get_wem_audio_info(wem_path)
+        info = self.audio_info_cache.get(wem_path)
+        if info is not None:
+            return info
+
+        analyzer = WEMAnalyzer(wem_path)
+        if not analyzer.analyze():
+            analyzer = None
+        info = self.get_wem_audio_info(wem_path, analyzer)
         
         if info is None:
             return None
         
 
         try:
-            analyzer = WEMAnalyzer(wem_path)
-            if analyzer.analyze():
+            if analyzer:
                 info['markers'] = analyzer.get_markers_info()
        
                 if analyzer.sample_rate > 0:
@@ -8033,6 +10665,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             DEBUG.log(f"Error analyzing markers: {e}", "ERROR")
             info['markers'] = []
         
+        self.audio_info_cache.put(wem_path, info)
         return info
 
     def format_markers_for_display(self, markers):
@@ -8067,8 +10700,20 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             formatted_markers.append(display_text)
         
         return formatted_markers
-    def get_wem_audio_info(self, wem_path):
-        """Get detailed audio information from WEM file"""
+    def get_wem_audio_info(self, wem_path, analyzer=None):
+        """Get detailed audio information from WEM file, reading the RIFF header in-process when possible"""
+        if analyzer is None:
+            analyzer = WEMAnalyzer(wem_path)
+            if not analyzer.analyze():
+                analyzer = None
+        info = analyzer.get_audio_info() if analyzer else None
+        if info:
+            return info
+
+        return self.get_wem_audio_info_vgmstream(wem_path)
+
+    def get_wem_audio_info_vgmstream(self, wem_path):
+        """Get audio information through vgmstream-cli for formats the header parser does not cover"""
         try:
             result = subprocess.run(
                 [self.vgmstream_path, "-m", wem_path],
@@ -8863,6 +11508,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 self.save_subtitles_to_file()
                 
         self.stop_audio()
+        self.details_generation += 1
+        self.details_executor.shutdown(wait=False, cancel_futures=True)
+        self.audio_prefetcher.shutdown()
+        if self.wem_indexer and self.wem_indexer.isRunning():
+            self.wem_indexer.stop()
+            self.wem_indexer.wait()
+        self.wem_index.close()
+        self.locres_manager.cache.close()
+        if hasattr(self, 'wav_converter') and self.wav_converter.size_model:
+            self.wav_converter.size_model.close()
         event.accept()
 class EasterEggLoader(QObject):
     config_loaded = pyqtSignal(dict)    